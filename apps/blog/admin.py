@@ -3,11 +3,16 @@ from .models import Post, Category, Heading, PostAnalytics
 # Register your models here.
 
 class HeadingInline(admin.TabularInline):
+    """Solo lectura: los encabezados se extraen del contenido al guardar el post."""
     model = Heading
-    extra = 1
+    extra = 0
     fields = ('title', 'level', 'order', 'slug')
-    prepopulated_fields = {'slug' : ('title',)}
+    readonly_fields = fields
+    can_delete = False
     ordering = ('order',)
+
+    def has_add_permission(self, request, obj=None):
+        return False
 class PostAnalyticsInline(admin.StackedInline):
     model = PostAnalytics
     readonly_fields = ('impressions', 'clicks')
@@ -0,0 +1,227 @@
+import atexit
+import ipaddress
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .hll import HyperLogLog
+from .models import Post, PostAnalytics, PostView, PostUniqueVisitors, PostHourlyStats, PostDailyStats
+from .rollups import bucket_starts
+from .trending import event_score, locked_growth
+from .utils import TTLSet, bulk_increment
+
+
+class WriteBehindBuffer:
+    """
+    Buffer en memoria que agrupa escrituras y las vuelca a la base de datos en lote.
+
+    Las peticiones solo añaden datos al buffer; un hilo en segundo plano lo vacía
+    cada `interval` segundos o en cuanto se alcanzan `max_size` entradas. Si el
+    proceso cae se pierde como mucho una ventana de volcado.
+    """
+    def __init__(self, interval=None, max_size=None):
+        self.interval = interval if interval is not None else getattr(settings, "ANALYTICS_FLUSH_INTERVAL", 10)
+        self.max_size = max_size if max_size is not None else getattr(settings, "ANALYTICS_FLUSH_SIZE", 500)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    # Las subclases implementan cómo se acumulan y cómo se escriben los datos.
+    def _size(self):
+        raise NotImplementedError
+
+    def _drain(self):
+        """Extrae el contenido pendiente del buffer (se llama con el lock adquirido)."""
+        raise NotImplementedError
+
+    def _write(self, batch):
+        """Persiste en la base de datos un lote extraído con `_drain`."""
+        raise NotImplementedError
+
+    def _added(self):
+        """Se llama tras cada inserción (con el lock adquirido)."""
+        if self.interval <= 0:
+            return
+        if self._thread is None:
+            self._start()
+        if self._size() >= self.max_size:
+            self._wake.set()
+
+    def _start(self):
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print("ERROR VOLCANDO ANALÍTICAS:", str(e))
+            finally:
+                # El hilo tiene su propia conexión; la cerramos para no dejarla colgada.
+                connections.close_all()
+
+    def flush(self):
+        """Vuelca el buffer a la base de datos. Devuelve el número de entradas escritas."""
+        with self._lock:
+            if not self._size():
+                return 0
+            batch = self._drain()
+        self._write(batch)
+        return len(batch)
+
+
+class CounterBuffer(WriteBehindBuffer):
+    """
+    Acumula incrementos de `impressions` y `clicks` por slug de post.
+
+    Cada volcado resuelve los slugs en una sola consulta y suma los incrementos
+    (y su puntuación de tendencia) a `PostAnalytics` y a los rollups de la hora y el día actuales con
+    `bulk_increment`, sin leer ni bloquear fila a fila.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._counts = defaultdict(lambda: [0, 0])
+
+    def add(self, slugs, impressions=0, clicks=0):
+        """Suma `impressions` y `clicks` a cada uno de los posts indicados."""
+        with self._lock:
+            for slug in slugs:
+                counts = self._counts[slug]
+                counts[0] += impressions
+                counts[1] += clicks
+            self._added()
+        if self.interval <= 0:
+            self.flush()
+
+    def _size(self):
+        return len(self._counts)
+
+    def _drain(self):
+        counts, self._counts = self._counts, defaultdict(lambda: [0, 0])
+        return counts
+
+    def _write(self, batch):
+        # Los slugs desconocidos (o de posts borrados mientras esperaban) se descartan.
+        post_ids = dict(Post.postobjects.filter(slug__in=list(batch)).values_list("slug", "id"))
+        rows = [(post_ids[slug], *counts) for slug, counts in batch.items() if slug in post_ids]
+        if not rows:
+            return
+        now = timezone.now()
+        hour, day = bucket_starts(now)
+        with transaction.atomic(using=router.db_for_write(PostAnalytics)):
+            growth = locked_growth(now)
+            bulk_increment(
+                PostAnalytics, ["post"], ["impressions", "clicks", "trending_score"],
+                [(post_id, impressions, clicks, growth * event_score(impressions, clicks)) for post_id, impressions, clicks in rows],
+            )
+            # Los contadores ya llegan agregados, así que se suman directamente a los rollups.
+            for model, start in ((PostHourlyStats, hour), (PostDailyStats, day)):
+                bulk_increment(
+                    model, ["post", "start"], ["views", "impressions", "clicks"],
+                    [(post_id, start, 0, impressions, clicks) for post_id, impressions, clicks in rows],
+                )
+
+
+class ViewBuffer(WriteBehindBuffer):
+    """
+    Acumula visitas (`PostView`) pendientes de guardar como tuplas `(slug, ip, día)`.
+
+    Las visitas repetidas de la misma IP al mismo post dentro de la ventana
+    `ANALYTICS_VIEW_DEDUPE_WINDOW` se descartan en memoria antes de encolarse.
+    Cada volcado resuelve los slugs en una consulta y crea todas las filas con
+    `bulk_create` en lotes de `max_size` y actualiza en la misma transacción los
+    sketches de visitantes únicos (`PostUniqueVisitors`) y la puntuación de tendencia.
+    El día de cada visita se fija al recibirla, no al volcarla, para que las que
+    llegan justo antes de medianoche cuenten en su día.
+    """
+    def __init__(self, *args, dedupe_window=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if dedupe_window is None:
+            dedupe_window = getattr(settings, "ANALYTICS_VIEW_DEDUPE_WINDOW", 1800)
+        self._seen = TTLSet(dedupe_window, max_size=getattr(settings, "ANALYTICS_VIEW_DEDUPE_MAX_KEYS", 100_000))
+        self._views = []
+
+    def add(self, slugs, ip_address):
+        """Registra una visita de `ip_address` a cada post indicado, salvo si es repetida."""
+        try:
+            ipaddress.ip_address(ip_address)
+        except ValueError:
+            return  # Una IP inválida haría fallar el `bulk_create` de todo el lote.
+        fresh = [slug for slug in slugs if self._seen.add((slug, ip_address))]
+        if not fresh:
+            return
+        day = timezone.localdate()
+        with self._lock:
+            self._views.extend((slug, ip_address, day) for slug in fresh)
+            self._added()
+        if self.interval <= 0:
+            self.flush()
+
+    def _size(self):
+        return len(self._views)
+
+    def _drain(self):
+        views, self._views = self._views, []
+        return views
+
+    def _write(self, batch):
+        post_ids = dict(Post.postobjects.filter(slug__in={slug for slug, _, _ in batch}).values_list("slug", "id"))
+        batch = [(post_ids[slug], ip, day) for slug, ip, day in batch if slug in post_ids]
+        if not batch:
+            return
+        views = [PostView(post_id=post_id, ip_address=ip) for post_id, ip, _ in batch]
+        views_by_post = Counter(view.post_id for view in views)
+        with transaction.atomic(using=router.db_for_write(PostAnalytics)):
+            PostView.objects.bulk_create(views, batch_size=self.max_size)
+            self._update_sketches(batch)
+            growth = locked_growth()
+            bulk_increment(
+                PostAnalytics, ["post"], ["impressions", "clicks", "trending_score"],
+                [(post_id, 0, 0, growth * event_score(views=total)) for post_id, total in views_by_post.items()],
+            )
+
+    def _update_sketches(self, views):
+        """Añade las IPs de las visitas `(post_id, ip, día)` a los sketches HyperLogLog de cada post y día."""
+        ips_by_key = defaultdict(set)
+        for post_id, ip, day in views:
+            ips_by_key[post_id, day].add(ip)
+        existing = {}
+        for day in {day for _, day in ips_by_key}:
+            post_ids = [post_id for post_id, key_day in ips_by_key if key_day == day]
+            for row in PostUniqueVisitors.objects.select_for_update().filter(day=day, post_id__in=post_ids):
+                existing[row.post_id, row.day] = row
+        sketches = []
+        for (post_id, day), ips in ips_by_key.items():
+            row = existing.get((post_id, day))
+            hll = HyperLogLog.from_bytes(row.sketch) if row else HyperLogLog()
+            for ip in ips:
+                hll.add(ip)
+            sketches.append(PostUniqueVisitors(post_id=post_id, day=day, sketch=hll.to_bytes()))
+        PostUniqueVisitors.objects.bulk_create(
+            sketches,
+            update_conflicts=True,
+            unique_fields=["post", "day"],
+            update_fields=["sketch"],
+        )
+
+
+counter_buffer = CounterBuffer()
+view_buffer = ViewBuffer()
+
+
+def _flush_at_exit():
+    """Al apagar el proceso de forma ordenada intentamos no perder la última ventana."""
+    try:
+        counter_buffer.flush()
+        view_buffer.flush()
+    except Exception as e:
+        print("ERROR VOLCANDO ANALÍTICAS:", str(e))
+
+
+atexit.register(_flush_at_exit)
@@ -0,0 +1,91 @@
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.feedgenerator import rfc2822_date, rfc3339_date
+
+from .models import Post
+
+FEED_TITLE = "Blog"
+FEED_DESCRIPTION = "Últimos artículos publicados en el blog."
+
+# Tamaño de los lotes al recorrer los posts con `.iterator()`.
+CHUNK_SIZE = 200
+
+
+def post_url(slug):
+    """URL pública (en el frontend) de un post."""
+    return f"{settings.SITE_URL.rstrip('/')}/blog/{slug}/"
+
+
+def feed_posts(using=None):
+    """Últimos posts publicados con solo las columnas que salen en los feeds."""
+    return (
+        Post.postobjects.using(using).select_related("category")
+        .only("title", "slug", "description", "excerpt", "created_at", "update_at", "category__name")
+        .order_by("-created_at")[:settings.BLOG_FEED_LIMIT]
+    )
+
+
+def feed_updated(using=None):
+    """Fecha de la última modificación de un post publicado (o ahora, si no hay ninguno)."""
+    return Post.postobjects.using(using).aggregate(last=Max("update_at"))["last"] or timezone.now()
+
+
+def rss_chunks(feed_url, using=None):
+    """
+    Feed RSS 2.0 del blog, trozo a trozo, leído de la base `using`.
+
+    Retorna:
+        generator: Fragmentos de XML (`str`), uno por post.
+    """
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+    yield (
+        f"<title>{escape(FEED_TITLE)}</title>"
+        f"<link>{escape(settings.SITE_URL.rstrip('/'))}/blog/</link>"
+        f"<description>{escape(FEED_DESCRIPTION)}</description>"
+        f'<atom:link href="{escape(feed_url)}" rel="self"/>'
+        f"<lastBuildDate>{rfc2822_date(feed_updated(using))}</lastBuildDate>\n"
+    )
+    for post in feed_posts(using).iterator(chunk_size=CHUNK_SIZE):
+        url = escape(post_url(post.slug))
+        yield (
+            f"<item><title>{escape(post.title)}</title><link>{url}</link>"
+            f'<guid isPermaLink="true">{url}</guid>'
+            f"<description>{escape(post.description or post.excerpt)}</description>"
+            f"<category>{escape(post.category.name)}</category>"
+            f"<pubDate>{rfc2822_date(post.created_at)}</pubDate></item>\n"
+        )
+    yield "</channel></rss>\n"
+
+
+def atom_chunks(feed_url, using=None):
+    """
+    Feed Atom 1.0 del blog, trozo a trozo, leído de la base `using`.
+
+    Retorna:
+        generator: Fragmentos de XML (`str`), uno por post.
+    """
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<feed xmlns="http://www.w3.org/2005/Atom">'
+    yield (
+        f"<title>{escape(FEED_TITLE)}</title>"
+        f"<subtitle>{escape(FEED_DESCRIPTION)}</subtitle>"
+        f'<link href="{escape(settings.SITE_URL.rstrip("/"))}/blog/" rel="alternate"/>'
+        f'<link href="{escape(feed_url)}" rel="self"/>'
+        f"<id>{escape(feed_url)}</id>"
+        f"<updated>{rfc3339_date(feed_updated(using))}</updated>\n"
+    )
+    for post in feed_posts(using).iterator(chunk_size=CHUNK_SIZE):
+        url = escape(post_url(post.slug))
+        yield (
+            f"<entry><title>{escape(post.title)}</title>"
+            f'<link href="{url}" rel="alternate"/><id>{url}</id>'
+            f"<published>{rfc3339_date(post.created_at)}</published>"
+            f"<updated>{rfc3339_date(post.update_at)}</updated>"
+            f"<summary>{escape(post.description or post.excerpt)}</summary>"
+            f'<category term="{escape(post.category.name)}"/></entry>\n'
+        )
+    yield "</feed>\n"
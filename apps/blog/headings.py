@@ -0,0 +1,103 @@
+import re
+from html.parser import HTMLParser
+
+from django.utils.text import slugify
+
+HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+
+# `Heading.slug` admite 255 caracteres; se deja margen para el sufijo de desempate.
+MAX_ID_LENGTH = 255
+MAX_ANCHOR_LENGTH = 200
+
+# Atributo `id` dentro de una etiqueta de apertura, con o sin valor.
+ID_ATTRIBUTE = re.compile(r"""\s+id(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'>]*))?(?=[\s/>])""", re.IGNORECASE)
+
+
+class HeadingParser(HTMLParser):
+    """
+    Parser por eventos (sin construir el árbol DOM) que recoge los `<h1>`…`<h6>`.
+
+    De cada encabezado guarda el nivel, el texto, el `id` que ya tuviera y la
+    posición y el texto de su etiqueta de apertura para poder ponerle el `id` después.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.headings = []
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HEADING_LEVELS and self._current is None:
+            attrs = dict(attrs)
+            self._current = {
+                "tag": tag,
+                "level": HEADING_LEVELS[tag],
+                "id": attrs.get("id"),
+                "has_id": "id" in attrs,
+                "position": self.getpos(),
+                "starttag": self.get_starttag_text(),
+                "text": [],
+            }
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current["text"].append(data)
+
+    def handle_endtag(self, tag):
+        if self._current is not None and tag == self._current["tag"]:
+            self._current["title"] = " ".join("".join(self._current.pop("text")).split())
+            if self._current["title"]:
+                self.headings.append(self._current)
+            self._current = None
+
+
+def unique_anchor(title, used):
+    """Ancla a partir del título, con sufijo `-2`, `-3`… si ya está usada en el post."""
+    base = slugify(title)[:MAX_ANCHOR_LENGTH] or "seccion"
+    anchor, suffix = base, 2
+    while anchor in used:
+        anchor, suffix = f"{base}-{suffix}", suffix + 1
+    used.add(anchor)
+    return anchor
+
+
+def anchor_headings(html):
+    """
+    Extrae los encabezados del HTML y asegura que todos tengan `id`.
+
+    Los `id` que ya existen se respetan, así que un ancla no cambia aunque luego
+    se edite el título; solo los encabezados nuevos reciben uno calculado a
+    partir de su texto. Un `id` vacío se sustituye por uno calculado y uno de más
+    de `MAX_ID_LENGTH` caracteres (no cabría en `Heading.slug`) se recorta.
+
+    Retorna:
+        tuple: `(html, headings)`, con el HTML con los `id` añadidos y una lista
+        de `{"title", "slug", "level", "order"}` en orden de aparición.
+    """
+    parser = HeadingParser()
+    parser.feed(html or "")
+    parser.close()
+    used = {heading["id"] for heading in parser.headings if heading["id"]}
+    # Posición absoluta de cada línea, para traducir el `(línea, columna)` del parser.
+    line_starts = [0]
+    for line in (html or "").split("\n")[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    edits = []
+    headings = []
+    for heading in parser.headings:
+        anchor = heading["id"]
+        if not anchor or len(anchor) > MAX_ID_LENGTH:
+            anchor = unique_anchor(anchor or heading["title"], used)
+            starttag = heading["starttag"]
+            if heading["has_id"]:
+                new_starttag = ID_ATTRIBUTE.sub(f' id="{anchor}"', starttag, count=1)
+            else:
+                end = 1 + len(heading["tag"])
+                new_starttag = f'{starttag[:end]} id="{anchor}"{starttag[end:]}'
+            line, column = heading["position"]
+            edits.append((line_starts[line - 1] + column, len(starttag), new_starttag))
+        elif any(previous["slug"] == anchor for previous in headings):
+            continue  # `id` repetido a mano en el HTML: solo el primero puede enlazarse.
+        headings.append({"title": heading["title"][:255], "slug": anchor, "level": heading["level"], "order": len(headings) + 1})
+    for offset, length, starttag in reversed(edits):
+        html = f"{html[:offset]}{starttag}{html[offset + length:]}"
+    return html, headings
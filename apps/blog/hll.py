@@ -0,0 +1,63 @@
+import hashlib
+import math
+
+
+class HyperLogLog:
+    """
+    Estimador probabilístico de elementos distintos (HyperLogLog).
+
+    Con `precision=12` usa 4096 registros de un byte (4 KB) y tiene un error
+    típico de ~1,6 %, sea cual sea el número de elementos añadidos. Dos sketches
+    con la misma precisión se combinan tomando el máximo de cada registro, así que
+    se pueden guardar por día y sumar cualquier rango de fechas.
+    """
+    def __init__(self, precision=12, registers=None):
+        self.precision = precision
+        self.size = 1 << precision
+        if registers is None:
+            self.registers = bytearray(self.size)
+        else:
+            if len(registers) != self.size:
+                raise ValueError("El tamaño de los registros no coincide con la precisión.")
+            self.registers = bytearray(registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstruye un sketch a partir de lo guardado con `to_bytes`."""
+        data = bytes(data)
+        return cls(precision=data[0], registers=data[1:])
+
+    def to_bytes(self):
+        """Serializa el sketch: un byte con la precisión seguido de los registros."""
+        return bytes([self.precision]) + bytes(self.registers)
+
+    def add(self, value):
+        """Añade un elemento (se usa su representación en texto)."""
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        x = int.from_bytes(digest, "big")
+        index = x >> (64 - self.precision)
+        rest = x & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Combina `other` en este sketch (unión de conjuntos)."""
+        if other.precision != self.precision:
+            raise ValueError("Solo se pueden combinar sketches con la misma precisión.")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        """Devuelve el número estimado de elementos distintos."""
+        m = self.size
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # Para cardinalidades pequeñas el conteo lineal es mucho más preciso.
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
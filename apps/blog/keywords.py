@@ -0,0 +1,103 @@
+import re
+
+from django.db import router, transaction
+from django.db.models import Count, Q
+from django.utils.text import slugify
+
+from .models import Keyword, PostKeyword
+
+# `Post.keywords` es texto libre: se separa por comas, puntos y coma o saltos de línea.
+KEYWORD_SEPARATORS = re.compile(r"[,;\n]+")
+
+TAG_MATCH_MODES = ("all", "any")
+
+
+def normalize_keyword(name):
+    """Forma normalizada de una palabra clave: minúsculas, sin acentos y con guiones."""
+    return slugify(name)[:Keyword._meta.get_field("slug").max_length]
+
+
+def parse_keywords(text):
+    """
+    Separa el texto de `Post.keywords` en palabras clave.
+
+    Retorna:
+        dict: `{slug: nombre}` sin repetidos (se queda con el primer nombre de cada slug).
+    """
+    keywords = {}
+    for name in KEYWORD_SEPARATORS.split(text or ""):
+        name = " ".join(name.split())[:Keyword._meta.get_field("name").max_length]
+        slug = normalize_keyword(name)
+        if slug and slug not in keywords:
+            keywords[slug] = name
+    return keywords
+
+
+def sync_post_keywords(post):
+    """
+    Sincroniza las filas de `PostKeyword` de un post con su campo `keywords`.
+
+    Crea las palabras clave que falten, borra las relaciones que ya no están y
+    añade las nuevas, todo con operaciones en bloque.
+    """
+    sync_posts_keywords([post])
+
+
+def sync_posts_keywords(posts):
+    """Como `sync_post_keywords`, pero para muchos posts con las mismas pocas consultas."""
+    wanted = {post.pk: parse_keywords(post.keywords) for post in posts}
+    names = {}
+    for keywords in wanted.values():
+        for slug, name in keywords.items():
+            names.setdefault(slug, name)
+    with transaction.atomic(using=router.db_for_write(PostKeyword)):
+        Keyword.objects.bulk_create(
+            [Keyword(slug=slug, name=name) for slug, name in names.items()],
+            ignore_conflicts=True,
+        )
+        keyword_ids = dict(Keyword.objects.filter(slug__in=names).values_list("slug", "id"))
+        pairs = {(post_id, keyword_ids[slug]) for post_id, keywords in wanted.items() for slug in keywords}
+        current = PostKeyword.objects.filter(post_id__in=wanted).values_list("id", "post_id", "keyword_id")
+        PostKeyword.objects.filter(
+            pk__in=[row_id for row_id, post_id, keyword_id in current if (post_id, keyword_id) not in pairs]
+        ).delete()
+        PostKeyword.objects.bulk_create(
+            [PostKeyword(post_id=post_id, keyword_id=keyword_id) for post_id, keyword_id in pairs],
+            ignore_conflicts=True,
+        )
+
+
+def parse_tags(values):
+    """Normaliza los `?tag=` de la petición, sin repetidos y conservando el orden."""
+    return list(dict.fromkeys(slug for slug in map(normalize_keyword, values) if slug))
+
+
+def filter_by_tags(queryset, tags, match="all"):
+    """
+    Filtra `queryset` (de posts) por etiquetas.
+
+    Con `match="all"` el post debe tener todas las etiquetas y con `"any"` al
+    menos una. El filtro es un `IN (subconsulta)` sobre `PostKeyword` que usa el
+    índice `(keyword, post)`, sin `DISTINCT` sobre los posts.
+    """
+    matches = PostKeyword.objects.filter(keyword__slug__in=tags)
+    if match == "all":
+        matches = matches.values("post_id").annotate(total=Count("keyword_id")).filter(total=len(tags))
+    return queryset.filter(pk__in=matches.values("post_id"))
+
+
+def tag_counts(tags):
+    """
+    Número de posts publicados con cada etiqueta, en una sola consulta.
+
+    Retorna:
+        dict: `{slug: total}` con todas las etiquetas pedidas (0 si no existen).
+    """
+    counts = dict.fromkeys(tags, 0)
+    rows = (
+        Keyword.objects.filter(slug__in=tags)
+        .annotate(total=Count("post_keywords", filter=Q(post_keywords__post__status="published")))
+        .values_list("slug", "total")
+    )
+    counts.update(rows)
+    return counts
@@ -0,0 +1,56 @@
+import datetime
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.blog.models import AnalyticsWatermark
+from apps.blog.partitions import add_months, archive_partition, drain_default_partition, expired_partitions, is_partitioned
+from apps.blog.rollups import VIEWS_WATERMARK
+
+
+class Command(BaseCommand):
+    help = (
+        "Archiva las particiones caducadas de PostView en NDJSON comprimido "
+        "y después las separa y las borra de la tabla."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention", type=int, default=settings.ANALYTICS_RETENTION_MONTHS,
+            help="Meses completos que se conservan en la tabla.",
+        )
+        parser.add_argument("--compression", choices=["gzip", "zstd"], default="gzip")
+        parser.add_argument("--output", default=settings.ANALYTICS_ARCHIVE_DIR, help="Directorio de los ficheros archivados.")
+        parser.add_argument("--dry-run", action="store_true", help="Solo lista las particiones que se archivarían.")
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write(self.style.WARNING("La base de datos no es PostgreSQL: PostView no está particionada."))
+            return
+        if options["compression"] == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise CommandError("Para usar zstd hay que instalar el paquete `zstandard`.")
+
+        # Las filas que cayeron en la partición DEFAULT pasan antes a su mes para archivarse también.
+        if not options["dry_run"]:
+            for name in drain_default_partition():
+                self.stdout.write(f"{name}: creada con las filas de la partición DEFAULT.")
+
+        watermark = AnalyticsWatermark.objects.filter(name=VIEWS_WATERMARK).values_list("value", flat=True).first()
+        os.makedirs(options["output"], exist_ok=True)
+        extension = "gz" if options["compression"] == "gzip" else "zst"
+        for month, name in expired_partitions(options["retention"]):
+            # No se borra nada que el rollup todavía no haya agregado.
+            month_end = datetime.datetime.combine(add_months(month, 1), datetime.time.min, tzinfo=datetime.timezone.utc)
+            if watermark is None or watermark < month_end:
+                self.stdout.write(self.style.WARNING(f"{name}: pendiente de agregar (ejecuta rollup_analytics), se omite."))
+                continue
+            path = os.path.join(options["output"], f"{name}.ndjson.{extension}")
+            if options["dry_run"]:
+                self.stdout.write(f"{name} -> {path}")
+                continue
+            rows = archive_partition(name, path, options["compression"])
+            self.stdout.write(self.style.SUCCESS(f"{name}: {rows} filas archivadas en {path}"))
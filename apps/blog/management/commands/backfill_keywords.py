@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.keywords import sync_post_keywords
+from apps.blog.models import Post
+
+
+class Command(BaseCommand):
+    help = "Rellena la tabla normalizada de palabras clave a partir de Post.keywords de los posts existentes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Posts leídos por consulta.")
+
+    def handle(self, *args, **options):
+        total = 0
+        for post in Post.objects.only("id", "keywords").iterator(chunk_size=options["chunk_size"]):
+            sync_post_keywords(post)
+            total += 1
+        self.stdout.write(self.style.SUCCESS(f"Palabras clave sincronizadas en {total} posts."))
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.blog.partitions import ensure_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = "Crea las particiones mensuales de PostView del mes actual y los siguientes (pensado para cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead", type=int, default=settings.ANALYTICS_PARTITION_MONTHS_AHEAD,
+            help="Número de meses futuros para los que crear partición.",
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write(self.style.WARNING("La base de datos no es PostgreSQL: PostView no está particionada."))
+            return
+        for name in ensure_partitions(options["ahead"]):
+            self.stdout.write(f"Partición lista: {name}")
@@ -0,0 +1,25 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.blog.transfer import export_lines
+
+
+class Command(BaseCommand):
+    help = "Exporta las categorías y los posts del blog a JSONL (una línea por fila), para llevarlos a otro entorno con import_blog."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", nargs="?", default="-", help="Fichero de salida (`-` para la salida estándar).")
+        parser.add_argument("--chunk-size", type=int, default=500, help="Filas leídas por consulta.")
+
+    def handle(self, *args, **options):
+        lines = export_lines(options["chunk_size"])
+        if options["output"] == "-":
+            sys.stdout.writelines(lines)
+            return
+        total = 0
+        with open(options["output"], "w", encoding="utf-8") as output:
+            for line in lines:
+                output.write(line)
+                total += 1
+        self.stdout.write(self.style.SUCCESS(f"{total} filas exportadas a {options['output']}."))
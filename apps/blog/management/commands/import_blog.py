@@ -0,0 +1,39 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.blog.models import Post
+from apps.blog.post_list import refresh_post_list
+from apps.blog.related import rebuild_related_posts
+from apps.blog.snapshots import refresh_post_snapshots
+from apps.blog.transfer import import_lines
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa (inserta o actualiza) categorías, posts y encabezados desde un JSONL de export_blog "
+        "en lotes, y después recalcula los posts relacionados, los snapshots y el listado."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", nargs="?", default="-", help="Fichero JSONL (`-` para la entrada estándar).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Filas por INSERT.")
+
+    def handle(self, *args, **options):
+        source = sys.stdin if options["input"] == "-" else open(options["input"], encoding="utf-8")
+        try:
+            categories, post_ids = import_lines(source, options["batch_size"])
+        except ValueError as error:
+            raise CommandError(str(error))
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        self.stdout.write(f"{categories} categorías y {len(post_ids)} posts importados.")
+        # Lo que las señales hacen post a post, una sola vez para todo el blog.
+        relations = rebuild_related_posts()
+        published = list(Post.postobjects.values_list("id", flat=True))
+        snapshots = 0
+        for start in range(0, len(published), options["batch_size"]):
+            snapshots += refresh_post_snapshots(published[start:start + options["batch_size"]])
+        refresh_post_list()
+        self.stdout.write(self.style.SUCCESS(f"{relations} relaciones y {snapshots} snapshots recalculados."))
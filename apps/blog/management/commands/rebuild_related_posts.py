@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.related import rebuild_related_posts
+
+
+class Command(BaseCommand):
+    help = "Recalcula desde cero la tabla de posts relacionados (TF-IDF) de todos los posts publicados."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=None, help="Vecinos por post (por defecto RELATED_POSTS_COUNT).")
+
+    def handle(self, *args, **options):
+        total = rebuild_related_posts(options["count"])
+        self.stdout.write(self.style.SUCCESS(f"{total} relaciones guardadas."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.post_list import is_materialized, refresh_post_list
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresca la vista materializada del listado de posts (pensado para cron: "
+        "los cambios de posts y categorías ya la refrescan al guardarse, pero los "
+        "totales de visitas solo se actualizan así)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--blocking", action="store_true",
+            help="Refresca sin CONCURRENTLY (más rápido, pero bloquea las lecturas).",
+        )
+
+    def handle(self, *args, **options):
+        if not is_materialized():
+            self.stdout.write(self.style.WARNING("Sin vista materializada: el listado se calcula al vuelo."))
+            return
+        refresh_post_list(concurrently=not options["blocking"])
+        self.stdout.write(self.style.SUCCESS("Vista del listado de posts refrescada."))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.models import Post
+from apps.blog.rendering import render_content
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula el contenido derivado (HTML minificado, extracto, palabras y tiempo de lectura) "
+        "de los posts existentes con el rendering.py actual."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500, help="Posts leídos y guardados por lote.")
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        fields = list(render_content(""))
+        total = 0
+        batch = []
+        # `bulk_update` no dispara las señales de `Post.save`: solo cambian columnas derivadas.
+        for post in Post.objects.only("id", "content").iterator(chunk_size=chunk_size):
+            for field, value in render_content(post.content).items():
+                setattr(post, field, value)
+            batch.append(post)
+            if len(batch) >= chunk_size:
+                total += Post.objects.bulk_update(batch, fields)
+                batch = []
+        total += Post.objects.bulk_update(batch, fields)
+        self.stdout.write(self.style.SUCCESS(f"Contenido derivado recalculado en {total} posts."))
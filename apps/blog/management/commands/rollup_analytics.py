@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.blog.rollups import rollup_views
+
+
+class Command(BaseCommand):
+    help = "Agrega las visitas nuevas de PostView en los rollups horarios y diarios (pensado para cron)."
+
+    def handle(self, *args, **options):
+        total = rollup_views()
+        self.stdout.write(self.style.SUCCESS(f"{total} visitas agregadas."))
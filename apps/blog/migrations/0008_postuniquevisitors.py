@@ -0,0 +1,27 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_post_meta_description_post_og_description_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostUniqueVisitors',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('sketch', models.BinaryField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='unique_visitors', to='blog.post')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='postuniquevisitors',
+            constraint=models.UniqueConstraint(fields=('post', 'day'), name='unique_post_day_sketch'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_postuniquevisitors'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('value', models.DateTimeField()),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='postview',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.CreateModel(
+            name='PostHourlyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('impressions', models.PositiveIntegerField(default=0)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hourly_stats', to='blog.post')),
+            ],
+            options={
+                'ordering': ['start'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PostDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('impressions', models.PositiveIntegerField(default=0)),
+                ('clicks', models.PositiveIntegerField(default=0)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='blog.post')),
+            ],
+            options={
+                'ordering': ['start'],
+                'abstract': False,
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='posthourlystats',
+            constraint=models.UniqueConstraint(fields=('post', 'start'), name='unique_post_hourly_stats'),
+        ),
+        migrations.AddConstraint(
+            model_name='postdailystats',
+            constraint=models.UniqueConstraint(fields=('post', 'start'), name='unique_post_daily_stats'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_stats_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postanalytics',
+            name='trending_score',
+            field=models.FloatField(db_index=True, default=0),
+        ),
+    ]
@@ -0,0 +1,96 @@
+import datetime
+
+from django.db import migrations
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return datetime.date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_postview(apps, schema_editor):
+    """
+    Convierte `blog_postview` en una tabla particionada por meses sobre `timestamp`.
+
+    Solo en PostgreSQL; en otros motores la tabla se queda como está. La clave
+    primaria pasa a ser `(id, timestamp)` porque PostgreSQL exige que incluya la
+    clave de partición. Se crea además una partición `DEFAULT` para que ninguna
+    inserción falle si el trabajo de creación de particiones no se ha ejecutado.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('SELECT MIN("timestamp") FROM blog_postview')
+        oldest = cursor.fetchone()[0]
+    today = datetime.date.today()
+    first = (oldest.date() if oldest else today).replace(day=1)
+    months = []
+    month = first
+    while month <= add_months(today.replace(day=1), 3):
+        months.append(month)
+        month = add_months(month, 1)
+
+    schema_editor.execute("ALTER TABLE blog_postview RENAME TO blog_postview_legacy")
+    schema_editor.execute(
+        "CREATE TABLE blog_postview ("
+        "id uuid NOT NULL, "
+        "post_id uuid NOT NULL REFERENCES blog_post (id) DEFERRABLE INITIALLY DEFERRED, "
+        "ip_address inet NOT NULL, "
+        "\"timestamp\" timestamp with time zone NOT NULL, "
+        "CONSTRAINT blog_postview_partitioned_pkey PRIMARY KEY (id, \"timestamp\")"
+        ") PARTITION BY RANGE (\"timestamp\")"
+    )
+    for month in months:
+        schema_editor.execute(
+            f"CREATE TABLE blog_postview_p{month:%Y%m} PARTITION OF blog_postview "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') TO ('{add_months(month, 1):%Y-%m-%d} 00:00:00+00')"
+        )
+    schema_editor.execute("CREATE TABLE blog_postview_default PARTITION OF blog_postview DEFAULT")
+    schema_editor.execute(
+        "INSERT INTO blog_postview (id, post_id, ip_address, \"timestamp\") "
+        "SELECT id, post_id, ip_address, \"timestamp\" FROM blog_postview_legacy"
+    )
+    schema_editor.execute("DROP TABLE blog_postview_legacy")
+    schema_editor.execute("CREATE INDEX blog_postview_post_id_idx ON blog_postview (post_id)")
+    schema_editor.execute("CREATE INDEX blog_postview_timestamp_idx ON blog_postview (\"timestamp\")")
+
+
+def unpartition_postview(apps, schema_editor):
+    """
+    Deshace `partition_postview`: vuelve a una tabla normal con clave primaria `id`.
+
+    Copia las filas de todas las particiones (las ya archivadas con
+    `archive_postviews` no se pueden recuperar desde aquí) y recrea la FK y los
+    índices de antes.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE TABLE blog_postview_unpartitioned ("
+        "id uuid NOT NULL, "
+        "post_id uuid NOT NULL REFERENCES blog_post (id) DEFERRABLE INITIALLY DEFERRED, "
+        "ip_address inet NOT NULL, "
+        "\"timestamp\" timestamp with time zone NOT NULL, "
+        "CONSTRAINT blog_postview_unpartitioned_pkey PRIMARY KEY (id)"
+        ")"
+    )
+    schema_editor.execute(
+        "INSERT INTO blog_postview_unpartitioned (id, post_id, ip_address, \"timestamp\") "
+        "SELECT id, post_id, ip_address, \"timestamp\" FROM blog_postview"
+    )
+    schema_editor.execute("DROP TABLE blog_postview")  # Se lleva también todas las particiones.
+    schema_editor.execute("ALTER TABLE blog_postview_unpartitioned RENAME TO blog_postview")
+    schema_editor.execute("ALTER INDEX blog_postview_unpartitioned_pkey RENAME TO blog_postview_pkey")
+    schema_editor.execute("CREATE INDEX blog_postview_post_id_idx ON blog_postview (post_id)")
+    schema_editor.execute("CREATE INDEX blog_postview_timestamp_idx ON blog_postview (\"timestamp\")")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_postanalytics_trending_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_postview, unpartition_postview, hints={'model_name': 'postview'}),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_partition_postview'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='postanalytics',
+            name='post',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='analytics', to='blog.post'),
+        ),
+        migrations.AlterField(
+            model_name='postdailystats',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='daily_stats', to='blog.post'),
+        ),
+        migrations.AlterField(
+            model_name='posthourlystats',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='hourly_stats', to='blog.post'),
+        ),
+        migrations.AlterField(
+            model_name='postuniquevisitors',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='unique_visitors', to='blog.post'),
+        ),
+        migrations.AlterField(
+            model_name='postview',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='post_view', to='blog.post'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_analytics_without_db_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='post_status_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:58
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """
+    Prepara la búsqueda a texto completo de los posts (solo PostgreSQL).
+
+    - Crea la configuración `spanish_unaccent`: la `spanish` de siempre pero
+      quitando los acentos antes de aplicar el *stemmer*.
+    - Rellena `search_vector` de los posts existentes (los nuevos los actualiza
+      `signals.py`) con los mismos pesos que `search.post_search_vector`.
+    - Crea el índice GIN sobre `search_vector`.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    schema_editor.execute(
+        "DO $$ BEGIN "
+        "IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN "
+        "CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = spanish); "
+        "ALTER TEXT SEARCH CONFIGURATION spanish_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem; "
+        "END IF; END $$"
+    )
+    schema_editor.execute(
+        "UPDATE blog_post SET search_vector = "
+        "setweight(to_tsvector('spanish_unaccent', COALESCE(title, '')), 'A') || "
+        "setweight(to_tsvector('spanish_unaccent', COALESCE(keywords, '') || ' ' || COALESCE(description, '')), 'B') || "
+        "setweight(to_tsvector('spanish_unaccent', REGEXP_REPLACE(COALESCE(content, ''), '<[^>]+>', ' ', 'g')), 'C')"
+    )
+    schema_editor.execute("CREATE INDEX IF NOT EXISTS blog_post_search_vector_gin ON blog_post USING gin (search_vector)")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS blog_post_search_vector_gin")
+    schema_editor.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS spanish_unaccent")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index, hints={'model_name': 'post'}),
+    ]
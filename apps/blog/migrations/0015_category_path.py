@@ -0,0 +1,43 @@
+# Generated by Django 4.2.19 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+def fill_category_paths(apps, schema_editor):
+    """Calcula `path` y `depth` de las categorías existentes recorriendo el árbol desde las raíces."""
+    Category = apps.get_model('blog', 'Category')
+    children = {}
+    for category in Category.objects.using(schema_editor.connection.alias).all():
+        children.setdefault(category.parent_id, []).append(category)
+    pending = [(category, "") for category in children.get(None, [])]
+    while pending:
+        category, parent_path = pending.pop()
+        category.path = f"{parent_path}{category.pk.hex}/"
+        category.depth = category.path.count("/") - 1
+        category.save(update_fields=['path', 'depth'])
+        pending.extend((child, category.path) for child in children.get(category.pk, []))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_post_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(default='', editable=False, max_length=512),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['path'], name='category_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(fill_category_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.19 on 2026-10-18 19:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0015_category_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Keyword',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['slug'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PostKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_keywords', to='blog.keyword')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_keywords', to='blog.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['keyword', 'post'], name='postkeyword_keyword_post_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='postkeyword',
+            constraint=models.UniqueConstraint(fields=('post', 'keyword'), name='unique_post_keyword'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.19 on 2026-10-18 19:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0016_keywords'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='heading',
+            name='post',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='headings', to='blog.post'),
+        ),
+        migrations.AlterField(
+            model_name='heading',
+            name='slug',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AddConstraint(
+            model_name='heading',
+            constraint=models.UniqueConstraint(fields=('post', 'slug'), name='unique_post_heading_slug'),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.19 on 2026-10-18 19:03
+
+import math
+from html import unescape
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# Posts leídos y guardados por lote.
+BATCH_SIZE = 500
+
+# Valores de `apps/blog/rendering.py` al escribir esta migración.
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 300
+
+
+def render_existing_posts(apps, schema_editor):
+    """
+    Rellena el contenido derivado de los posts existentes (los nuevos lo hace `Post.save`).
+
+    Solo hace la transformación mínima para que la API no sirva contenido vacío:
+    `content_html` es el HTML original y el extracto y el recuento de palabras
+    salen del texto sin etiquetas. El minificado y las imágenes diferidas los
+    aplica después `manage.py render_posts`, que usa el `rendering.py` vivo.
+    """
+    Post = apps.get_model('blog', 'Post')
+    posts = Post.objects.using(schema_editor.connection.alias)
+    batch = []
+    for post in posts.only('id', 'content').iterator(chunk_size=BATCH_SIZE):
+        text = " ".join(unescape(strip_tags(post.content or "")).split())
+        post.content_html = post.content or ""
+        post.excerpt = Truncator(text).chars(EXCERPT_LENGTH)
+        post.word_count = len(text.split())
+        post.reading_time = max(1, math.ceil(post.word_count / WORDS_PER_MINUTE))
+        batch.append(post)
+        if len(batch) >= BATCH_SIZE:
+            posts.bulk_update(batch, ['content_html', 'excerpt', 'word_count', 'reading_time'], batch_size=BATCH_SIZE)
+            batch = []
+    posts.bulk_update(batch, ['content_html', 'excerpt', 'word_count', 'reading_time'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0017_heading_per_post_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.19 on 2026-10-18 19:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0019_relatedpost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.CharField(max_length=128, unique=True)),
+                ('base_url', models.CharField(max_length=255)),
+                ('body', models.BinaryField()),
+                ('body_gzip', models.BinaryField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='snapshot', to='blog.post')),
+            ],
+        ),
+    ]
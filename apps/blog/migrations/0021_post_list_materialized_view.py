@@ -0,0 +1,75 @@
+# Generated by Django 4.2.19 on 2026-10-18 19:06
+
+import apps.blog.models
+from django.db import migrations, models
+
+# Debe coincidir con los campos de `PostListEntry`.
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS blog_postlistentry AS
+SELECT
+    post.id, post.title, post.slug, post.description, post.thumbnail,
+    post.excerpt, post.reading_time, post.created_at, post.update_at,
+    category.name AS category_name, category.slug AS category_slug,
+    COALESCE(stats.views, 0) AS view_count
+FROM blog_post post
+JOIN blog_category category ON category.id = post.category_id
+LEFT JOIN (
+    SELECT post_id, SUM(views) AS views FROM blog_postdailystats GROUP BY post_id
+) stats ON stats.post_id = post.id
+WHERE post.status = 'published'
+WITH DATA
+"""
+
+
+def create_post_list_view(apps, schema_editor):
+    """
+    Crea la vista materializada del listado de posts (solo PostgreSQL).
+
+    El índice único sobre `id` es obligatorio para `REFRESH ... CONCURRENTLY`
+    y el de `(created_at, id)` sirve a la paginación por cursor.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_VIEW)
+    schema_editor.execute("CREATE UNIQUE INDEX IF NOT EXISTS blog_postlistentry_id_uniq ON blog_postlistentry (id)")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS blog_postlistentry_created_id_idx ON blog_postlistentry (created_at DESC, id DESC)"
+    )
+
+
+def drop_post_list_view(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP MATERIALIZED VIEW IF EXISTS blog_postlistentry")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0020_postsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostListEntry',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=128)),
+                ('slug', models.CharField(max_length=128)),
+                ('description', models.CharField(max_length=256)),
+                ('thumbnail', models.ImageField(upload_to=apps.blog.models.blog_thumbnail_directory)),
+                ('excerpt', models.TextField()),
+                ('reading_time', models.PositiveSmallIntegerField()),
+                ('created_at', models.DateTimeField()),
+                ('update_at', models.DateTimeField()),
+                ('category_name', models.CharField(max_length=255)),
+                ('category_slug', models.CharField(max_length=128)),
+                ('view_count', models.PositiveIntegerField()),
+            ],
+            options={
+                'db_table': 'blog_postlistentry',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_post_list_view, drop_post_list_view, hints={'model_name': 'postlistentry'}),
+    ]
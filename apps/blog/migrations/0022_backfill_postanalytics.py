@@ -0,0 +1,39 @@
+from django.db import migrations, router
+
+# Filas que se insertan en cada `INSERT`.
+BATCH_SIZE = 1000
+
+
+def backfill_post_analytics(apps, schema_editor):
+    """
+    Crea la fila de `PostAnalytics` de los posts que todavía no la tienen.
+
+    Los posts nuevos la reciben en `signals.create_post_analytics`; los que ya
+    existían antes de esa señal se quedaban fuera de los listados de analítica.
+    Solo actúa sobre la base donde vive `PostAnalytics` (ver `core/routers.py`)
+    y lee los posts de la suya, que puede ser otra.
+    """
+    Post = apps.get_model("blog", "Post")
+    PostAnalytics = apps.get_model("blog", "PostAnalytics")
+    if schema_editor.connection.alias != router.db_for_write(PostAnalytics):
+        return
+    post_ids = Post.objects.using(router.db_for_write(Post)).order_by().values_list("id", flat=True)
+    batch = []
+    for post_id in post_ids.iterator(chunk_size=BATCH_SIZE):
+        batch.append(PostAnalytics(post_id=post_id))
+        if len(batch) >= BATCH_SIZE:
+            PostAnalytics.objects.using(schema_editor.connection.alias).bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    PostAnalytics.objects.using(schema_editor.connection.alias).bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0021_post_list_materialized_view'),
+    ]
+
+    operations = [
+        # Las filas creadas no se borran al deshacer: son las mismas que habría creado la señal.
+        migrations.RunPython(backfill_post_analytics, migrations.RunPython.noop, hints={'model_name': 'postanalytics'}),
+    ]
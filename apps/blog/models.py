@@ -1,10 +1,17 @@
 import uuid
 
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 from django.utils import timezone
 from django.utils.text import slugify
 from django_ckeditor_5.fields import CKEditor5Field
 
+from .headings import anchor_headings
+from .rendering import render_content
+
 def blog_thumbnail_directory(instance, filename):
     """Define la ruta donde se guardarán las imágenes de los posts."""
     return "blog/{0}/{1}".format(instance.title, filename)
@@ -28,6 +35,11 @@ class Category(models.Model):
     Representa una categoría dentro del blog.
 
     Permite organización jerárquica con subcategorías mediante la relación `parent`.
+
+    Además del `parent`, cada categoría guarda su *materialized path*: los `id`
+    (en hexadecimal) de sus antepasados y el suyo, separados por `/`. Así todo el
+    subárbol de una categoría sale con un único `path LIKE 'prefijo%'` indexado.
+    `save()` lo mantiene al día, también para los descendientes cuando se mueve.
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     parent = models.ForeignKey("self", related_name="children", on_delete=models.CASCADE, blank=True, null=True)
@@ -38,14 +50,55 @@ class Category(models.Model):
     slug = models.CharField(max_length=128, unique=True)
     created_at = models.DateTimeField(default=timezone.now)
     update_at = models.DateTimeField(auto_now=True)
+    path = models.CharField(max_length=512, default="", editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    class Meta:
+        """Índice para las búsquedas por prefijo de `path` (subárboles)."""
+        indexes = [
+            models.Index(fields=["path"], name="category_path_idx", opclasses=["varchar_pattern_ops"]),
+        ]
+
     def __str__(self):
         """Retorna el nombre de la categoría como representación en string."""
         return self.name
+
+    def clean(self):
+        """Impide que una categoría cuelgue de sí misma o de una de sus subcategorías."""
+        if self.parent_id and self.pk.hex in self._parent_path().split("/"):
+            raise ValidationError({"parent": "Una categoría no puede colgar de sí misma ni de sus subcategorías."})
+
+    def _parent_path(self):
+        """`path` del padre leído de la base de datos (el objeto en memoria puede estar desactualizado)."""
+        if not self.parent_id:
+            return ""
+        return Category.objects.filter(pk=self.parent_id).values_list("path", flat=True).get()
+
     def save(self, *args, **kwargs):
-        """Genera automáticamente el `slug` basado en el nombre si no está definido."""
+        """
+        Genera automáticamente el `slug` basado en el nombre si no está definido
+        y recalcula `path` y `depth`.
+
+        Si la categoría cambia de padre, reescribe el `path` de todo su subárbol
+        con un único `UPDATE`.
+        """
         if not self.slug:
             self.slug = slugify(self.title or self.name)
-        super().save(*args, **kwargs)
+        parent_path = self._parent_path()
+        if self.pk.hex in parent_path.split("/"):
+            raise ValueError("Una categoría no puede colgar de sí misma ni de sus subcategorías.")
+        old_path, old_depth = self.path, self.depth
+        self.path = f"{parent_path}{self.pk.hex}/"
+        self.depth = self.path.count("/") - 1
+        if "update_fields" in kwargs and kwargs["update_fields"] is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "path", "depth"}
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            if old_path and old_path != self.path:
+                Category.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                    path=Concat(Value(self.path), Substr("path", len(old_path) + 1)),
+                    depth=F("depth") + (self.depth - old_depth),
+                )
 
 class Post(models.Model):
     """
@@ -85,23 +138,56 @@ class Post(models.Model):
     twitter_title = models.CharField(max_length=256, blank=True, null=True)
     twitter_description = models.CharField(max_length=256, blank=True, null=True)
     twitter_image = models.ImageField(upload_to=blog_seo_twitter_thumbnail_directory,  blank=True, null=True)
+    # Contenido derivado de `content`, calculado al guardar (ver `rendering.py`).
+    content_html = models.TextField(blank=True, default="", editable=False)  # HTML minificado que sirve la API
+    excerpt = models.TextField(blank=True, default="", editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False)  # Minutos
+    # Búsqueda a texto completo (solo PostgreSQL, con índice GIN): la rellena `signals.py` al guardar, ver `search.py`.
+    search_vector = SearchVectorField(null=True, editable=False)
     class Meta:
         """Configura el orden predeterminado de los posts en consultas."""
         ordering = ["status", "-created_at",]
+        indexes = [
+            # Paginación por cursor de los publicados (ver `pagination.KeysetPagination`).
+            models.Index(fields=["status", "-created_at", "-id"], name="post_status_created_id_idx"),
+        ]
 
     def save(self, *args, **kwargs):
-        """Genera automáticamente el `slug` basado en el título si no está definido."""
+        """
+        Genera automáticamente el `slug` basado en el título si no está definido.
+
+        Si se guarda el contenido, añade un `id` a los encabezados que no lo tengan,
+        recalcula el contenido derivado (`content_html`, `excerpt`, `word_count` y
+        `reading_time`) y sustituye las filas de `Heading` del post por las
+        extraídas del HTML en la misma transacción (ver `headings.py` y `rendering.py`).
+        """
         if not self.slug:
             self.slug = slugify(self.title)
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "content" not in update_fields:
+            super().save(*args, **kwargs)
+            return
+        self.content, headings = anchor_headings(self.content)
+        derived = render_content(self.content)
+        for field, value in derived.items():
+            setattr(self, field, value)
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *derived}
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+            Heading.objects.filter(post_id=self.pk).delete()
+            Heading.objects.bulk_create([Heading(post_id=self.pk, **heading) for heading in headings])
     def __str__(self):
         """Retorna el título del post como representación en string."""
         return self.title
 class PostView(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    post = models.ForeignKey(Post, on_delete=models.PROTECT, related_name='post_view')
+    # Las tablas de analítica pueden vivir en otra base de datos (ver `core/routers.py`),
+    # así que no llevan FK en la base: el borrado de posts lo gestiona `signals.py`.
+    post = models.ForeignKey(Post, on_delete=models.DO_NOTHING, db_constraint=False, related_name='post_view')
     ip_address = models.GenericIPAddressField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
 class Heading(models.Model):
     """
     Representa un encabezado dentro de un post.
@@ -109,9 +195,10 @@ class Heading(models.Model):
     Puede ser un `H1`, `H2`, `H3`, etc., y se ordena dentro del post.
     """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    post = models.ForeignKey(Post, on_delete=models.PROTECT, related_name='headings')#Si se borra el heading no se borra el POST.
+    # Se generan a partir de `Post.content` al guardar el post, así que se borran con él.
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='headings')
     title = models.CharField(max_length=255)
-    slug = models.CharField(max_length=255, unique=True)
+    slug = models.CharField(max_length=255)  # `id` del encabezado en el HTML (único dentro del post)
     level = models.IntegerField(
         choices=(
             (1,"H1"),
@@ -128,16 +215,118 @@ class Heading(models.Model):
     class Meta:
         """Configura el orden de los encabezados dentro de un post."""
         ordering = ["order",]
+        constraints = [
+            models.UniqueConstraint(fields=["post", "slug"], name="unique_post_heading_slug"),
+        ]
         
     def save(self, *args, **kwargs):
         """Genera automáticamente el `slug` basado en el título si no está definido."""
         if not self.slug:
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
+class Keyword(models.Model):
+    """
+    Palabra clave normalizada del blog.
+
+    Se obtiene de `Post.keywords` (ver `keywords.py`); `slug` es la forma
+    normalizada (minúsculas, sin acentos) por la que se filtra.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=100)
+    slug = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ["slug"]
+
+    def __str__(self):
+        return self.name
+class PostKeyword(models.Model):
+    """Relación entre un post y cada una de sus palabras clave."""
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="post_keywords")
+    keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE, related_name="post_keywords")
+
+    class Meta:
+        """`(post, keyword)` es única; el índice `(keyword, post)` resuelve los filtros por etiqueta."""
+        constraints = [
+            models.UniqueConstraint(fields=["post", "keyword"], name="unique_post_keyword"),
+        ]
+        indexes = [
+            models.Index(fields=["keyword", "post"], name="postkeyword_keyword_post_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} - {self.keyword_id}"
+class RelatedPost(models.Model):
+    """
+    Vecinos más parecidos de cada post, precalculados por `related.py`.
+
+    Cada post guarda sus `RELATED_POSTS_COUNT` posts más similares (similitud
+    coseno de TF-IDF), así que la API los lee con una única consulta.
+    """
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="related_links")
+    related = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="+")
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["-score"]
+        constraints = [
+            models.UniqueConstraint(fields=["post", "related"], name="unique_related_post"),
+        ]
+        indexes = [
+            models.Index(fields=["post", "-score"], name="relatedpost_post_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.3f})"
+class PostSnapshot(models.Model):
+    """
+    Respuesta JSON ya renderizada del detalle de un post publicado.
+
+    Se regenera al guardar el post, su categoría o los datos que muestra (ver
+    `snapshots.py`) y `PostDetailView` devuelve estos bytes tal cual. `base_url`
+    es el origen con el que se construyeron las URLs absolutas de las imágenes.
+    """
+    post = models.OneToOneField(Post, on_delete=models.CASCADE, related_name="snapshot")
+    slug = models.CharField(max_length=128, unique=True)
+    base_url = models.CharField(max_length=255)
+    body = models.BinaryField()
+    body_gzip = models.BinaryField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.slug
+class PostListEntry(models.Model):
+    """
+    Fila de la vista materializada `blog_postlistentry` (solo PostgreSQL).
+
+    Una fila por post publicado con su categoría y su total de visitas ya unidos
+    y agregados, para que el listado sea un recorrido de una única tabla
+    estrecha. La crea la migración 0021 y la refresca `post_list.py`.
+    """
+    id = models.UUIDField(primary_key=True)
+    title = models.CharField(max_length=128)
+    slug = models.CharField(max_length=128)
+    description = models.CharField(max_length=256)
+    thumbnail = models.ImageField(upload_to=blog_thumbnail_directory)
+    excerpt = models.TextField()
+    reading_time = models.PositiveSmallIntegerField()
+    created_at = models.DateTimeField()
+    update_at = models.DateTimeField()
+    category_name = models.CharField(max_length=255)
+    category_slug = models.CharField(max_length=128)
+    view_count = models.PositiveIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = "blog_postlistentry"
+
+    def __str__(self):
+        return self.title
 class PostAnalytics(models.Model):
-    post = models.OneToOneField('Post', on_delete=models.CASCADE, related_name='analytics')
+    post = models.OneToOneField('Post', on_delete=models.DO_NOTHING, db_constraint=False, related_name='analytics')
     impressions = models.PositiveIntegerField(default=0)  # Veces que se muestra en la lista
     clicks = models.PositiveIntegerField(default=0)  # Veces que alguien hace clic
+    trending_score = models.FloatField(default=0, db_index=True)  # Puntuación con decaimiento (ver `trending.py`)
 
     def ctr(self):
         """Calcula el Click-Through Rate (CTR)."""
@@ -146,4 +335,67 @@ class PostAnalytics(models.Model):
         return (self.clicks / self.impressions) * 100
 
     def __str__(self):
-        return f"{self.post.title} - Impressions: {self.impressions}, Clicks: {self.clicks}, CTR: {self.ctr():.2f}%"
\ No newline at end of file
+        return f"{self.post.title} - Impressions: {self.impressions}, Clicks: {self.clicks}, CTR: {self.ctr():.2f}%"
+
+class PostUniqueVisitors(models.Model):
+    """
+    Sketch HyperLogLog de las IPs distintas que han visto un post en un día.
+
+    Ocupa unos 4 KB por post y día, sea cual sea el tráfico, y los sketches de
+    varios días se combinan para estimar visitantes únicos en cualquier rango.
+    """
+    post = models.ForeignKey(Post, on_delete=models.DO_NOTHING, db_constraint=False, related_name='unique_visitors')
+    day = models.DateField()
+    sketch = models.BinaryField()
+
+    class Meta:
+        """Un único sketch por post y día."""
+        constraints = [
+            models.UniqueConstraint(fields=["post", "day"], name="unique_post_day_sketch"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} - {self.day}"
+
+class BasePostStats(models.Model):
+    """
+    Base de las tablas de agregados (*rollups*) de métricas por post.
+
+    Cada fila acumula las visitas, impresiones y clics de un post en el intervalo
+    que empieza en `start`; las consultas de estadísticas leen de aquí en vez de
+    recorrer las tablas de eventos.
+    """
+    start = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    impressions = models.PositiveIntegerField(default=0)
+    clicks = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ["start"]
+
+class PostHourlyStats(BasePostStats):
+    """Métricas de un post agregadas por hora."""
+    post = models.ForeignKey(Post, on_delete=models.DO_NOTHING, db_constraint=False, related_name='hourly_stats')
+
+    class Meta(BasePostStats.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=["post", "start"], name="unique_post_hourly_stats"),
+        ]
+
+class PostDailyStats(BasePostStats):
+    """Métricas de un post agregadas por día (`start` es la medianoche local)."""
+    post = models.ForeignKey(Post, on_delete=models.DO_NOTHING, db_constraint=False, related_name='daily_stats')
+
+    class Meta(BasePostStats.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=["post", "start"], name="unique_post_daily_stats"),
+        ]
+
+class AnalyticsWatermark(models.Model):
+    """Marca hasta dónde ha procesado un trabajo incremental de agregación."""
+    name = models.CharField(max_length=64, unique=True)
+    value = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name}: {self.value}"
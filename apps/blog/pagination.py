@@ -0,0 +1,90 @@
+import base64
+import binascii
+import uuid
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class AnalyticsPagination(PageNumberPagination):
+    """Paginación por número de página para los listados de métricas (`?page=&page_size=`)."""
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class KeysetPagination:
+    """
+    Paginación por cursor (*keyset*) sobre `(created_at, id)` en orden descendente.
+
+    En vez de `OFFSET`, cada página filtra por la clave del último elemento de la
+    anterior, así que cuesta un recorrido de índice acotado por muy profunda que
+    sea. El cursor que recibe el cliente (`?cursor=`) es opaco.
+
+    Uso:
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(data)
+    """
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Cursor inválido."
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, obj):
+        position = f"{obj.created_at.isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(position.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+            created_at, pk = position.split("|")
+            created_at = parse_datetime(created_at)
+            if created_at is None:
+                raise ValueError
+            return created_at, uuid.UUID(pk)
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+        queryset = queryset.order_by("-created_at", "-id")
+        if position is not None:
+            created_at, pk = position
+            # `created_at__lte` acota el recorrido del índice; el OR desempata por id.
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+        page = list(queryset[:page_size + 1])
+        self.has_next = len(page) > page_size
+        self.page = page[:page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "results": data,
+        })
@@ -0,0 +1,196 @@
+import datetime
+import gzip
+import json
+import re
+
+from django.db import connections, router, transaction
+
+from .models import PostView
+
+# Las particiones mensuales se llaman `blog_postview_pAAAAMM`.
+PARTITION_NAME = re.compile(r"^(?P<table>.+)_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+
+def get_connection():
+    """Conexión de la base de datos donde vive `PostView` (ver `core/routers.py`)."""
+    return connections[router.db_for_write(PostView)]
+
+
+def is_partitioned():
+    """Solo PostgreSQL usa la tabla particionada; en SQLite todo esto no hace nada."""
+    return get_connection().vendor == "postgresql"
+
+
+def month_start(day):
+    return datetime.date(day.year, day.month, 1)
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    return datetime.date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{PostView._meta.db_table}_p{month:%Y%m}"
+
+
+def create_partition_sql(month):
+    """SQL que crea (si no existe) la partición mensual que empieza en `month`."""
+    qn = get_connection().ops.quote_name
+    return (
+        f"CREATE TABLE IF NOT EXISTS {qn(partition_name(month))} "
+        f"PARTITION OF {qn(PostView._meta.db_table)} "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') TO ('{add_months(month, 1):%Y-%m-%d} 00:00:00+00')"
+    )
+
+
+def default_partition_name():
+    """Partición `DEFAULT` creada por la migración 0011 (recoge lo que no tiene partición mensual)."""
+    return f"{PostView._meta.db_table}_default"
+
+
+def move_out_of_default(cursor, month):
+    """
+    Crea la partición de `month` llevándose sus filas de la partición `DEFAULT`.
+
+    PostgreSQL no deja crear la partición de un mes si `DEFAULT` ya tiene filas de
+    ese mes (pasa si el cron no se ejecutó a tiempo), así que se separa `DEFAULT`,
+    se crea la partición, se mueven las filas y se vuelve a adjuntar. Se llama
+    dentro de una transacción.
+    """
+    qn = get_connection().ops.quote_name
+    table, default, partition = qn(PostView._meta.db_table), qn(default_partition_name()), qn(partition_name(month))
+    bounds = [f"{month:%Y-%m-%d} 00:00:00+00", f"{add_months(month, 1):%Y-%m-%d} 00:00:00+00"]
+    cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+    cursor.execute(create_partition_sql(month))
+    cursor.execute(
+        f'INSERT INTO {partition} (id, post_id, ip_address, "timestamp") '
+        f'SELECT id, post_id, ip_address, "timestamp" FROM {default} WHERE "timestamp" >= %s AND "timestamp" < %s',
+        bounds,
+    )
+    cursor.execute(f'DELETE FROM {default} WHERE "timestamp" >= %s AND "timestamp" < %s', bounds)
+    cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+
+
+def drain_default_partition():
+    """
+    Pasa las filas de la partición `DEFAULT` a sus particiones mensuales.
+
+    Así vuelven a poder crearse esas particiones y las filas se archivan con
+    `archive_postviews` como las demás.
+
+    Retorna:
+        list: Nombres de las particiones creadas.
+    """
+    if not is_partitioned():
+        return []
+    connection = get_connection()
+    qn = connection.ops.quote_name
+    created = []
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [default_partition_name()])
+        if cursor.fetchone()[0] is None:
+            return []
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', \"timestamp\" AT TIME ZONE 'UTC')::date "
+            f"FROM {qn(default_partition_name())}"
+        )
+        for (month,) in sorted(cursor.fetchall()):
+            move_out_of_default(cursor, month)
+            created.append(partition_name(month))
+    return created
+
+
+def ensure_partitions(months_ahead=3, today=None):
+    """
+    Crea las particiones del mes actual y de los `months_ahead` siguientes.
+
+    Antes vacía la partición `DEFAULT` (ver `drain_default_partition`), así que un
+    cron que no se ejecutó a tiempo no deja nada bloqueado.
+
+    Retorna:
+        list: Nombres de las particiones comprobadas (existieran o no).
+    """
+    if not is_partitioned():
+        return []
+    drained = drain_default_partition()
+    current = month_start(today or datetime.date.today())
+    months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+    connection = get_connection()
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        for month in months:
+            cursor.execute(create_partition_sql(month))
+    return drained + [name for name in map(partition_name, months) if name not in drained]
+
+
+def list_partitions():
+    """Devuelve `[(mes, nombre)]` de las particiones mensuales existentes, de más antigua a más nueva."""
+    if not is_partitioned():
+        return []
+    with get_connection().cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = %s",
+            [PostView._meta.db_table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match and match["table"] == PostView._meta.db_table:
+            partitions.append((datetime.date(int(match["year"]), int(match["month"]), 1), name))
+    return sorted(partitions)
+
+
+def expired_partitions(retention_months, today=None):
+    """Particiones cuyo mes entero es anterior a los últimos `retention_months` meses."""
+    cutoff = add_months(month_start(today or datetime.date.today()), -retention_months)
+    return [(month, name) for month, name in list_partitions() if month < cutoff]
+
+
+def open_archive(path, compression):
+    """Abre `path` para escribir texto comprimido con `gzip` o `zstd`."""
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8")
+    if compression == "zstd":
+        import io
+        import zstandard  # Dependencia opcional: solo hace falta para archivar en zstd.
+        return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(open(path, "wb")), encoding="utf-8")
+    raise ValueError(f"Compresión no soportada: {compression}")
+
+
+def archive_partition(name, path, compression="gzip", chunk_size=5000):
+    """
+    Vuelca una partición a NDJSON comprimido y después la separa y la borra.
+
+    Las filas se leen con un cursor de servidor, así que la memoria no depende del
+    tamaño de la partición. La partición solo se elimina si el fichero se ha
+    escrito completo.
+
+    Retorna:
+        int: Número de filas archivadas.
+    """
+    connection = get_connection()
+    qn = connection.ops.quote_name
+    rows = 0
+    with transaction.atomic(using=connection.alias):
+        with open_archive(path, compression) as archive, connection.chunked_cursor() as cursor:
+            cursor.execute(f'SELECT id, post_id, ip_address, "timestamp" FROM {qn(name)} ORDER BY "timestamp"')
+            while True:
+                chunk = cursor.fetchmany(chunk_size)
+                if not chunk:
+                    break
+                for view_id, post_id, ip_address, timestamp in chunk:
+                    archive.write(json.dumps({
+                        "id": str(view_id),
+                        "post": str(post_id),
+                        "ip_address": str(ip_address),
+                        "timestamp": timestamp.isoformat(),
+                    }) + "\n")
+                rows += len(chunk)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {qn(PostView._meta.db_table)} DETACH PARTITION {qn(name)}")
+            cursor.execute(f"DROP TABLE {qn(name)}")
+    return rows
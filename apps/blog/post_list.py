@@ -0,0 +1,118 @@
+import threading
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AnalyticsWatermark, Post, PostDailyStats, PostListEntry
+from .rollups import attach_view_counts
+
+# Nombre de la marca (`AnalyticsWatermark`) con la hora del último refresco de la vista.
+REFRESH_WATERMARK = "post_list_refresh"
+
+
+def is_materialized():
+    """
+    La vista materializada solo existe en PostgreSQL y solo sirve si los agregados
+    de visitas viven en la misma base que los posts (ver `core/routers.py`).
+    """
+    alias = router.db_for_write(Post)
+    return connections[alias].vendor == "postgresql" and router.db_for_write(PostDailyStats) == alias
+
+
+def refresh_post_list(concurrently=True):
+    """
+    Refresca `blog_postlistentry` y apunta la hora en `REFRESH_WATERMARK`.
+
+    Con `CONCURRENTLY` las lecturas no se bloquean mientras se recalcula (a
+    cambio de ser algo más lento), así que se puede lanzar en cualquier momento.
+    Al guardar posts o categorías se llama a través de `post_list_refresher`; el
+    comando `refresh_post_list` (cron) recoge además los totales de visitas.
+    """
+    if not is_materialized():
+        return
+    with connections[router.db_for_write(Post)].cursor() as cursor:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{PostListEntry._meta.db_table}")
+    AnalyticsWatermark.objects.update_or_create(name=REFRESH_WATERMARK, defaults={"value": timezone.now()})
+
+
+class PostListRefresher:
+    """
+    Refresca la vista al confirmar cambios en posts o categorías, agrupando ráfagas.
+
+    El primer cambio confirmado arranca un temporizador de `delay` segundos
+    (`POST_LIST_REFRESH_DELAY`); los que se confirman mientras espera no hacen
+    nada, porque el refresco ya los incluirá. Así una ráfaga de guardados (una
+    edición en lote en el admin, una importación) cuesta un único
+    `REFRESH MATERIALIZED VIEW CONCURRENTLY`. Con `delay` 0 se refresca en el
+    mismo `on_commit`.
+    """
+    def __init__(self, delay=None):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def schedule(self):
+        """Programa un refresco para cuando se confirme la transacción en curso."""
+        if is_materialized():
+            transaction.on_commit(self._committed, using=router.db_for_write(Post))
+
+    def _committed(self):
+        delay = self.delay if self.delay is not None else getattr(settings, "POST_LIST_REFRESH_DELAY", 10)
+        if delay <= 0:
+            refresh_post_list()
+            return
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(delay, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self):
+        # Se libera antes de refrescar: lo que se confirme durante el refresco programa otro.
+        with self._lock:
+            self._timer = None
+        try:
+            refresh_post_list()
+        except Exception as e:
+            print("ERROR REFRESCANDO EL LISTADO DE POSTS:", str(e))
+        finally:
+            # El temporizador tiene su propia conexión; la cerramos para no dejarla colgada.
+            connections.close_all()
+
+
+post_list_refresher = PostListRefresher()
+
+
+def post_list_refreshed():
+    """Hora del último refresco de la vista (`None` si nunca se ha refrescado)."""
+    return AnalyticsWatermark.objects.filter(name=REFRESH_WATERMARK).values_list("value", flat=True).first()
+
+
+def post_list_entries():
+    """
+    Filas del listado de posts publicados con los campos de `PostListEntry`.
+
+    En PostgreSQL lee la vista materializada. En otros motores (p. ej. SQLite en
+    los tests) devuelve posts anotados con los mismos nombres; en ese caso hay
+    que pasar la página por `attach_entry_view_counts`.
+    """
+    if is_materialized():
+        return PostListEntry.objects.all()
+    return Post.postobjects.annotate(
+        category_name=F("category__name"), category_slug=F("category__slug"),
+    ).only(
+        "id", "title", "slug", "description", "thumbnail", "excerpt",
+        "reading_time", "created_at", "update_at",
+    )
+
+
+def attach_entry_view_counts(entries):
+    """Completa `view_count` en la ruta sin vista materializada (en la vista ya viene calculado)."""
+    entries = list(entries)
+    if entries and not isinstance(entries[0], PostListEntry):
+        for post in attach_view_counts(entries):
+            post.view_count = post.view_total
+    return entries
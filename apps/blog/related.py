@@ -0,0 +1,236 @@
+import re
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Count, Min
+from django.utils.html import strip_tags
+from unidecode import unidecode
+
+from .models import Post, RelatedPost
+
+TOKEN = re.compile(r"[a-z0-9]{3,}")
+
+# Palabras vacías en español (ya sin acentos) que no aportan nada a la similitud.
+STOPWORDS = frozenset("""
+    ante bajo cabe con contra desde durante entre hacia hasta mediante para por segun sin sobre tras
+    los las del una uno unos unas que como mas pero sus esta este esto estos estas ese esa eso esos esas
+    aquel aquella ser son era eran fue fueron sido estar esta estan hay han has hemos habia tiene tienen
+    muy tambien cuando donde quien cual cuales porque pues asi sino solo todo todos toda todas otro otra
+    otros otras mismo misma cada nos les ella ellos ellas usted ustedes mucho muchos poco entonces
+    """.split())
+
+# Cuánto pesa cada campo del post en su vector.
+FIELD_WEIGHTS = (("title", 3), ("keywords", 2), ("content", 1))
+
+
+def tokenize(text):
+    """Minúsculas, sin acentos y sin palabras vacías."""
+    return [token for token in TOKEN.findall(unidecode(text or "").lower()) if token not in STOPWORDS]
+
+
+def post_terms(title, keywords, content):
+    """Frecuencia de cada término en el post, ponderada según `FIELD_WEIGHTS`."""
+    fields = {"title": title, "keywords": keywords, "content": strip_tags(content or "")}
+    terms = Counter()
+    for field, weight in FIELD_WEIGHTS:
+        for token in tokenize(fields[field]):
+            terms[token] += weight
+    return terms
+
+
+class TfidfIndex:
+    """
+    Matriz TF-IDF dispersa (formato CSR) de los posts publicados.
+
+    Las filas están normalizadas, así que el producto escalar de dos filas es su
+    similitud coseno. Comparar un post con todos es un producto matriz-vector
+    disperso hecho con NumPy (`bincount`), lineal en el número de términos.
+
+    Se guardan también las frecuencias sin ponderar, para poder cambiar la fila
+    de un post (`replace`) sin volver a leer ni tokenizar el resto.
+    """
+    def __init__(self, documents):
+        self.vocabulary = {}
+        self.post_ids = []
+        indptr, indices, counts = [0], [], []
+        for post_id, terms in documents:
+            self.post_ids.append(post_id)
+            for term, count in terms.items():
+                indices.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.counts = np.array(counts, dtype=np.float64)
+        self._weigh()
+
+    def _weigh(self):
+        """Recalcula el IDF y las filas normalizadas a partir de las frecuencias."""
+        total = len(self.post_ids)
+        self.position = {post_id: row for row, post_id in enumerate(self.post_ids)}
+        self.size = len(self.vocabulary)
+        self.rows = np.repeat(np.arange(total), np.diff(self.indptr))
+        document_frequency = np.bincount(self.indices, minlength=self.size)
+        idf = np.log((1 + total) / (1 + document_frequency)) + 1
+        data = (1 + np.log(self.counts)) * idf[self.indices]
+        norms = np.sqrt(np.bincount(self.rows, weights=data ** 2, minlength=total))
+        norms[norms == 0] = 1
+        self.data = data / norms[self.rows]
+
+    @classmethod
+    def from_database(cls):
+        """Construye el índice con todos los posts publicados."""
+        posts = Post.postobjects.order_by("id").values_list("id", "title", "keywords", "content")
+        return cls([(post_id, post_terms(title, keywords, content)) for post_id, title, keywords, content in posts.iterator(chunk_size=200)])
+
+    def replace(self, documents):
+        """
+        Sustituye las filas de los posts de `documents` (`{post_id: términos}`); con
+        términos vacíos o `None`, la fila se quita.
+
+        Solo se filtra y concatena con NumPy; el IDF y las normas se recalculan
+        una vez con el resto de filas tal como estaban.
+        """
+        keep = np.array([post_id not in documents for post_id in self.post_ids], dtype=bool)
+        lengths = np.diff(self.indptr)[keep]
+        self.indices = self.indices[keep[self.rows]]
+        self.counts = self.counts[keep[self.rows]]
+        self.post_ids = [post_id for post_id, kept in zip(self.post_ids, keep) if kept]
+        indices, counts = [], []
+        for post_id, terms in documents.items():
+            if terms:
+                indices += [self.vocabulary.setdefault(term, len(self.vocabulary)) for term in terms]
+                counts += list(terms.values())
+                lengths = np.append(lengths, len(terms))
+                self.post_ids.append(post_id)
+        self.indices = np.concatenate([self.indices, np.array(indices, dtype=np.int64)])
+        self.counts = np.concatenate([self.counts, np.array(counts, dtype=np.float64)])
+        self.indptr = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        self._weigh()
+
+    def similarities(self, row):
+        """Similitud coseno de la fila `row` con todas las filas (con 0 para sí misma)."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        query = np.zeros(self.size)
+        query[self.indices[start:end]] = self.data[start:end]
+        similarities = np.bincount(self.rows, weights=self.data * query[self.indices], minlength=len(self.post_ids))
+        similarities[row] = 0
+        return similarities
+
+    def neighbours(self, row, k):
+        """Los `k` posts más parecidos a la fila `row`, como `[(post_id, score)]` de mayor a menor."""
+        similarities = self.similarities(row)
+        top = np.arange(len(similarities))
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        return [(self.post_ids[i], float(similarities[i])) for i in top if similarities[i] > 0]
+
+
+class RelatedIndex:
+    """
+    Índice TF-IDF del proceso.
+
+    Se construye desde la base de datos la primera vez y al pasar
+    `RELATED_INDEX_TTL` segundos (lo que tardan en verse aquí los cambios hechos
+    en otros procesos); entre medias, guardar un post solo cambia su fila.
+    """
+    def __init__(self):
+        self._index = None
+        self._built_at = 0.0
+        self.lock = threading.RLock()
+
+    def reset(self, index=None):
+        with self.lock:
+            self._index, self._built_at = index, time.monotonic()
+
+    def update(self, post_id):
+        """
+        Índice con la fila de `post_id` al día (sin fila si ya no está publicado).
+
+        También quita o añade los posts que otros procesos han borrado,
+        despublicado o publicado (comparando solo los ids), para no enlazar nunca
+        posts que ya no existen. Hay que usarlo con `lock` cogido mientras se
+        lean sus matrices.
+        """
+        with self.lock:
+            if self._index is None or time.monotonic() - self._built_at >= settings.RELATED_INDEX_TTL:
+                self.reset(TfidfIndex.from_database())
+                return self._index
+            published = set(Post.postobjects.values_list("id", flat=True))
+            indexed = set(self._index.post_ids)
+            changed = {post_id} | (published - indexed)
+            documents = dict.fromkeys((indexed - published) | changed)
+            posts = Post.postobjects.filter(pk__in=changed).values_list("id", "title", "keywords", "content")
+            documents.update((pk, post_terms(title, keywords, content)) for pk, title, keywords, content in posts)
+            self._index.replace(documents)
+            return self._index
+
+
+related_index = RelatedIndex()
+
+
+def neighbour_rows(index, post_ids, k):
+    return [
+        RelatedPost(post_id=post_id, related_id=related_id, score=score)
+        for post_id in post_ids if post_id in index.position
+        for related_id, score in index.neighbours(index.position[post_id], k)
+    ]
+
+
+def rebuild_related_posts(k=None):
+    """
+    Recalcula la tabla `RelatedPost` completa.
+
+    Retorna:
+        int: Número de filas guardadas.
+    """
+    k = k or settings.RELATED_POSTS_COUNT
+    index = TfidfIndex.from_database()
+    related_index.reset(index)
+    rows = neighbour_rows(index, index.post_ids, k)
+    with transaction.atomic(using=router.db_for_write(RelatedPost)):
+        RelatedPost.objects.all().delete()
+        RelatedPost.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def update_related_posts(post_id, k=None, affected=()):
+    """
+    Actualiza `RelatedPost` después de cambiar, despublicar o borrar un post.
+
+    Solo cambia la fila del post en el índice del proceso (ver `RelatedIndex`) y
+    solo recalcula las listas afectadas: la del propio post, las que ya lo
+    incluían (o las de `affected`, si las filas ya se borraron con el post) y
+    aquellas en las que ahora supera al vecino más flojo. El resto no se toca,
+    aunque el IDF haya variado ligeramente; `rebuild_related_posts` (comando
+    `rebuild_related_posts`) vuelve a dejarlo todo exacto.
+
+    Retorna:
+        set: Ids de los posts cuya lista se ha recalculado.
+    """
+    k = k or settings.RELATED_POSTS_COUNT
+    affected = {post_id, *affected, *RelatedPost.objects.filter(related_id=post_id).values_list("post_id", flat=True)}
+    with related_index.lock:
+        index = related_index.update(post_id)
+        row = index.position.get(post_id)
+        if row is not None:
+            totals = np.zeros(len(index.post_ids))
+            weakest = np.zeros(len(index.post_ids))
+            lists = RelatedPost.objects.values("post_id").annotate(total=Count("id"), weakest=Min("score")).order_by()
+            for item in lists:
+                if item["post_id"] in index.position:
+                    totals[index.position[item["post_id"]]] = item["total"]
+                    weakest[index.position[item["post_id"]]] = item["weakest"]
+            similarities = index.similarities(row)
+            candidates = (similarities > 0) & ((totals < k) | (similarities > weakest))
+            affected.update(index.post_ids[i] for i in np.flatnonzero(candidates))
+        rows = neighbour_rows(index, affected, k)
+    with transaction.atomic(using=router.db_for_write(RelatedPost)):
+        RelatedPost.objects.filter(post_id__in=affected).delete()
+        RelatedPost.objects.bulk_create(rows)
+    return affected
@@ -0,0 +1,146 @@
+import math
+import re
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.core.files.images import get_image_dimensions
+from django.core.files.storage import default_storage
+from django.utils.text import Truncator
+
+# Velocidad media de lectura usada para `reading_time`.
+WORDS_PER_MINUTE = 200
+
+EXCERPT_LENGTH = 300
+
+# Solo se colapsan los espacios ASCII; los de no separación (`&nbsp;`) se conservan.
+ASCII_WHITESPACE = re.compile(r"[ \t\n\r\f]+")
+
+# Dentro de estas etiquetas los espacios importan y no se tocan.
+PRESERVE_WHITESPACE = {"pre", "code", "textarea", "script", "style"}
+
+# Su contenido no es texto del artículo (no cuenta para el extracto ni las palabras).
+NON_TEXT = {"script", "style", "template"}
+
+# Elementos de bloque: separan palabras aunque no haya espacios entre ellos.
+BLOCK_TAGS = {
+    "p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "pre", "table", "tr", "td", "th", "figure", "figcaption", "hr",
+}
+
+
+def local_image_dimensions(src):
+    """
+    Ancho y alto de una imagen subida a `MEDIA_ROOT` (p. ej. desde CKEditor).
+
+    Retorna:
+        tuple: `(ancho, alto)`, o `(None, None)` si la imagen es externa o no se puede leer.
+    """
+    media_path = "/" + urlparse(settings.MEDIA_URL).path.strip("/") + "/"
+    path = unquote(urlparse(src).path)
+    if not path.startswith(media_path):
+        return None, None
+    try:
+        with default_storage.open(path[len(media_path):]) as image:
+            return get_image_dimensions(image)
+    except (OSError, ValueError):
+        return None, None
+
+
+class ContentRenderer(HTMLParser):
+    """
+    Reescribe el HTML de CKEditor en una sola pasada por eventos.
+
+    - Quita comentarios y colapsa los espacios (salvo en `<pre>`, `<code>`…) sin
+      tocar los `&nbsp;`.
+    - Añade `loading="lazy"`, `decoding="async"` y, si se conocen, `width`/`height` a las imágenes.
+    - Acumula el texto plano para el extracto y el recuento de palabras.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.html = []
+        self.text = []
+        self._stack = []
+
+    def _preserving(self):
+        return any(tag in PRESERVE_WHITESPACE for tag in self._stack)
+
+    def _in_text(self):
+        return not any(tag in NON_TEXT for tag in self._stack)
+
+    def _start_tag(self, tag, attrs, self_closing=False):
+        if tag == "img":
+            attrs = self._image_attrs(attrs)
+        rendered = "".join(
+            f" {name}" if value is None else f' {name}="{escape(value)}"'
+            for name, value in attrs
+        )
+        self.html.append(f"<{tag}{rendered}{' /' if self_closing else ''}>")
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+
+    def _image_attrs(self, attrs):
+        names = {name for name, _ in attrs}
+        attrs = list(attrs)
+        if "loading" not in names:
+            attrs.append(("loading", "lazy"))
+        if "decoding" not in names:
+            attrs.append(("decoding", "async"))
+        if "width" not in names and "height" not in names:
+            width, height = local_image_dimensions(dict(attrs).get("src") or "")
+            if width and height:
+                attrs += [("width", str(width)), ("height", str(height))]
+        return attrs
+
+    def handle_starttag(self, tag, attrs):
+        self._start_tag(tag, attrs)
+        if tag not in ("img", "br", "hr", "input", "meta", "link", "source", "wbr"):
+            self._stack.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start_tag(tag, attrs, self_closing=True)
+
+    def handle_endtag(self, tag):
+        self.html.append(f"</{tag}>")
+        if tag in self._stack:
+            while self._stack.pop() != tag:
+                pass
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+
+    def handle_data(self, data):
+        if self._stack and self._stack[-1] in ("script", "style"):
+            self.html.append(data)  # Contenido literal (CDATA): no se escapa.
+        elif self._preserving():
+            self.html.append(escape(data, quote=False))
+        else:
+            # Queda un espacio en los bordes para no pegar palabras de nodos vecinos.
+            collapsed = ASCII_WHITESPACE.sub(" ", data)
+            self.html.append(escape(collapsed, quote=False).replace("\xa0", "&nbsp;"))
+        if self._in_text():
+            self.text.append(data)
+
+    def handle_decl(self, decl):
+        self.html.append(f"<!{decl}>")
+
+
+def render_content(html):
+    """
+    Calcula el contenido derivado de un post a partir de su HTML.
+
+    Retorna:
+        dict: `content_html` (HTML minificado y con imágenes diferidas), `excerpt`
+        (texto plano), `word_count` y `reading_time` (minutos, mínimo 1).
+    """
+    renderer = ContentRenderer()
+    renderer.feed(html or "")
+    renderer.close()
+    text = " ".join("".join(renderer.text).split())
+    word_count = len(text.split())
+    return {
+        "content_html": "".join(renderer.html).strip(),
+        "excerpt": Truncator(text).chars(EXCERPT_LENGTH),
+        "word_count": word_count,
+        "reading_time": max(1, math.ceil(word_count / WORDS_PER_MINUTE)),
+    }
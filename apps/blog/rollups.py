@@ -0,0 +1,99 @@
+import datetime
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDay, TruncHour
+from django.utils import timezone
+
+from .models import AnalyticsWatermark, PostDailyStats, PostHourlyStats, PostView
+from .utils import bulk_increment
+
+VIEWS_WATERMARK = "post_views_rollup"
+
+BUCKET_MODELS = {
+    "hour": PostHourlyStats,
+    "day": PostDailyStats,
+}
+
+
+def bucket_starts(moment):
+    """Devuelve el inicio (en hora local) de la hora y del día que contienen `moment`."""
+    local = timezone.localtime(moment)
+    hour = local.replace(minute=0, second=0, microsecond=0)
+    day = timezone.make_aware(datetime.datetime.combine(local.date(), datetime.time.min))
+    return hour, day
+
+
+def rollup_views(until=None):
+    """
+    Agrega en `PostHourlyStats` y `PostDailyStats` las visitas nuevas de `PostView`.
+
+    Solo procesa las filas posteriores a la marca `VIEWS_WATERMARK` y anteriores
+    a `until` (por defecto, ahora menos `ANALYTICS_ROLLUP_LAG` segundos, para no
+    adelantarse a lotes que aún se están guardando). La agregación se hace en la
+    base de datos y la marca avanza en la misma transacción, así que el trabajo
+    se puede lanzar tantas veces como se quiera.
+
+    Retorna:
+        int: Número de visitas agregadas.
+    """
+    if until is None:
+        until = timezone.now() - datetime.timedelta(seconds=getattr(settings, "ANALYTICS_ROLLUP_LAG", 60))
+    with transaction.atomic(using=router.db_for_write(AnalyticsWatermark)):
+        watermark, _ = AnalyticsWatermark.objects.select_for_update().get_or_create(
+            name=VIEWS_WATERMARK,
+            defaults={"value": datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)},
+        )
+        if until <= watermark.value:
+            return 0
+        views = PostView.objects.filter(timestamp__gt=watermark.value, timestamp__lte=until)
+        total = 0
+        post_ids = set()
+        for model, trunc in ((PostHourlyStats, TruncHour), (PostDailyStats, TruncDay)):
+            rows = (
+                views.annotate(bucket=trunc("timestamp"))
+                .values("post_id", "bucket")
+                .annotate(total=Count("id"))
+                .order_by()
+            )
+            rows = [(row["post_id"], row["bucket"], row["total"], 0, 0) for row in rows]
+            bulk_increment(model, ["post", "start"], ["views", "impressions", "clicks"], rows)
+            total = sum(row[2] for row in rows)  # Igual en ambos modelos: nos quedamos con el último.
+            post_ids.update(row[0] for row in rows)
+        watermark.value = until
+        watermark.save(update_fields=["value"])
+    # El `view_count` de los snapshots del detalle sale de estos agregados.
+    from .snapshots import refresh_post_snapshots  # Import diferido: `snapshots` importa este módulo.
+    refresh_post_snapshots(post_ids)
+    return total
+
+
+def views_watermark():
+    """Hasta dónde están agregadas las visitas (`None` si nunca se ha ejecutado `rollup_views`)."""
+    return AnalyticsWatermark.objects.filter(name=VIEWS_WATERMARK).values_list("value", flat=True).first()
+
+
+def view_totals(post_ids):
+    """
+    Devuelve `{post_id: visitas}` leído de los agregados diarios en una sola consulta.
+
+    La consulta no hace JOIN con `Post`, así que funciona aunque las tablas de
+    analítica estén en otra base de datos (ver `core/routers.py`).
+    """
+    rows = (
+        PostDailyStats.objects.filter(post_id__in=list(post_ids))
+        .values("post_id")
+        .annotate(total=Sum("views"))
+        .order_by()
+    )
+    return {row["post_id"]: row["total"] for row in rows}
+
+
+def attach_view_counts(posts):
+    """Asigna `view_total` a cada post (lo usa `view_count` en los serializadores) y devuelve la lista."""
+    posts = list(posts)
+    totals = view_totals(post.pk for post in posts)
+    for post in posts:
+        post.view_total = totals.get(post.pk, 0)
+    return posts
@@ -0,0 +1,79 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db import connections, router
+from django.db.models import F, FloatField, Func, Q, Value
+
+from .models import Post
+
+# Configuración de búsqueda creada en la migración 0014: `spanish` + `unaccent`,
+# así "educacion" encuentra "educación" y "programación" encuentra "programar".
+SEARCH_CONFIG = "spanish_unaccent"
+
+
+class StripTags(Func):
+    """Quita las etiquetas HTML del contenido de CKEditor antes de indexarlo o resaltarlo."""
+    function = "REGEXP_REPLACE"
+    template = "%(function)s(%(expressions)s, '<[^>]+>', ' ', 'g')"
+
+
+def is_full_text():
+    """La búsqueda a texto completo solo existe en PostgreSQL."""
+    return connections[router.db_for_read(Post)].vendor == "postgresql"
+
+
+def post_search_vector():
+    """
+    Vector ponderado de un post: título (A), palabras clave y descripción (B) y contenido (C).
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("keywords", "description", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(StripTags("content"), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vector(post_ids):
+    """Recalcula `search_vector` de los posts indicados en una única sentencia `UPDATE`."""
+    if not is_full_text():
+        return 0
+    return Post.objects.filter(pk__in=list(post_ids)).update(search_vector=post_search_vector())
+
+
+def search_posts(text):
+    """
+    Busca `text` entre los posts publicados.
+
+    En PostgreSQL usa el índice GIN de `search_vector` (sintaxis de buscador web:
+    comillas, `or` y `-palabra`), ordena por relevancia y añade un fragmento del
+    contenido con las coincidencias entre `<mark>`. En otros motores cae a un
+    `icontains` sin ranking, suficiente para desarrollo.
+
+    Retorna:
+        QuerySet: Posts anotados con `rank` y `headline`.
+    """
+    posts = Post.postobjects.select_related("category")
+    if not is_full_text():
+        return (
+            posts.filter(Q(title__icontains=text) | Q(description__icontains=text) | Q(keywords__icontains=text))
+            .annotate(rank=Value(0.0, output_field=FloatField()), headline=F("description"))
+            .order_by("-created_at")
+        )
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+    # `ts_headline` es caro, pero PostgreSQL solo lo evalúa para las filas que
+    # sobreviven al `ORDER BY ... LIMIT`.
+    return (
+        posts.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            headline=SearchHeadline(
+                StripTags("content"),
+                query,
+                config=SEARCH_CONFIG,
+                start_sel="<mark>",
+                stop_sel="</mark>",
+                max_words=35,
+                min_words=15,
+                max_fragments=2,
+            ),
+        )
+        .order_by("-rank", "-created_at")
+    )
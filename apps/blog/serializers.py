@@ -1,7 +1,21 @@
+from django.db.models import Sum
 from rest_framework import serializers
-from .models import Post, Category, Heading, PostView, PostAnalytics
+from core.sparse_fields import SparseFieldsSerializerMixin
+from .models import Post, Category, Heading, PostView, PostAnalytics, PostDailyStats, RelatedPost, PostListEntry
 
-class CategorySerializer(serializers.ModelSerializer):
+def view_count(post):
+    """
+    Total de visitas de un post leído de los agregados diarios.
+
+    Usa el atributo `view_total` (ver `rollups.attach_view_counts`) si la vista
+    ya lo ha calculado, evitando una consulta por post en los listados.
+    """
+    if hasattr(post, "view_total"):
+        return post.view_total
+    return PostDailyStats.objects.filter(post=post).aggregate(total=Sum("views"))["total"] or 0
+
+
+class CategorySerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializador para el modelo `Category`.
 
@@ -21,7 +35,7 @@ class CategorySerializer(serializers.ModelSerializer):
             "created_at",
             "update_at",
         ]
-class CategoryListSerializer(serializers.ModelSerializer):
+class CategoryListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializador para el modelo `Category`.
 
@@ -34,7 +48,25 @@ class CategoryListSerializer(serializers.ModelSerializer):
             "name",
             "slug",
         ]
-class HeadingSerializer(serializers.ModelSerializer):
+class CategoryTreeSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializador de un nodo del árbol de categorías.
+
+    Espera las categorías preparadas por `CategoryTreeView`: con `post_count`
+    (posts publicados en la propia categoría), `total_post_count` (incluyendo
+    subcategorías) y `tree_children` (sus hijas ya construidas).
+    """
+    post_count = serializers.IntegerField()
+    total_post_count = serializers.IntegerField()
+    children = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Category
+        fields = ["id", "name", "title", "slug", "thumbnail", "depth", "post_count", "total_post_count", "children"]
+
+    def get_children(self, obj):
+        return CategoryTreeSerializer(obj.tree_children, many=True, context=self.context).data
+class HeadingSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializador para el modelo `Heading`.
 
@@ -50,13 +82,23 @@ class HeadingSerializer(serializers.ModelSerializer):
             "level",
             "order",
         ]
-class PostViewSerializer(serializers.ModelSerializer):
+class PostViewSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     
     class Meta:
         """Define el modelo a serializar y los campos incluidos."""
         model = PostView
         fields = "__all__"
-class PostSerializer(serializers.ModelSerializer):
+class RelatedPostSerializer(serializers.ModelSerializer):
+    """Tarjeta de un post relacionado (espera `RelatedPost` con `related` ya cargado)."""
+    title = serializers.CharField(source="related.title")
+    slug = serializers.CharField(source="related.slug")
+    description = serializers.CharField(source="related.description")
+    thumbnail = serializers.ImageField(source="related.thumbnail")
+
+    class Meta:
+        model = RelatedPost
+        fields = ["title", "slug", "description", "thumbnail", "score"]
+class PostSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializador para el modelo `Post`.
 
@@ -65,6 +107,8 @@ class PostSerializer(serializers.ModelSerializer):
     category = CategorySerializer()
     headings = HeadingSerializer(many = True) #Many = true porque podemos tener muchos headings
     view_count = serializers.SerializerMethodField()
+    related = serializers.SerializerMethodField()
+    content = serializers.CharField(source="content_html")  # HTML ya procesado al guardar (ver `rendering.py`)
     meta_description = serializers.CharField()
     og_title = serializers.CharField(allow_null=True)
     og_description = serializers.CharField(allow_null=True)
@@ -78,36 +122,109 @@ class PostSerializer(serializers.ModelSerializer):
         fields = [
             "id", "title", "description", "content", "thumbnail", "keywords",
             "slug", "category", "created_at", "update_at", "status", "headings", "view_count",
+            "excerpt", "word_count", "reading_time", "related",
             "meta_description", "og_title", "og_description", "og_image",
             "twitter_title", "twitter_description", "twitter_image"
         ]
     def get_view_count(self, obj):
-        return obj.post_view.count()
-class PostListSerializer(serializers.ModelSerializer):
+        return view_count(obj)
+
+    def get_related(self, obj):
+        """Posts relacionados precalculados (ver `related.py`), en una sola consulta."""
+        links = (
+            RelatedPost.objects.filter(post=obj, related__status="published")
+            .select_related("related")
+            .only("score", "related__title", "related__slug", "related__description", "related__thumbnail")
+            .order_by("-score")
+        )
+        return RelatedPostSerializer(links, many=True, context=self.context).data
+class PostListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Serializador para la lista de posts.
 
     Similar a `PostSerializer`, pero puede usarse para optimizar consultas
-    cuando no se necesitan todos los detalles.
+    cuando no se necesitan todos los detalles: no incluye `content` salvo que
+    se pida con `?fields=`.
     """
     category = CategoryListSerializer()
     view_count = serializers.SerializerMethodField()
     class Meta:
         """Define el modelo a serializar y los campos incluidos."""
         model = Post
-        fields = "__all__"
+        exclude = ["search_vector", "content_html"]
+        # Relaciones que solo se incluyen con `?expand=` (p. ej. `?expand=headings`).
+        expandable_fields = {
+            "headings": lambda: HeadingSerializer(many=True),
+        }
+        # El contenido completo solo se envía (y se lee de la base) con `?fields=content`.
+        optional_fields = ("content",)
 
     def get_view_count(self, obj):
-        return obj.post_view.count()
+        return view_count(obj)
+
+
+class TrendingPostSerializer(PostListSerializer):
+    """
+    Serializador para los posts en tendencia.
+
+    Añade `trending_score`, la puntuación guardada (que la vista asigna a cada
+    post) multiplicada por el factor de decaimiento actual de `context["decay"]`.
+    """
+    trending_score = serializers.SerializerMethodField()
 
+    def get_trending_score(self, obj):
+        return round(obj.trending_score * self.context.get("decay", 1.0), 4)
 
 
-class PostAnalyticsSerializer(serializers.ModelSerializer):
-    ctr = serializers.SerializerMethodField()
+class PostAnalyticsSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializador de las métricas de un post.
+
+    Espera un `PostAnalytics` anotado con `ctr` y `views` y con los datos del post
+    en `post_info` (ver `PostAnalyticsView`), de modo que las métricas se calculan
+    en la consulta SQL.
+    """
+    slug = serializers.CharField(source="post_info.slug")
+    title = serializers.CharField(source="post_info.title")
+    status = serializers.CharField(source="post_info.status")
+    ctr = serializers.FloatField()
+    views = serializers.IntegerField()
 
     class Meta:
         model = PostAnalytics
-        fields = ["post", "impressions", "clicks", "ctr"]
+        fields = ["slug", "title", "status", "impressions", "clicks", "ctr", "views"]
+
+
+class PostSearchSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializador de los resultados de búsqueda.
+
+    No incluye el contenido: solo los datos de la tarjeta del post, la relevancia
+    (`rank`) y el fragmento con las coincidencias resaltadas (`headline`).
+    """
+    category = CategoryListSerializer()
+    rank = serializers.FloatField()
+    headline = serializers.CharField()
+
+    class Meta:
+        model = Post
+        fields = ["id", "title", "description", "thumbnail", "slug", "category", "created_at", "rank", "headline"]
+
+
+class PostListEntrySerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
+    """
+    Serializador del listado ligero de posts (`PostListEntry`).
+
+    Devuelve la categoría con la misma forma que `PostListSerializer`.
+    """
+    category = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PostListEntry
+        fields = [
+            "id", "title", "slug", "description", "thumbnail", "excerpt",
+            "reading_time", "created_at", "update_at", "category", "view_count",
+        ]
 
-    def get_ctr(self, obj):
-        return obj.ctr()
+    def get_category(self, obj):
+        return {"name": obj.category_name, "slug": obj.category_slug}
@@ -0,0 +1,128 @@
+from django.db import router, transaction
+from django.db.models import ProtectedError
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .models import (
+    Category, Post, PostAnalytics, PostDailyStats, PostHourlyStats, PostUniqueVisitors, PostView, RelatedPost,
+)
+from .keywords import sync_post_keywords
+from .related import FIELD_WEIGHTS, update_related_posts
+from .search import update_search_vector
+from .snapshots import refresh_post_snapshots
+from .post_list import post_list_refresher
+
+# Campos que cambian el índice de relacionados: los del texto y el estado (solo cuentan los publicados).
+RELATED_FIELDS = (*(field for field, _ in FIELD_WEIGHTS), "status")
+
+
+@receiver(post_save, sender=Post)
+def create_post_analytics(sender, instance, created, **kwargs):
+    """Crea la fila de métricas del post para que aparezca en los listados de analítica desde el principio."""
+    if created:
+        PostAnalytics.objects.get_or_create(post_id=instance.pk)
+
+
+@receiver(post_save, sender=Post)
+def refresh_post_search_vector(sender, instance, **kwargs):
+    """Recalcula el vector de búsqueda del post en la base de datos (ver `search.py`)."""
+    update_search_vector([instance.pk])
+
+
+@receiver(post_save, sender=Post)
+def refresh_post_keywords(sender, instance, **kwargs):
+    """Mantiene la tabla normalizada de palabras clave al día con `Post.keywords` (ver `keywords.py`)."""
+    sync_post_keywords(instance)
+
+
+@receiver(pre_save, sender=Post)
+def remember_related_fields(sender, instance, update_fields=None, **kwargs):
+    """Guarda en el post los valores de `RELATED_FIELDS` que hay en la base antes de guardarlo."""
+    instance._related_before = None
+    if update_fields is not None and not set(update_fields) & set(RELATED_FIELDS):
+        instance._related_before = {}  # Ninguno de los campos se guarda: no pueden cambiar.
+    elif not instance._state.adding:
+        instance._related_before = Post.objects.filter(pk=instance.pk).values(*RELATED_FIELDS).first()
+
+
+def related_fields_changed(instance):
+    before = getattr(instance, "_related_before", None)
+    if before is None:
+        return True  # Post nuevo (o no se pudo leer): hay que indexarlo.
+    return any(field in before and before[field] != getattr(instance, field) for field in RELATED_FIELDS)
+
+
+@receiver(post_save, sender=Post)
+def refresh_related_and_snapshots(sender, instance, **kwargs):
+    """
+    Actualiza los posts relacionados afectados por el cambio (ver `related.py`) y
+    regenera el snapshot del detalle de todos ellos (ver `snapshots.py`).
+
+    Los relacionados solo se recalculan si cambia el título, las palabras clave,
+    el contenido o el estado; si no, basta con regenerar los snapshots del post y
+    de los que lo enlazan (muestran su título y su descripción).
+
+    Se hace al confirmar la transacción: `post_save` salta dentro de `Post.save()`,
+    antes de que se sustituyan las filas de `Heading`, y el snapshot tiene que
+    llevar los encabezados nuevos.
+    """
+    changed = related_fields_changed(instance)
+
+    def refresh():
+        if changed:
+            affected = update_related_posts(instance.pk)
+        else:
+            affected = set(RelatedPost.objects.filter(related_id=instance.pk).values_list("post_id", flat=True))
+        refresh_post_snapshots(affected | {instance.pk})
+
+    transaction.on_commit(refresh, using=router.db_for_write(Post))
+
+
+@receiver(post_save, sender=Category)
+def refresh_category_snapshots(sender, instance, **kwargs):
+    """El detalle de cada post incluye su categoría: regenera los snapshots que la muestran."""
+    refresh_post_snapshots(Post.objects.filter(category=instance).values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Post)
+def delete_post_analytics(sender, instance, **kwargs):
+    """
+    Propaga el borrado de un post a sus tablas de analítica.
+
+    Esas tablas no tienen FK en la base de datos porque pueden vivir en otra
+    (ver `core/routers.py`), así que Django no puede hacer el `CASCADE`/`PROTECT`
+    por sí solo. Las visitas siguen protegiendo el post como antes.
+    """
+    if PostView.objects.filter(post_id=instance.pk).exists():
+        raise ProtectedError(
+            "No se puede borrar el post porque tiene visitas registradas.",
+            {instance},
+        )
+    for model in (PostAnalytics, PostUniqueVisitors, PostHourlyStats, PostDailyStats):
+        model.objects.filter(post_id=instance.pk).delete()
+
+
+@receiver(pre_delete, sender=Post)
+def refresh_related_after_delete(sender, instance, **kwargs):
+    """
+    Rellena las listas de relacionados que incluían el post borrado.
+
+    Sus filas de `RelatedPost` desaparecen con el post (`CASCADE`), así que hay
+    que apuntar antes qué listas lo incluían y recalcularlas al confirmar.
+    """
+    pointing = set(RelatedPost.objects.filter(related_id=instance.pk).values_list("post_id", flat=True))
+
+    def refresh():
+        affected = update_related_posts(instance.pk, affected=pointing)
+        refresh_post_snapshots(affected)
+
+    transaction.on_commit(refresh, using=router.db_for_write(Post))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def refresh_post_list_view(sender, **kwargs):
+    """Los posts y las categorías forman parte de la vista materializada del listado (ver `post_list.py`)."""
+    post_list_refresher.schedule()
@@ -0,0 +1,118 @@
+import gzip
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import router, transaction
+from django.http import HttpRequest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .models import Post, PostSnapshot
+from .rollups import attach_view_counts
+from .serializers import PostSerializer
+
+
+def detail_queryset():
+    """Posts publicados con todo lo que necesita `PostSerializer` cargado de antemano."""
+    return Post.postobjects.select_related("category").prefetch_related("headings")
+
+
+def render_post_detail(post, request):
+    """JSON del detalle de un post, igual lo sirva la vista o se guarde como snapshot."""
+    attach_view_counts([post])
+    return PostSerializer(post, context={"request": request}).data
+
+
+class SnapshotRequest(HttpRequest):
+    """`GET` sin cliente real; solo sirve para que el serializador construya URLs absolutas."""
+    def __init__(self, base_url):
+        super().__init__()
+        base_url = urlparse(base_url)
+        self.method = "GET"
+        self.path = self.path_info = "/api/blog/posts/"
+        self.META["HTTP_HOST"] = base_url.netloc
+        self._scheme = base_url.scheme or "http"
+
+    def _get_scheme(self):
+        return self._scheme
+
+
+def snapshot_request():
+    """Petición ficticia sobre `BLOG_SNAPSHOT_BASE_URL` para construir las URLs absolutas."""
+    return Request(SnapshotRequest(settings.BLOG_SNAPSHOT_BASE_URL))
+
+
+def request_base_url(request):
+    """Origen (`esquema://host`) de una petición, para compararlo con `PostSnapshot.base_url`."""
+    return request.build_absolute_uri("/").rstrip("/")
+
+
+def refresh_post_snapshots(post_ids):
+    """
+    Regenera los snapshots de los posts indicados.
+
+    Los posts que ya no están publicados se quedan sin snapshot. Cada JSON se
+    guarda también comprimido en gzip para servirlo sin comprimir por petición.
+
+    Retorna:
+        int: Número de snapshots escritos.
+    """
+    post_ids = list(post_ids)
+    request = snapshot_request()
+    base_url = request_base_url(request)
+    snapshots = []
+    for post in detail_queryset().filter(pk__in=post_ids):
+        body = JSONRenderer().render(render_post_detail(post, request))
+        snapshots.append(PostSnapshot(
+            post=post, slug=post.slug, base_url=base_url, body=body, body_gzip=gzip.compress(body),
+        ))
+    with transaction.atomic(using=router.db_for_write(PostSnapshot)):
+        PostSnapshot.objects.filter(post_id__in=post_ids).delete()
+        PostSnapshot.objects.bulk_create(snapshots)
+    return len(snapshots)
+
+
+def accepts_gzip(accept_encoding):
+    """
+    Si la cabecera `Accept-Encoding` admite gzip, teniendo en cuenta los pesos `q`.
+
+    `gzip;q=0` lo rechaza expresamente; si gzip no aparece, decide el comodín `*`.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.lower()] = weight
+    if "gzip" in weights:
+        return weights["gzip"] > 0
+    if "x-gzip" in weights:
+        return weights["x-gzip"] > 0
+    return weights.get("*", 0) > 0
+
+
+def stored_snapshot(request, slug):
+    """
+    Bytes guardados del detalle de `slug` para esta petición.
+
+    Retorna:
+        tuple: `(cuerpo, comprimido)` o `None` si no hay snapshot válido para el
+        origen de la petición (entonces la vista serializa como siempre).
+    """
+    gzipped = accepts_gzip(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    body = (
+        PostSnapshot.objects.filter(slug=slug, base_url=request_base_url(request))
+        .values_list("body_gzip" if gzipped else "body", flat=True)
+        .first()
+    )
+    if body is None:
+        return None
+    return bytes(body), gzipped
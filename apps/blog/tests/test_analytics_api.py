@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.blog.models import PostAnalytics, PostDailyStats
+from apps.blog.rollups import bucket_starts
+
+from .utils import make_category, make_post
+
+
+class PostAnalyticsViewTests(TestCase):
+    url = "/api/blog/analytics/"
+
+    def setUp(self):
+        admin = get_user_model().objects.create_superuser("admin", "admin@example.com", "secreto")
+        self.client.force_login(admin)
+        self.python, other = make_category(), make_category("Django")
+        # (impresiones, clics, visitas): CTR del 10 %, 50 % y sin impresiones.
+        self.posts = {}
+        for title, category, impressions, clicks, views in (
+            ("Bajo", self.python, 100, 10, 1),
+            ("Alto", self.python, 10, 5, 7),
+            ("Nuevo", other, 0, 0, 0),
+        ):
+            post = make_post(category, title)
+            PostAnalytics.objects.filter(post=post).update(impressions=impressions, clicks=clicks)
+            if views:
+                PostDailyStats.objects.create(post=post, start=bucket_starts(timezone.now())[1], views=views)
+            self.posts[title] = post
+        make_post(self.python, "Borrado", status="deleted")
+
+    def titles(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row["title"] for row in response.json()["results"]]
+
+    def test_ordena_por_ctr_y_calcula_las_metricas(self):
+        self.assertEqual(self.titles(ordering="-ctr"), ["Alto", "Bajo", "Nuevo"])
+        self.assertEqual(self.titles(ordering="ctr"), ["Nuevo", "Bajo", "Alto"])
+        rows = self.client.get(self.url, {"ordering": "-views"}).json()["results"]
+        self.assertEqual(
+            [(row["title"], row["ctr"], row["views"]) for row in rows],
+            [("Alto", 50.0, 7), ("Bajo", 10.0, 1), ("Nuevo", 0.0, 0)],
+        )
+
+    def test_filtra_por_slug_y_categoria(self):
+        slugs = f"{self.posts['Bajo'].slug},{self.posts['Nuevo'].slug}"
+        self.assertEqual(self.titles(slug=slugs), ["Bajo", "Nuevo"])
+        self.assertEqual(self.titles(category=self.python.slug, ordering="clicks"), ["Alto", "Bajo"])
+
+    def test_no_trae_los_ids_de_los_posts(self):
+        # El filtro de posts va como subconsulta en la consulta de métricas.
+        with CaptureQueriesContext(connection) as queries:
+            self.titles(category=self.python.slug)
+        self.assertFalse(any(
+            query["sql"].startswith('SELECT "blog_post"."id" FROM') for query in queries.captured_queries
+        ))
+
+    def test_pagina_y_exige_admin(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 403)
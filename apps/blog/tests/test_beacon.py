@@ -0,0 +1,64 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.blog.analytics import CounterBuffer, ViewBuffer
+from apps.blog.models import PostAnalytics, PostView
+
+from .utils import make_category, make_post
+
+BROWSER = "Mozilla/5.0 (X11; Linux x86_64) Firefox/128.0"
+
+
+@mock.patch("apps.blog.views.counter_buffer", new_callable=lambda: CounterBuffer(interval=0))
+@mock.patch("apps.blog.views.view_buffer", new_callable=lambda: ViewBuffer(interval=0))
+class PostEventsViewTests(TestCase):
+    url = "/api/blog/events/"
+
+    def setUp(self):
+        category = make_category()
+        self.first, self.second = make_post(category, "Uno"), make_post(category, "Dos")
+
+    def send(self, events, user_agent=BROWSER, content_type="application/json"):
+        return self.client.post(self.url, json.dumps(events), content_type=content_type, HTTP_USER_AGENT=user_agent)
+
+    def counters(self, post):
+        return PostAnalytics.objects.values_list("impressions", "clicks").get(post=post)
+
+    def test_registra_los_eventos_del_lote(self, *buffers):
+        response = self.send({
+            "impressions": [self.first.slug, self.second.slug],
+            "clicks": [self.first.slug],
+            "views": [self.first.slug],
+        })
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.counters(self.first), (1, 1))
+        self.assertEqual(self.counters(self.second), (1, 0))
+        self.assertEqual(PostView.objects.filter(post=self.first).count(), 1)
+
+    def test_acepta_text_plain_de_send_beacon(self, *buffers):
+        response = self.send({"impressions": [self.first.slug]}, content_type="text/plain")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.counters(self.first), (1, 0))
+
+    def test_ignora_el_trafico_de_bots(self, *buffers):
+        for user_agent in ("Googlebot/2.1 (+http://www.google.com/bot.html)", ""):
+            response = self.send({"impressions": [self.first.slug], "views": [self.first.slug]}, user_agent=user_agent)
+            self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.counters(self.first), (0, 0))
+        self.assertFalse(PostView.objects.exists())
+
+    def test_rechaza_cuerpos_mal_formados(self, *buffers):
+        for events in (["slug"], {"likes": ["slug"]}, {"clicks": "slug"}, {"clicks": [""]}, {"clicks": [1]}):
+            with self.subTest(events=events):
+                response = self.send(events)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+        self.assertEqual(self.counters(self.first), (0, 0))
+
+    def test_limita_los_eventos_por_peticion(self, *buffers):
+        with self.settings(ANALYTICS_BEACON_MAX_EVENTS=2):
+            response = self.send({"impressions": [self.first.slug] * 3})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.counters(self.first), (0, 0))
@@ -0,0 +1,35 @@
+from django.test import RequestFactory, SimpleTestCase
+
+from apps.blog.utils import is_bot, is_bot_user_agent
+
+
+class BotDetectionTests(SimpleTestCase):
+    def test_crawlers_y_clientes_automaticos(self):
+        for user_agent in (
+            "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+            "Mozilla/5.0 (compatible; bingbot/2.0)",
+            "facebookexternalhit/1.1",
+            "Mozilla/5.0 (X11; Linux x86_64) HeadlessChrome/120.0",
+            "python-requests/2.31.0",
+            "curl/8.4.0",
+            "",
+        ):
+            with self.subTest(user_agent=user_agent):
+                self.assertTrue(is_bot_user_agent(user_agent))
+
+    def test_navegadores(self):
+        for user_agent in (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 Version/17.0 Mobile/15E148 Safari/604.1",
+            "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0",
+        ):
+            with self.subTest(user_agent=user_agent):
+                self.assertFalse(is_bot_user_agent(user_agent))
+
+    def test_lee_la_cabecera_y_cachea_el_resultado(self):
+        is_bot_user_agent.cache_clear()
+        factory = RequestFactory()
+        for _ in range(3):
+            self.assertTrue(is_bot(factory.get("/", HTTP_USER_AGENT="Googlebot")))
+        self.assertTrue(is_bot(factory.get("/")))
+        self.assertEqual(is_bot_user_agent.cache_info().hits, 2)
@@ -0,0 +1,58 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from apps.blog.models import Category
+
+from .utils import make_category, make_post
+
+
+class CategoryTreeTests(TestCase):
+    def setUp(self):
+        self.programming = make_category("Programación")
+        self.python = Category.objects.create(name="Python", parent=self.programming)
+        self.django = Category.objects.create(name="Django", parent=self.python)
+        self.design = make_category("Diseño")
+        make_post(self.programming, "General")
+        make_post(self.python, "Listas")
+        make_post(self.django, "Vistas")
+        make_post(self.django, "Borrador", status="draft")
+        make_post(self.design, "Colores")
+
+    def subtree_titles(self, category):
+        response = self.client.get(f"/api/blog/categories/{category.slug}/posts/")
+        self.assertEqual(response.status_code, 200)
+        return sorted(post["title"] for post in response.json()["results"])
+
+    def test_path_y_depth(self):
+        self.assertEqual(self.django.path, f"{self.programming.pk.hex}/{self.python.pk.hex}/{self.django.pk.hex}/")
+        self.assertEqual((self.programming.depth, self.django.depth), (0, 2))
+
+    def test_posts_del_subarbol(self):
+        self.assertEqual(self.subtree_titles(self.programming), ["General", "Listas", "Vistas"])
+        self.assertEqual(self.subtree_titles(self.python), ["Listas", "Vistas"])
+        self.assertEqual(self.client.get("/api/blog/categories/no-existe/posts/").status_code, 404)
+
+    def test_mover_una_categoria_mueve_su_subarbol(self):
+        self.python.parent = self.design
+        self.python.save()
+        self.django.refresh_from_db()
+        self.assertEqual(self.django.path, f"{self.design.pk.hex}/{self.python.pk.hex}/{self.django.pk.hex}/")
+        self.assertEqual(self.subtree_titles(self.design), ["Colores", "Listas", "Vistas"])
+        self.assertEqual(self.subtree_titles(self.programming), ["General"])
+
+    def test_no_puede_colgar_de_su_subarbol(self):
+        self.programming.parent = self.django
+        with self.assertRaises(ValidationError):
+            self.programming.clean()
+        with self.assertRaises(ValueError):
+            self.programming.save()
+
+    def test_arbol_con_recuentos(self):
+        response = self.client.get("/api/blog/categories/")
+        self.assertEqual(response.status_code, 200)
+        roots = {node["name"]: node for node in response.json()}
+        programming = roots["Programación"]
+        self.assertEqual((programming["post_count"], programming["total_post_count"]), (1, 3))
+        python = programming["children"][0]
+        self.assertEqual((python["name"], python["total_post_count"]), ("Python", 2))
+        self.assertEqual(python["children"][0]["post_count"], 1)  # El borrador no cuenta.
@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from .utils import make_category, make_post
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.post = make_post(make_category(), "Condicional")
+
+    def test_listado_responde_304_hasta_que_cambia_un_post(self):
+        response = self.client.get("/api/blog/posts/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)  # El estado incluye un COUNT.
+        etag = response["ETag"]
+        self.assertEqual(self.client.get("/api/blog/posts/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.post.title = "Condicional editado"
+        self.post.save()
+        self.assertEqual(self.client.get("/api/blog/posts/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_borrar_un_post_invalida_el_listado(self):
+        other = make_post(self.post.category, "Otro")
+        etag = self.client.get("/api/blog/posts/")["ETag"]
+        other.delete()
+        self.assertEqual(self.client.get("/api/blog/posts/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_el_etag_depende_de_la_url(self):
+        etag = self.client.get("/api/blog/posts/")["ETag"]
+        self.assertEqual(self.client.get("/api/blog/posts/?page_size=1", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_detalle_admite_if_modified_since(self):
+        url = f"/api/blog/posts/{self.post.slug}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
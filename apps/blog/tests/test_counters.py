@@ -0,0 +1,41 @@
+from django.test import TestCase
+
+from apps.blog.analytics import CounterBuffer
+from apps.blog.models import PostAnalytics, PostDailyStats, PostHourlyStats
+
+from .utils import make_category, make_post
+
+
+class CounterBufferTests(TestCase):
+    def setUp(self):
+        category = make_category()
+        self.first, self.second = make_post(category, "Uno"), make_post(category, "Dos")
+
+    def counters(self, post):
+        return PostAnalytics.objects.values_list("impressions", "clicks").get(post=post)
+
+    def test_acumula_hasta_volcar(self):
+        buffer = CounterBuffer(interval=60, max_size=100)
+        buffer._thread = object()  # Sin hilo de fondo: se vuelca a mano.
+        buffer.add([self.first.slug, self.second.slug], impressions=1)
+        buffer.add([self.first.slug], impressions=1)
+        buffer.add([self.first.slug], clicks=1)
+        self.assertEqual(self.counters(self.first), (0, 0))
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(self.counters(self.first), (2, 1))
+        self.assertEqual(self.counters(self.second), (1, 0))
+        self.assertEqual(buffer.flush(), 0)
+
+    def test_suma_a_los_rollups_de_la_hora_y_el_dia(self):
+        buffer = CounterBuffer(interval=0)
+        buffer.add([self.first.slug], impressions=1)
+        buffer.add([self.first.slug], impressions=1, clicks=1)
+        for model in (PostHourlyStats, PostDailyStats):
+            self.assertEqual(model.objects.values_list("impressions", "clicks").get(post=self.first), (2, 1))
+
+    def test_descarta_slugs_desconocidos_y_borradores(self):
+        draft = make_post(self.first.category, "Borrador", status="draft")
+        buffer = CounterBuffer(interval=0)
+        buffer.add(["no-existe", draft.slug], impressions=1)
+        self.assertEqual(self.counters(draft), (0, 0))
+        self.assertFalse(PostDailyStats.objects.exists())
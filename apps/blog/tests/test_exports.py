@@ -0,0 +1,49 @@
+import datetime
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.blog.models import Post, PostView
+
+from .utils import make_category, make_post
+
+
+class NdjsonExportTests(TestCase):
+    def setUp(self):
+        admin = get_user_model().objects.create_superuser("admin", "admin@example.com", "secreto")
+        self.client.force_login(admin)
+        category = make_category()
+        self.old = make_post(category, "Antiguo")
+        self.new = make_post(category, "Nuevo", status="draft")
+        self.yesterday = timezone.now() - datetime.timedelta(days=1)
+        Post.objects.filter(pk=self.old.pk).update(update_at=self.yesterday - datetime.timedelta(days=1))
+
+    def export(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        return [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+
+    def test_exporta_todos_los_posts(self):
+        rows = self.export("/api/blog/export/posts/")
+        self.assertEqual([row["title"] for row in rows], ["Antiguo", "Nuevo"])
+        self.assertEqual(rows[1]["status"], "draft")
+        self.assertEqual(rows[0]["category__slug"], self.old.category.slug)
+        self.assertEqual(rows[0]["id"], str(self.old.pk))
+
+    def test_since(self):
+        rows = self.export("/api/blog/export/posts/", since=self.yesterday.isoformat())
+        self.assertEqual([row["title"] for row in rows], ["Nuevo"])
+        response = self.client.get("/api/blog/export/posts/", {"since": "ayer"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_exporta_las_visitas(self):
+        PostView.objects.create(post=self.old, ip_address="203.0.113.1")
+        rows = self.export("/api/blog/export/views/")
+        self.assertEqual([(row["post_id"], row["ip_address"]) for row in rows], [(str(self.old.pk), "203.0.113.1")])
+
+    def test_solo_administradores(self):
+        self.client.logout()
+        self.assertEqual(self.client.get("/api/blog/export/posts/").status_code, 403)
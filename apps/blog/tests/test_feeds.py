@@ -0,0 +1,79 @@
+import xml.etree.ElementTree as ElementTree
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.curriculum.models import Perfil, Proyecto
+
+from .utils import make_category, make_post
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+SITEMAP = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+@override_settings(SITE_URL="https://example.com", BLOG_FEED_LIMIT=2)
+class FeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        category = make_category()
+        for title in ("Primero", "Segundo", "Tercero & <último>"):
+            make_post(category, title)
+        make_post(category, "Borrador", status="draft")
+
+    def get_xml(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, ElementTree.fromstring(b"".join(response.streaming_content))
+
+    def test_rss(self):
+        response, rss = self.get_xml("/api/blog/feed/rss/")
+        self.assertTrue(response["Content-Type"].startswith("application/rss+xml"))
+        titles = [item.findtext("title") for item in rss.iter("item")]
+        self.assertEqual(len(titles), 2)
+        self.assertIn("Tercero & <último>", titles)  # Escapado en el XML.
+        self.assertNotIn("Borrador", titles)
+        self.assertTrue(all(link.text.startswith("https://example.com/blog/") for link in rss.iter("link")))
+
+    def test_atom(self):
+        _, feed = self.get_xml("/api/blog/feed/atom/")
+        self.assertEqual(len(feed.findall(f"{ATOM}entry")), 2)
+        self.assertEqual(feed.find(f"{ATOM}link[@rel='self']").get("href"), "http://testserver/api/blog/feed/atom/")
+
+    def test_se_regenera_al_cambiar_un_post(self):
+        first = b"".join(self.client.get("/api/blog/feed/rss/").streaming_content)
+        self.assertEqual(b"".join(self.client.get("/api/blog/feed/rss/").streaming_content), first)
+        make_post(make_category("Django"), "Nuevo")
+        self.assertIn(b"Nuevo", b"".join(self.client.get("/api/blog/feed/rss/").streaming_content))
+
+
+@override_settings(SITE_URL="https://example.com")
+class SitemapTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        category = make_category()
+        self.post = make_post(category, "Publicado")
+        make_post(category, "Borrador", status="draft")
+        perfil = Perfil.objects.create(dni="00000000T", nombre="Ana", apellido_1="Pérez", email="ana@example.com")
+        self.proyecto = Proyecto.objects.create(nombre="Portfolio", descripcion="Web personal", perfil=perfil)
+
+    def locations(self):
+        response = self.client.get("/sitemap.xml")
+        self.assertEqual(response.status_code, 200)
+        sitemap = ElementTree.fromstring(b"".join(response.streaming_content))
+        return sorted(url.findtext(f"{SITEMAP}loc") for url in sitemap.iter(f"{SITEMAP}url"))
+
+    def test_solo_paginas_del_frontend(self):
+        self.assertEqual(self.locations(), [
+            f"https://example.com/blog/{self.post.slug}/",
+            f"https://example.com/proyectos/{self.proyecto.slug}/",
+        ])
+
+    def test_usa_la_url_canonica_si_existe(self):
+        Proyecto.objects.filter(pk=self.proyecto.pk).update(url_canonical="https://otro.example.com/portfolio/")
+        self.assertIn("https://otro.example.com/portfolio/", self.locations())
+
+    def test_responde_304(self):
+        etag = self.client.get("/sitemap.xml")["ETag"]
+        self.assertEqual(self.client.get("/sitemap.xml", HTTP_IF_NONE_MATCH=etag).status_code, 304)
@@ -0,0 +1,50 @@
+from django.test import SimpleTestCase, TestCase
+
+from apps.blog.headings import MAX_ID_LENGTH, anchor_headings
+from apps.blog.models import Heading
+
+from .utils import make_category, make_post
+
+
+class AnchorHeadingsTests(SimpleTestCase):
+    def test_anade_ids_unicos(self):
+        html, headings = anchor_headings("<h2>Introducción</h2><p>texto</p>\n<h3 class=\"x\">Introducción</h3>")
+        self.assertEqual(html, '<h2 id="introduccion">Introducción</h2><p>texto</p>\n<h3 id="introduccion-2" class="x">Introducción</h3>')
+        self.assertEqual(
+            [(heading["slug"], heading["level"], heading["order"]) for heading in headings],
+            [("introduccion", 2, 1), ("introduccion-2", 3, 2)],
+        )
+
+    def test_respeta_los_ids_existentes(self):
+        html = '<h2 id="mi-ancla">Título editado</h2><h2>Mi ancla</h2>'
+        html, headings = anchor_headings(html)
+        self.assertEqual([heading["slug"] for heading in headings], ["mi-ancla", "mi-ancla-2"])
+        self.assertIn('<h2 id="mi-ancla">Título editado</h2>', html)
+
+    def test_sustituye_un_id_vacio_sin_duplicarlo(self):
+        for tag in ('<h2 id="">', "<h2 ID=''>", "<h2 id>", '<h2 class="x" id="" data-id="y">'):
+            with self.subTest(tag=tag):
+                html, headings = anchor_headings(f"{tag}Hola</h2>")
+                self.assertEqual(html.lower().count(" id="), 1)
+                self.assertIn('id="hola"', html)
+                self.assertEqual(headings[0]["slug"], "hola")
+
+    def test_recorta_los_ids_demasiado_largos(self):
+        long_id = "a" * 300
+        html, headings = anchor_headings(f'<h2 id="{long_id}">Largo</h2>')
+        self.assertLessEqual(len(headings[0]["slug"]), MAX_ID_LENGTH)
+        self.assertEqual(html, f'<h2 id="{headings[0]["slug"]}">Largo</h2>')
+
+    def test_ignora_encabezados_vacios_e_ids_repetidos(self):
+        _, headings = anchor_headings('<h2> </h2><h2 id="a">Uno</h2><h2 id="a">Dos</h2>')
+        self.assertEqual([heading["title"] for heading in headings], ["Uno"])
+
+
+class PostHeadingsTests(TestCase):
+    def test_se_guardan_con_el_post(self):
+        post = make_post(make_category(), "Uno", content=f'<h2 id="">Intro</h2><h3 id="{"b" * 300}">Detalle</h3>')
+        self.assertIn('<h2 id="intro">', post.content)
+        response = self.client.get(f"/api/blog/post/{post.slug}/headings/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([heading["slug"] for heading in response.json()][0], "intro")
+        self.assertEqual(Heading.objects.filter(post=post).count(), 2)
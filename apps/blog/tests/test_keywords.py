@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from apps.blog.keywords import parse_keywords, parse_tags
+from apps.blog.models import PostKeyword
+
+from .utils import make_category, make_post
+
+
+class KeywordIndexTests(TestCase):
+    def setUp(self):
+        category = make_category()
+        self.orm = make_post(category, "ORM", keywords="Django, ORM; Bases de datos")
+        self.views = make_post(category, "Vistas", keywords="django\nvistas")
+        self.flask = make_post(category, "Flask", keywords="flask, orm")
+        make_post(category, "Borrador", status="draft", keywords="django, orm")
+
+    def tagged(self, *tags, match=None):
+        params = {"tag": list(tags)}
+        if match:
+            params["match"] = match
+        response = self.client.get("/api/blog/posts/", params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(post["title"] for post in response.json()["results"]), response.json()["tags"]
+
+    def test_normaliza_las_palabras_clave(self):
+        self.assertEqual(parse_keywords("Educación,  educacion ; Bases  de datos"), {
+            "educacion": "Educación", "bases-de-datos": "Bases de datos",
+        })
+        self.assertEqual(parse_tags(["Django", "django", "", "ORM"]), ["django", "orm"])
+
+    def test_mantiene_el_indice_al_editar(self):
+        self.orm.keywords = "django, sql"
+        self.orm.save()
+        self.assertEqual(
+            sorted(PostKeyword.objects.filter(post=self.orm).values_list("keyword__slug", flat=True)),
+            ["django", "sql"],
+        )
+
+    def test_todas_las_etiquetas(self):
+        titles, counts = self.tagged("django", "orm")
+        self.assertEqual(titles, ["ORM"])
+        self.assertEqual(counts, {"django": 2, "orm": 2})  # Los borradores no cuentan.
+
+    def test_alguna_etiqueta(self):
+        titles, _ = self.tagged("Vistas", "flask", match="any")
+        self.assertEqual(titles, ["Flask", "Vistas"])
+
+    def test_etiqueta_desconocida_y_match_invalido(self):
+        self.assertEqual(self.tagged("no-existe"), ([], {"no-existe": 0}))
+        self.assertEqual(self.client.get("/api/blog/posts/", {"tag": "orm", "match": "some"}).status_code, 400)
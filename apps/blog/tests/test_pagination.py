@@ -0,0 +1,33 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.blog.models import Post
+
+from .utils import make_category, make_post
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        category = make_category()
+        created_at = timezone.now()
+        self.posts = [make_post(category, f"Post {number}") for number in range(5)]
+        make_post(category, "Borrador", status="draft")
+        # Tres posts con la misma fecha: el cursor tiene que desempatar por id.
+        for number, post in enumerate(self.posts):
+            post.created_at = created_at - datetime.timedelta(minutes=min(number, 2))
+            Post.objects.filter(pk=post.pk).update(created_at=post.created_at)
+
+    def test_recorre_todas_las_paginas_sin_repetir(self):
+        url, slugs = "/api/blog/posts/?page_size=2", []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            slugs += [post["slug"] for post in response.json()["results"]]
+            url = response.json()["next"]
+        expected = sorted(self.posts, key=lambda post: (post.created_at, post.pk), reverse=True)
+        self.assertEqual(slugs, [post.slug for post in expected])
+
+    def test_cursor_invalido(self):
+        self.assertEqual(self.client.get("/api/blog/posts/?cursor=no-es-un-cursor").status_code, 404)
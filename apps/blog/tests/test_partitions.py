@@ -0,0 +1,52 @@
+import datetime
+import gzip
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from apps.blog.partitions import (
+    PARTITION_NAME, add_months, create_partition_sql, ensure_partitions, expired_partitions,
+    month_start, open_archive, partition_name,
+)
+
+
+class PartitionHelpersTests(SimpleTestCase):
+    def test_meses(self):
+        self.assertEqual(month_start(datetime.date(2024, 2, 29)), datetime.date(2024, 2, 1))
+        self.assertEqual(add_months(datetime.date(2024, 11, 1), 3), datetime.date(2025, 2, 1))
+        self.assertEqual(add_months(datetime.date(2024, 1, 1), -1), datetime.date(2023, 12, 1))
+
+    def test_nombre_de_particion(self):
+        name = partition_name(datetime.date(2024, 3, 1))
+        self.assertEqual(name, "blog_postview_p202403")
+        self.assertEqual(PARTITION_NAME.match(name).group("table", "year", "month"), ("blog_postview", "2024", "03"))
+
+    def test_sql_de_particion(self):
+        sql = create_partition_sql(datetime.date(2024, 12, 1))
+        self.assertIn("FROM ('2024-12-01 00:00:00+00') TO ('2025-01-01 00:00:00+00')", sql)
+
+    def test_particiones_caducadas(self):
+        partitions = [(datetime.date(2024, month, 1), f"blog_postview_p2024{month:02}") for month in (1, 2, 3, 4)]
+        with mock.patch("apps.blog.partitions.list_partitions", return_value=partitions):
+            expired = expired_partitions(2, today=datetime.date(2024, 4, 15))
+        self.assertEqual([name for _, name in expired], ["blog_postview_p202401"])
+
+    def test_archivo_gzip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "views.ndjson.gz")
+            with open_archive(path, "gzip") as archive:
+                archive.write('{"id": 1}\n')
+            with gzip.open(path, "rt", encoding="utf-8") as archive:
+                self.assertEqual(archive.read(), '{"id": 1}\n')
+        with self.assertRaises(ValueError):
+            open_archive(path, "bzip2")
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "Solo SQLite usa la tabla sin particionar.")
+class PartitionsOnSqliteTests(TestCase):
+    def test_sin_postgresql_no_hace_nada(self):
+        self.assertEqual(ensure_partitions(), [])
@@ -0,0 +1,73 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.blog.models import PostDailyStats
+from apps.blog.post_list import PostListRefresher
+from apps.blog.rollups import bucket_starts
+
+from .utils import make_category, make_post
+
+
+class PostSummaryListViewTests(TestCase):
+    url = "/api/blog/posts/summary/"
+
+    def setUp(self):
+        category = make_category()
+        self.post = make_post(category, "Uno", content="<p>uno dos tres</p>")
+        make_post(category, "Borrador", status="draft")
+        PostDailyStats.objects.create(post=self.post, start=bucket_starts(timezone.now())[1], views=4)
+
+    def test_lista_los_publicados_sin_contenido(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        [entry] = response.json()["results"]
+        self.assertEqual((entry["title"], entry["category"]["name"], entry["view_count"]), ("Uno", "Python", 4))
+        self.assertNotIn("content", entry)
+
+    def test_responde_304_hasta_que_cambia_un_post(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.post.title = "Uno editado"
+        self.post.save()
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class RefreshOnSaveTests(TestCase):
+    def setUp(self):
+        patches = (
+            mock.patch("apps.blog.post_list.is_materialized", return_value=True),
+            mock.patch("apps.blog.post_list.refresh_post_list"),
+        )
+        _, self.refresh = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def test_guardar_o_borrar_refresca_al_confirmar(self):
+        category = make_category()
+        with self.settings(POST_LIST_REFRESH_DELAY=0):
+            with self.captureOnCommitCallbacks(execute=True):
+                post = make_post(category, "Uno")
+                self.refresh.assert_not_called()
+            self.assertEqual(self.refresh.call_count, 1)
+            with self.captureOnCommitCallbacks(execute=True):
+                post.delete()
+                category.save()
+            self.assertEqual(self.refresh.call_count, 3)
+
+
+class PostListRefresherTests(SimpleTestCase):
+    @mock.patch("apps.blog.post_list.refresh_post_list")
+    @mock.patch("apps.blog.post_list.threading.Timer")
+    def test_una_rafaga_de_cambios_refresca_una_vez(self, timer, refresh):
+        refresher = PostListRefresher(delay=10)
+        for _ in range(5):
+            refresher._committed()
+        timer.assert_called_once_with(10, refresher._run)
+        refresh.assert_not_called()
+        refresher._run()
+        refresh.assert_called_once_with()
+        # Lo que se confirma después del refresco programa otro.
+        refresher._committed()
+        self.assertEqual(timer.call_count, 2)
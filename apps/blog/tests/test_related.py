@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.blog.models import RelatedPost
+from apps.blog.related import TfidfIndex, post_terms, rebuild_related_posts, related_index
+
+from .utils import make_category, make_post
+
+
+class TfidfIndexTests(SimpleTestCase):
+    def test_vecinos_por_similitud(self):
+        index = TfidfIndex([
+            ("orm", post_terms("Consultas con el ORM", "django, orm", "<p>Modelos y consultas</p>")),
+            ("vistas", post_terms("Vistas de Django", "django", "<p>Vistas y plantillas</p>")),
+            ("consultas", post_terms("Optimizar consultas", "orm, sql", "<p>Consultas lentas</p>")),
+            ("cocina", post_terms("Recetas", "cocina", "<p>Tortilla de patatas</p>")),
+        ])
+        neighbours = index.neighbours(index.position["orm"], 3)
+        self.assertEqual([post_id for post_id, _ in neighbours], ["consultas", "vistas"])
+        self.assertTrue(all(0 < score <= 1 for _, score in neighbours))
+
+    def test_replace_cambia_solo_una_fila(self):
+        index = TfidfIndex([("a", post_terms("Django", "", "")), ("b", post_terms("Flask", "", ""))])
+        index.replace({"b": post_terms("Django", "", ""), "c": None})
+        self.assertEqual([post_id for post_id, _ in index.neighbours(index.position["a"], 5)], ["b"])
+
+
+@override_settings(BLOG_SNAPSHOT_BASE_URL="http://testserver", RELATED_POSTS_COUNT=2)
+class RelatedPostsTests(TestCase):
+    def setUp(self):
+        related_index.reset()
+        self.addCleanup(related_index.reset)
+        category = make_category()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.orm = make_post(category, "Consultas con el ORM", keywords="django, orm")
+            self.queries = make_post(category, "Optimizar consultas del ORM", keywords="orm, sql")
+            self.cooking = make_post(category, "Recetas de cocina", keywords="cocina")
+
+    def related_slugs(self, post):
+        response = self.client.get(f"/api/blog/posts/{post.slug}/")
+        self.assertEqual(response.status_code, 200)
+        return [related["slug"] for related in response.json()["related"]]
+
+    def test_el_detalle_incluye_los_relacionados(self):
+        self.assertEqual(self.related_slugs(self.orm), [self.queries.slug])
+        self.assertEqual(rebuild_related_posts(), RelatedPost.objects.count())
+        self.assertEqual(self.related_slugs(self.orm), [self.queries.slug])
+
+    def test_despublicar_quita_el_post_de_las_listas(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queries.status = "draft"
+            self.queries.save()
+        self.assertEqual(self.related_slugs(self.orm), [])
+
+    def test_solo_recalcula_si_cambia_el_texto(self):
+        with mock.patch("apps.blog.signals.update_related_posts", return_value=set()) as update:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.orm.description = "Otra descripción"
+                self.orm.save()
+            update.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.orm.keywords = "django, orm, postgres"
+                self.orm.save()
+            update.assert_called_once_with(self.orm.pk)
+
+    def test_la_descripcion_nueva_llega_a_los_que_lo_enlazan(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.queries.description = "Índices y EXPLAIN"
+            self.queries.save()
+        related = self.client.get(f"/api/blog/posts/{self.orm.slug}/").json()["related"]
+        self.assertEqual(related[0]["description"], "Índices y EXPLAIN")
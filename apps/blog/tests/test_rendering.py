@@ -0,0 +1,50 @@
+import os
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps as global_apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from apps.blog.models import Post
+from apps.blog.rendering import render_content
+
+from .utils import make_category, make_post
+
+
+class RenderContentTests(SimpleTestCase):
+    def test_imagenes_diferidas(self):
+        html = render_content('<p><img src="https://example.com/a.png" alt="A"></p>')["content_html"]
+        self.assertEqual(html, '<p><img src="https://example.com/a.png" alt="A" loading="lazy" decoding="async"></p>')
+        html = render_content('<img src="/a.png" loading="eager" width="10">')["content_html"]
+        self.assertEqual(html, '<img src="/a.png" loading="eager" width="10" decoding="async">')
+
+    def test_minifica_sin_tocar_nbsp_ni_pre(self):
+        html = render_content("<p>Hola\n\n   mundo&nbsp;&nbsp;!</p><!-- nota --><pre>a\n  b</pre>")["content_html"]
+        self.assertEqual(html, "<p>Hola mundo&nbsp;&nbsp;!</p><pre>a\n  b</pre>")
+
+    def test_extracto_palabras_y_tiempo_de_lectura(self):
+        derived = render_content("<h2>Título</h2><p>uno&nbsp;dos</p><script>no cuenta</script>" + "<p>palabra</p>" * 400)
+        self.assertTrue(derived["excerpt"].startswith("Título uno dos palabra"))
+        self.assertLessEqual(len(derived["excerpt"]), 300)
+        self.assertEqual((derived["word_count"], derived["reading_time"]), (403, 3))
+        self.assertEqual(render_content("")["reading_time"], 1)
+
+
+class RenderExistingPostsTests(TestCase):
+    def setUp(self):
+        self.post = make_post(make_category(), "Uno", content='<p>Hola   <img src="/a.png"></p>')
+        Post.objects.filter(pk=self.post.pk).update(content_html="", excerpt="", word_count=0)
+
+    def test_la_migracion_rellena_lo_minimo(self):
+        migration = import_module("apps.blog.migrations.0018_post_derived_content")
+        migration.render_existing_posts(global_apps, SimpleNamespace(connection=connection))
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual((post.content_html, post.excerpt, post.word_count), (post.content, "Hola", 1))
+
+    def test_el_comando_aplica_el_render_completo(self):
+        call_command("render_posts", chunk_size=1, stdout=open(os.devnull, "w"))
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual(post.content_html, render_content(post.content)["content_html"])
+        self.assertIn('loading="lazy"', post.content_html)
@@ -0,0 +1,67 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.blog.models import PostDailyStats, PostHourlyStats, PostView
+from apps.blog.rollups import bucket_starts, rollup_views, views_watermark
+
+from .utils import make_category, make_post
+
+
+class RollupViewsTests(TestCase):
+    def setUp(self):
+        self.post = make_post(make_category(), "Uno")
+        # Las 10:00 de ayer: lejos de medianoche y fuera de la ventana de retraso.
+        self.hour = bucket_starts(timezone.now() - datetime.timedelta(days=1))[1] + datetime.timedelta(hours=10)
+
+    def view(self, moment):
+        view = PostView.objects.create(post=self.post, ip_address="203.0.113.1")
+        PostView.objects.filter(pk=view.pk).update(timestamp=moment)  # `timestamp` es `auto_now_add`.
+
+    def test_agrega_por_hora_y_por_dia(self):
+        self.view(self.hour + datetime.timedelta(minutes=5))
+        self.view(self.hour + datetime.timedelta(minutes=50))
+        self.view(self.hour + datetime.timedelta(minutes=65))
+        self.assertEqual(rollup_views(), 3)
+        self.assertEqual(
+            list(PostHourlyStats.objects.filter(post=self.post).order_by("start").values_list("start", "views")),
+            [(self.hour, 2), (self.hour + datetime.timedelta(hours=1), 1)],
+        )
+        self.assertEqual(PostDailyStats.objects.get(post=self.post).views, 3)
+
+    def test_la_marca_evita_contar_dos_veces(self):
+        self.view(self.hour)
+        until = self.hour + datetime.timedelta(minutes=30)
+        self.assertEqual(rollup_views(until), 1)
+        self.assertEqual(views_watermark(), until)
+        self.assertEqual(rollup_views(until), 0)
+        self.view(self.hour + datetime.timedelta(minutes=45))
+        self.assertEqual(rollup_views(), 1)
+        self.assertEqual(PostHourlyStats.objects.get(post=self.post).views, 2)
+
+    def test_no_agrega_las_visitas_de_la_ventana_de_retraso(self):
+        self.view(timezone.now())
+        with self.settings(ANALYTICS_ROLLUP_LAG=600):
+            self.assertEqual(rollup_views(), 0)
+        self.assertFalse(PostHourlyStats.objects.exists())
+
+
+class PostStatsViewTests(TestCase):
+    def setUp(self):
+        self.post = make_post(make_category(), "Uno")
+        self.url = f"/api/blog/posts/{self.post.slug}/stats/"
+        hour, day = bucket_starts(timezone.now())
+        PostHourlyStats.objects.create(post=self.post, start=hour, views=2, impressions=5, clicks=1)
+        PostDailyStats.objects.create(post=self.post, start=day, views=4, impressions=9, clicks=2)
+
+    def test_serie_diaria_y_horaria(self):
+        series = self.client.get(self.url).json()["series"]
+        self.assertEqual([(row["views"], row["impressions"], row["clicks"]) for row in series], [(4, 9, 2)])
+        series = self.client.get(self.url, {"bucket": "hour"}).json()["series"]
+        self.assertEqual([row["views"] for row in series], [2])
+
+    def test_errores(self):
+        self.assertEqual(self.client.get(self.url, {"bucket": "week"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"from": "2024-02-10", "to": "2024-02-01"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/blog/posts/no-existe/stats/").status_code, 404)
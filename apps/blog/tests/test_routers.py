@@ -0,0 +1,95 @@
+from importlib import import_module
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.blog.feeds import feed_posts
+from apps.blog.models import Post, PostAnalytics, PostView
+from apps.blog.views import RssFeedView
+from core.middleware import ReplicaReadsMiddleware
+from core.routers import DatabaseRouter, use_replica
+
+from .utils import make_category, make_post
+
+# Bases de datos con los alias opcionales (el router solo mira los nombres).
+ALL_DATABASES = {**settings.DATABASES, "analytics": {}, "replica": {}}
+
+
+class DatabaseRouterTests(SimpleTestCase):
+    router = DatabaseRouter()
+
+    def setUp(self):
+        self.addCleanup(use_replica.reset, use_replica.set(False))
+
+    def test_sin_alias_opcionales_todo_va_a_default(self):
+        use_replica.set(True)
+        for model in (Post, PostView):
+            self.assertEqual(self.router.db_for_read(model), "default")
+            self.assertEqual(self.router.db_for_write(model), "default")
+
+    @override_settings(DATABASES=ALL_DATABASES)
+    def test_analitica_lee_y_escribe_en_analytics(self):
+        use_replica.set(True)
+        for model in (PostView, PostAnalytics):
+            self.assertEqual(self.router.db_for_read(model), "analytics")
+            self.assertEqual(self.router.db_for_write(model), "analytics")
+
+    @override_settings(DATABASES=ALL_DATABASES)
+    def test_replica_solo_en_lecturas_marcadas(self):
+        self.assertEqual(self.router.db_for_read(Post), "default")
+        use_replica.set(True)
+        self.assertEqual(self.router.db_for_read(Post), "replica")
+        self.assertEqual(self.router.db_for_write(Post), "default")
+
+    def test_allow_migrate_excluye_replica(self):
+        self.assertTrue(self.router.allow_migrate("default", "blog", model_name="post"))
+        self.assertTrue(self.router.allow_migrate("analytics", "blog", model_name="postview"))
+        self.assertFalse(self.router.allow_migrate("replica", "blog", model_name="post"))
+
+
+class ReplicaReadsMiddlewareTests(SimpleTestCase):
+    def seen_flag(self, method, path):
+        seen = []
+        middleware = ReplicaReadsMiddleware(lambda request: seen.append(use_replica.get()))
+        middleware(RequestFactory().generic(method, path))
+        return seen[0]
+
+    def test_marca_lecturas_de_la_api(self):
+        self.assertTrue(self.seen_flag("GET", "/api/blog/posts/"))
+        self.assertTrue(self.seen_flag("HEAD", "/api/blog/posts/"))
+
+    def test_no_marca_escrituras_ni_fuera_de_la_api(self):
+        self.assertFalse(self.seen_flag("POST", "/api/blog/events/"))
+        self.assertFalse(self.seen_flag("GET", "/admin/"))
+
+    def test_restaura_el_valor_al_terminar(self):
+        self.seen_flag("GET", "/api/blog/posts/")
+        self.assertFalse(use_replica.get())
+
+    @override_settings(DATABASES=ALL_DATABASES)
+    def test_las_respuestas_por_trozos_fijan_la_replica(self):
+        # El feed se genera después de que el middleware quite la marca.
+        chunks = mock.Mock(return_value=iter(()))
+        with mock.patch.object(RssFeedView, "chunks", staticmethod(chunks)), \
+                mock.patch.object(RssFeedView, "get_conditional_state", return_value=None):
+            ReplicaReadsMiddleware(RssFeedView.as_view())(RequestFactory().get("/api/blog/feed/rss/"))
+        self.assertEqual(chunks.call_args.kwargs["using"], "replica")
+        self.assertEqual(feed_posts(using="replica").db, "replica")
+
+
+class BackfillPostAnalyticsTests(TestCase):
+    def test_crea_las_filas_que_faltan(self):
+        category = make_category()
+        first, second = make_post(category, "Uno"), make_post(category, "Dos")
+        PostAnalytics.objects.filter(post=second).delete()
+        migration = import_module("apps.blog.migrations.0022_backfill_postanalytics")
+        schema_editor = SimpleNamespace(connection=connection)
+        migration.backfill_post_analytics(global_apps, schema_editor)
+        migration.backfill_post_analytics(global_apps, schema_editor)
+        self.assertEqual(
+            sorted(PostAnalytics.objects.values_list("post_id", flat=True)), sorted([first.pk, second.pk]),
+        )
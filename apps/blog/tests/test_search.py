@@ -0,0 +1,40 @@
+import unittest
+
+from django.db import connection
+from django.test import TestCase
+
+from .utils import make_category, make_post
+
+
+class PostSearchViewTests(TestCase):
+    url = "/api/blog/search/"
+
+    def setUp(self):
+        category = make_category()
+        make_post(category, "Consultas con el ORM de Django", keywords="django, orm")
+        make_post(category, "Educación financiera", content="<p>Presupuestos y ahorro con Django</p>")
+        make_post(category, "Borrador sobre Django", status="draft")
+
+    def titles(self, text, **params):
+        response = self.client.get(self.url, {"q": text, **params})
+        self.assertEqual(response.status_code, 200)
+        return [post["title"] for post in response.json()]
+
+    def test_solo_posts_publicados(self):
+        self.assertNotIn("Borrador sobre Django", self.titles("django"))
+        self.assertEqual(self.titles("orm"), ["Consultas con el ORM de Django"])
+
+    def test_limit(self):
+        self.assertEqual(len(self.titles("django", limit=1)), 1)
+
+    def test_errores(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"q": "django", "limit": "todos"}).status_code, 400)
+
+    @unittest.skipUnless(connection.vendor == "postgresql", "Búsqueda a texto completo solo en PostgreSQL.")
+    def test_ranking_sin_acentos_y_fragmento(self):
+        # El título pesa más que el contenido y "educacion" encuentra "Educación".
+        self.assertEqual(self.titles("django"), ["Consultas con el ORM de Django", "Educación financiera"])
+        response = self.client.get(self.url, {"q": "educacion"})
+        self.assertEqual([post["title"] for post in response.json()], ["Educación financiera"])
+        self.assertIn("<mark>", self.client.get(self.url, {"q": "ahorro"}).json()[0]["headline"])
@@ -0,0 +1,42 @@
+import gzip
+import json
+
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from apps.blog.models import Heading, PostSnapshot
+from apps.blog.snapshots import detail_queryset, render_post_detail, snapshot_request
+
+from .utils import make_category, make_post
+
+
+@override_settings(BLOG_SNAPSHOT_BASE_URL="http://testserver")
+class SnapshotTests(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post = make_post(make_category(), "Snapshot", content="<h2>Uno</h2><p>texto</p>")
+
+    def stored_body(self):
+        return json.loads(PostSnapshot.objects.get(post=self.post).body)
+
+    def test_guarda_el_mismo_json_que_el_serializador(self):
+        post = detail_queryset().get(pk=self.post.pk)
+        expected = json.loads(JSONRenderer().render(render_post_detail(post, snapshot_request())))
+        self.assertEqual(self.stored_body(), expected)
+
+    def test_lleva_los_encabezados_nuevos_tras_editar(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.content = "<h2>Dos</h2><h3>Tres</h3>"
+            self.post.save()
+        self.assertEqual([heading["slug"] for heading in self.stored_body()["headings"]], ["dos", "tres"])
+        self.assertEqual(list(Heading.objects.filter(post=self.post).values_list("slug", flat=True)), ["dos", "tres"])
+
+    def test_sirve_los_bytes_guardados(self):
+        snapshot = PostSnapshot.objects.get(post=self.post)
+        url = f"/api/blog/posts/{self.post.slug}/"
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), bytes(snapshot.body))
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(response.content, bytes(snapshot.body))
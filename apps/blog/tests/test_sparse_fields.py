@@ -0,0 +1,42 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .utils import make_category, make_post
+
+
+class SparseFieldsTests(TestCase):
+    url = "/api/blog/posts/"
+
+    def setUp(self):
+        self.post = make_post(make_category(), "Uno", content="<h2>Intro</h2><p>Contenido largo</p>")
+
+    def first_result(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        # La consulta de la página es la que ordena por el cursor.
+        post_query = next(query["sql"] for query in queries.captured_queries if "ORDER BY" in query["sql"] and 'FROM "blog_post"' in query["sql"])
+        return response.json()["results"][0], post_query
+
+    def test_el_listado_no_lee_ni_envia_el_contenido(self):
+        post, sql = self.first_result()
+        self.assertNotIn("content", post)
+        self.assertIn("slug", post)
+        self.assertNotIn('"blog_post"."content"', sql)
+
+    def test_el_contenido_se_pide_con_fields(self):
+        post, sql = self.first_result(fields="slug,content")
+        self.assertEqual(set(post), {"slug", "content"})
+        self.assertIn("Contenido largo", post["content"])
+        self.assertIn('"blog_post"."content"', sql)
+
+    def test_fields_restringe_columnas_y_expand_anade_relaciones(self):
+        post, sql = self.first_result(fields="title,category", expand="headings")
+        self.assertEqual(set(post), {"title", "category", "headings"})
+        self.assertEqual([heading["slug"] for heading in post["headings"]], ["intro"])
+        self.assertNotIn('"blog_post"."description"', sql)
+
+    def test_el_detalle_sigue_incluyendo_el_contenido(self):
+        response = self.client.get(f"/api/blog/posts/{self.post.slug}/", {"fields": "title,content"})
+        self.assertEqual(set(response.json()), {"title", "content"})
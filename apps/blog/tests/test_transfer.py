@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.blog.models import Category, Heading, Post, PostAnalytics
+from apps.blog.transfer import export_lines, import_lines
+
+from .utils import make_category, make_post
+
+
+class ImportRoundTripTests(TestCase):
+    def setUp(self):
+        parent = make_category("Programación")
+        child = Category.objects.create(name="Django", parent=parent)
+        make_post(parent, "Primero", content="<h2>Intro</h2><p>uno</p>")
+        make_post(child, "Segundo", status="draft", keywords="django, orm")
+
+    def test_exportar_e_importar_deja_lo_mismo(self):
+        lines = list(export_lines())
+        Post.objects.all().delete()
+        Category.objects.filter(parent__isnull=False).delete()
+        Category.objects.all().delete()
+        categories, post_ids = import_lines(lines)
+        self.assertEqual((categories, len(post_ids)), (2, 2))
+        self.assertEqual(list(export_lines()), lines)
+        self.assertEqual(list(Heading.objects.values_list("slug", flat=True)), ["intro"])
+        self.assertEqual(PostAnalytics.objects.count(), 2)
+
+    def test_importar_dos_veces_no_duplica(self):
+        lines = list(export_lines())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "blog.jsonl")
+            with open(path, "w", encoding="utf-8") as output:
+                output.writelines(lines)
+            call_command("import_blog", path, stdout=open(os.devnull, "w"))
+            call_command("import_blog", path, stdout=open(os.devnull, "w"))
+        self.assertEqual((Category.objects.count(), Post.objects.count()), (2, 2))
+        self.assertEqual(list(export_lines()), lines)
+
+
+class ImportValidationTests(TestCase):
+    def setUp(self):
+        make_post(make_category(), "Primero")
+        self.lines = list(export_lines())
+
+    def import_with(self, kind, **changes):
+        lines = []
+        for line in self.lines:
+            record = json.loads(line)
+            if record["type"] == kind:
+                record.update(changes)
+                record = {field: value for field, value in record.items() if value is not None}
+            lines.append(json.dumps(record) + "\n")
+        return import_lines(lines)
+
+    def test_falta_un_campo_obligatorio(self):
+        with self.assertRaisesRegex(ValueError, r"Línea 2: faltan los campos created_at, status"):
+            self.import_with("post", created_at=None, status=None)
+
+    def test_categoria_sin_fecha(self):
+        with self.assertRaisesRegex(ValueError, r"Línea 1: faltan los campos created_at"):
+            self.import_with("category", created_at=None)
+
+    def test_estado_desconocido(self):
+        with self.assertRaisesRegex(ValueError, r"Línea 2: estado `publicado` no válido"):
+            self.import_with("post", status="publicado")
+
+
+class ImportReparentTests(TestCase):
+    def setUp(self):
+        self.old_parent = make_category("Programación")
+        self.new_parent = make_category("Backend")
+        self.moved = Category.objects.create(name="Python", parent=self.old_parent)
+        self.child = Category.objects.create(name="Django", parent=self.moved)
+        self.grandchild = Category.objects.create(name="ORM", parent=self.child)
+
+    def category_line(self, category, parent):
+        record = json.loads(next(line for line in export_lines() if json.loads(line).get("slug") == category.slug))
+        record["parent"] = parent.slug if parent else None
+        return json.dumps(record) + "\n"
+
+    def test_cambiar_de_padre_reescribe_las_subcategorias(self):
+        import_lines([self.category_line(self.moved, self.new_parent)])
+        for category in (self.moved, self.child, self.grandchild):
+            category.refresh_from_db()
+        self.assertEqual(self.moved.path, f"{self.new_parent.pk.hex}/{self.moved.pk.hex}/")
+        self.assertEqual(self.child.path, f"{self.moved.path}{self.child.pk.hex}/")
+        self.assertEqual(self.grandchild.path, f"{self.child.path}{self.grandchild.pk.hex}/")
+        self.assertEqual((self.moved.depth, self.child.depth, self.grandchild.depth), (1, 2, 3))
+
+    def test_mover_dos_niveles_a_la_vez(self):
+        import_lines([
+            self.category_line(self.moved, None),
+            self.category_line(self.child, self.new_parent),
+        ])
+        self.grandchild.refresh_from_db()
+        self.child.refresh_from_db()
+        self.assertEqual(self.child.path, f"{self.new_parent.pk.hex}/{self.child.pk.hex}/")
+        self.assertEqual(self.grandchild.path, f"{self.child.path}{self.grandchild.pk.hex}/")
+        self.assertEqual(self.grandchild.depth, 2)
+
+    def test_no_puede_colgar_de_una_subcategoria(self):
+        with self.assertRaisesRegex(ValueError, "no puede colgar"):
+            import_lines([self.category_line(self.moved, self.grandchild)])
@@ -0,0 +1,53 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.blog.models import AnalyticsWatermark, PostAnalytics
+from apps.blog.trending import TRENDING_EPOCH, decay_factor, event_score, locked_growth
+
+from .utils import make_category, make_post
+
+
+class TrendingScoreTests(TestCase):
+    def test_los_eventos_recientes_pesan_mas(self):
+        now = timezone.now()
+        AnalyticsWatermark.objects.create(name=TRENDING_EPOCH, value=now)
+        with self.settings(ANALYTICS_TRENDING_HALF_LIFE=24):
+            self.assertAlmostEqual(locked_growth(now + datetime.timedelta(hours=24)), 2.0)
+            self.assertAlmostEqual(decay_factor(now + datetime.timedelta(hours=48)), 0.25)
+
+    def test_peso_de_cada_evento(self):
+        self.assertEqual(event_score(clicks=1, views=2), 3.0)
+        self.assertAlmostEqual(event_score(impressions=10), 1.0)
+
+
+class TrendingPostListViewTests(TestCase):
+    url = "/api/blog/posts/trending/"
+
+    def setUp(self):
+        self.category = make_category()
+
+    def post_with_score(self, title, score, status="published"):
+        post = make_post(self.category, title, status=status)
+        PostAnalytics.objects.filter(post=post).update(trending_score=score)
+        return post
+
+    def test_ordena_por_puntuacion(self):
+        self.post_with_score("Tibio", 5)
+        self.post_with_score("Caliente", 10)
+        self.post_with_score("Frio", 0)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post["title"] for post in response.json()], ["Caliente", "Tibio"])
+
+    def test_los_no_publicados_no_ocupan_hueco(self):
+        for n in range(5):
+            self.post_with_score(f"Borrador {n}", 100 + n, status="draft")
+        self.post_with_score("Primero", 20)
+        self.post_with_score("Segundo", 10)
+        response = self.client.get(self.url, {"limit": 2})
+        self.assertEqual([post["title"] for post in response.json()], ["Primero", "Segundo"])
+
+    def test_limit_invalido(self):
+        self.assertEqual(self.client.get(self.url, {"limit": "diez"}).status_code, 400)
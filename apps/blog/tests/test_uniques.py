@@ -0,0 +1,62 @@
+import datetime
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.blog.analytics import ViewBuffer
+from apps.blog.hll import HyperLogLog
+from apps.blog.models import PostUniqueVisitors
+
+from .utils import make_category, make_post
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_estima_con_poco_error(self):
+        hll = HyperLogLog()
+        for n in range(10_000):
+            hll.add(f"10.0.{n // 256}.{n % 256}")
+        self.assertAlmostEqual(hll.count(), 10_000, delta=500)
+
+    def test_fusionar_no_cuenta_dos_veces(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        for n in range(1000):
+            first.add(str(n))
+            second.add(str(n + 500))
+        first.merge(HyperLogLog.from_bytes(second.to_bytes()))
+        self.assertAlmostEqual(first.count(), 1500, delta=100)
+
+
+class PostUniqueVisitorsTests(TestCase):
+    def setUp(self):
+        self.post = make_post(make_category(), "Uno")
+        self.url = f"/api/blog/posts/{self.post.slug}/uniques/"
+
+    def visit(self, day, *ips):
+        buffer = ViewBuffer(interval=60, dedupe_window=60)
+        buffer._thread = object()  # Sin hilo de fondo: se vuelca a mano.
+        with mock.patch("apps.blog.analytics.timezone.localdate", return_value=day):
+            for ip in ips:
+                buffer.add([self.post.slug], ip)
+        buffer.flush()
+
+    def test_cuenta_visitantes_distintos_del_rango(self):
+        today = timezone.localdate()
+        yesterday = today - datetime.timedelta(days=1)
+        self.visit(yesterday, "203.0.113.1", "203.0.113.2")
+        self.visit(today, "203.0.113.2", "203.0.113.3")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["unique_visitors"], 3)
+        response = self.client.get(self.url, {"from": today.isoformat(), "to": today.isoformat()})
+        self.assertEqual(response.json()["unique_visitors"], 2)
+
+    def test_la_visita_cuenta_en_el_dia_en_que_llega(self):
+        # Se vuelca después de medianoche, pero la visita es del día anterior.
+        yesterday = timezone.localdate() - datetime.timedelta(days=1)
+        self.visit(yesterday, "203.0.113.1")
+        self.assertEqual(list(PostUniqueVisitors.objects.values_list("day", flat=True)), [yesterday])
+
+    def test_errores(self):
+        self.assertEqual(self.client.get(self.url, {"from": "ayer"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/blog/posts/no-existe/uniques/").status_code, 404)
@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.blog.analytics import ViewBuffer
+from apps.blog.models import PostAnalytics, PostView
+from apps.blog.utils import TTLSet
+
+from .utils import make_category, make_post
+
+
+class ViewBufferTests(TestCase):
+    def setUp(self):
+        category = make_category()
+        self.post = make_post(category, "Uno")
+        self.draft = make_post(category, "Borrador", status="draft")
+
+    def test_descarta_las_visitas_repetidas_de_la_misma_ip(self):
+        buffer = ViewBuffer(interval=0, dedupe_window=60)
+        buffer.add([self.post.slug], "203.0.113.1")
+        buffer.add([self.post.slug], "203.0.113.1")
+        buffer.add([self.post.slug], "203.0.113.2")
+        self.assertEqual(
+            sorted(PostView.objects.filter(post=self.post).values_list("ip_address", flat=True)),
+            ["203.0.113.1", "203.0.113.2"],
+        )
+        self.assertGreater(PostAnalytics.objects.get(post=self.post).trending_score, 0)
+
+    def test_vuelca_en_lote(self):
+        buffer = ViewBuffer(interval=60, max_size=100, dedupe_window=60)
+        buffer._thread = object()  # Sin hilo de fondo: se vuelca a mano.
+        for n in range(1, 4):
+            buffer.add([self.post.slug], f"203.0.113.{n}")
+        self.assertFalse(PostView.objects.exists())
+        self.assertEqual(buffer.flush(), 3)
+        self.assertEqual(PostView.objects.count(), 3)
+
+    def test_ignora_ips_invalidas_y_posts_no_publicados(self):
+        buffer = ViewBuffer(interval=0, dedupe_window=60)
+        buffer.add([self.post.slug], "no-es-una-ip")
+        buffer.add([self.draft.slug, "no-existe"], "203.0.113.1")
+        self.assertFalse(PostView.objects.exists())
+
+
+class TTLSetTests(SimpleTestCase):
+    def test_caducan_pasado_el_ttl(self):
+        seen = TTLSet(ttl=10)
+        with mock.patch("apps.blog.utils.time.monotonic", return_value=100):
+            self.assertTrue(seen.add("a"))
+            self.assertFalse(seen.add("a"))
+        with mock.patch("apps.blog.utils.time.monotonic", return_value=111):
+            self.assertTrue(seen.add("a"))
+
+    def test_descarta_los_mas_antiguos_al_llenarse(self):
+        seen = TTLSet(ttl=60, max_size=2)
+        for key in ("a", "b", "c"):
+            seen.add(key)
+        self.assertEqual(len(seen), 2)
+        self.assertTrue(seen.add("a"))
@@ -0,0 +1,14 @@
+from apps.blog.models import Category, Post
+
+
+def make_category(name="Python", **fields):
+    return Category.objects.create(name=name, **fields)
+
+
+def make_post(category, title, status="published", **fields):
+    fields.setdefault("content", f"<p>{title}</p>")
+    fields.setdefault("keywords", title.lower())
+    return Post.objects.create(
+        title=title, description=f"Sobre {title}", thumbnail="blog/thumbnail.png",
+        category=category, status=status, **fields,
+    )
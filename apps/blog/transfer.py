@@ -0,0 +1,206 @@
+import json
+import uuid
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
+from django.utils.text import slugify
+
+from .headings import anchor_headings
+from .keywords import sync_posts_keywords
+from .models import Category, Heading, Post, PostAnalytics
+from .rendering import render_content
+from .search import update_search_vector
+
+# Campos que viajan en cada línea. Las relaciones van por `slug`, no por `id`,
+# para que el fichero se pueda importar en una base con otros identificadores.
+CATEGORY_FIELDS = ("id", "name", "title", "description", "thumbnail", "slug", "created_at")
+POST_FIELDS = (
+    "id", "title", "description", "content", "thumbnail", "keywords", "slug", "created_at", "status",
+    "meta_description", "og_title", "og_description", "og_image",
+    "twitter_title", "twitter_description", "twitter_image",
+)
+
+# Campos que cada línea tiene que traer (sin valor por defecto en la base).
+REQUIRED_FIELDS = {
+    "category": ("name", "created_at"),
+    "post": ("title", "description", "content", "thumbnail", "keywords", "category", "created_at", "status"),
+}
+POST_STATUSES = {status for status, _ in Post.options}
+
+
+def export_lines(chunk_size=500):
+    """
+    Categorías (padres antes que hijas) y posts del blog como líneas JSONL.
+
+    Los encabezados no se exportan: salen del HTML de `content` y el importador
+    los vuelve a calcular igual que `Post.save()`.
+
+    Retorna:
+        generator: Líneas (`str`) con un campo `type` (`category` o `post`).
+    """
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    categories = Category.objects.order_by("path").values(*CATEGORY_FIELDS, "parent__slug")
+    for row in categories.iterator(chunk_size=chunk_size):
+        row["parent"] = row.pop("parent__slug")
+        yield encoder.encode({"type": "category", **row}) + "\n"
+    posts = Post.objects.order_by("created_at", "id").values(*POST_FIELDS, "category__slug")
+    for row in posts.iterator(chunk_size=chunk_size):
+        row["category"] = row.pop("category__slug")
+        yield encoder.encode({"type": "post", **row}) + "\n"
+
+
+def record_id(record, existing):
+    """
+    `id` con el que se guarda un registro: el de la fila que ya tiene su `slug` en
+    esta base, si la hay; si no, el del fichero. Así importar dos veces actualiza
+    las mismas filas en lugar de duplicarlas.
+    """
+    if record["slug"] in existing:
+        return existing[record["slug"]]
+    return uuid.UUID(str(record["id"])) if record.get("id") else uuid.uuid4()
+
+
+def import_categories(records):
+    """
+    Inserta o actualiza un lote de categorías con un único `INSERT … ON CONFLICT`.
+
+    `slug`, `path` y `depth` se calculan en memoria (como en `Category.save()`); el
+    padre tiene que aparecer antes en el fichero o existir ya en la base. Si una
+    categoría que ya existía cambia de padre, se reescribe el `path` de las
+    subcategorías que no vienen en el lote, igual que hace `Category.save()`.
+    """
+    for record in records:
+        record["slug"] = record.get("slug") or slugify(record.get("title") or record["name"])
+    records = list({record["slug"]: record for record in records}.values())
+    slugs = [record["slug"] for record in records]
+    stored = {slug: (pk, path, depth) for slug, pk, path, depth in Category.objects.filter(slug__in=slugs).values_list("slug", "id", "path", "depth")}
+    existing = {slug: pk for slug, (pk, _, _) in stored.items()}
+    parents = {record["parent"] for record in records if record.get("parent")}
+    known = {slug: (pk, path) for slug, pk, path in Category.objects.filter(slug__in=parents).values_list("slug", "id", "path")}
+    categories, moved = [], []
+    for record in records:
+        pk = record_id(record, existing)
+        parent_id, parent_path = None, ""
+        if record.get("parent"):
+            if record["parent"] not in known:
+                raise ValueError(f"La categoría padre `{record['parent']}` de `{record['slug']}` no existe.")
+            parent_id, parent_path = known[record["parent"]]
+            if pk.hex in parent_path.split("/"):
+                raise ValueError(f"La categoría `{record['slug']}` no puede colgar de sí misma ni de sus subcategorías.")
+        path = f"{parent_path}{pk.hex}/"
+        known[record["slug"]] = (pk, path)
+        if record["slug"] in stored and stored[record["slug"]][1] != path:
+            moved.append((pk, *stored[record["slug"]][1:], path))
+        categories.append(Category(
+            id=pk, parent_id=parent_id, path=path, depth=path.count("/") - 1,
+            **{field: record.get(field) for field in CATEGORY_FIELDS if field != "id"},
+        ))
+    with transaction.atomic(using=router.db_for_write(Category)):
+        Category.objects.bulk_create(
+            categories, update_conflicts=True, unique_fields=["id"],
+            update_fields=[field for field in CATEGORY_FIELDS if field != "id"] + ["parent", "path", "depth", "update_at"],
+        )
+        # De más profunda a menos: así el prefijo antiguo de cada una sigue en la base al reescribirla.
+        for pk, old_path, old_depth, path in sorted(moved, key=lambda move: move[2], reverse=True):
+            Category.objects.filter(path__startswith=old_path).exclude(pk=pk).update(
+                path=Concat(Value(path), Substr("path", len(old_path) + 1)),
+                depth=F("depth") + (path.count("/") - 1 - old_depth),
+            )
+    return len(categories)
+
+
+def import_posts(records):
+    """
+    Inserta o actualiza un lote de posts y sus encabezados.
+
+    Hace en memoria lo que `Post.save()` hace fila a fila (slug, anclas de los
+    encabezados y contenido derivado) y guarda con `INSERT … ON CONFLICT`. Después
+    actualiza en bloque lo que mantienen las señales: métricas, palabras clave y
+    vector de búsqueda.
+
+    Retorna:
+        list: Ids de los posts guardados.
+    """
+    for record in records:
+        record["slug"] = record.get("slug") or slugify(record["title"])
+    records = list({record["slug"]: record for record in records}.values())
+    existing = dict(Post.objects.filter(slug__in=[record["slug"] for record in records]).values_list("slug", "id"))
+    categories = dict(Category.objects.filter(slug__in={record["category"] for record in records}).values_list("slug", "id"))
+    posts, headings = [], []
+    for record in records:
+        if record["category"] not in categories:
+            raise ValueError(f"La categoría `{record['category']}` del post `{record['slug']}` no existe.")
+        fields = {field: record.get(field) for field in POST_FIELDS if field != "id"}
+        fields["content"], post_headings = anchor_headings(fields["content"])
+        fields.update(render_content(fields["content"]))
+        post = Post(id=record_id(record, existing), category_id=categories[record["category"]], **fields)
+        posts.append(post)
+        headings += [Heading(post_id=post.id, **heading) for heading in post_headings]
+    derived = ["content_html", "excerpt", "word_count", "reading_time"]
+    post_ids = [post.id for post in posts]
+    with transaction.atomic(using=router.db_for_write(Post)):
+        Post.objects.bulk_create(
+            posts, update_conflicts=True, unique_fields=["id"],
+            update_fields=[field for field in POST_FIELDS if field != "id"] + derived + ["category", "update_at"],
+        )
+        Heading.objects.bulk_create(
+            headings, update_conflicts=True, unique_fields=["post", "slug"], update_fields=["title", "level", "order"],
+        )
+        wanted = {(heading.post_id, heading.slug) for heading in headings}
+        current = Heading.objects.filter(post_id__in=post_ids).values_list("id", "post_id", "slug")
+        Heading.objects.filter(pk__in=[pk for pk, post_id, slug in current if (post_id, slug) not in wanted]).delete()
+    PostAnalytics.objects.bulk_create([PostAnalytics(post_id=pk) for pk in post_ids], ignore_conflicts=True)
+    sync_posts_keywords(posts)
+    update_search_vector(post_ids)
+    return post_ids
+
+
+def import_lines(lines, batch_size=500):
+    """
+    Importa un fichero JSONL de `export_lines` por lotes de `batch_size` líneas.
+
+    Es idempotente: las filas se identifican por `slug`, así que volver a importar
+    el mismo fichero deja la base igual. Cada línea se valida al leerla (JSON,
+    tipo y campos obligatorios de `REQUIRED_FIELDS`) y lanza `ValueError` con su
+    número si no se puede importar; los lotes anteriores ya quedan guardados.
+
+    Retorna:
+        tuple: `(categorías, ids de los posts)` importados.
+    """
+    categories, post_ids = 0, []
+    pending = {"category": [], "post": []}
+
+    def flush(kind):
+        nonlocal categories
+        if pending[kind]:
+            if kind == "category":
+                categories += import_categories(pending[kind])
+            else:
+                post_ids.extend(import_posts(pending[kind]))
+            pending[kind] = []
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"Línea {number}: JSON no válido ({error}).")
+        kind = record.pop("type", None)
+        if kind not in pending:
+            raise ValueError(f"Línea {number}: tipo desconocido `{kind}`.")
+        missing = [field for field in REQUIRED_FIELDS[kind] if record.get(field) is None]
+        if missing:
+            raise ValueError(f"Línea {number}: faltan los campos {', '.join(missing)}.")
+        if kind == "post" and record["status"] not in POST_STATUSES:
+            raise ValueError(f"Línea {number}: estado `{record['status']}` no válido.")
+        if kind == "post":
+            flush("category")  # Los posts necesitan sus categorías ya guardadas.
+        pending[kind].append(record)
+        if len(pending[kind]) >= batch_size:
+            flush(kind)
+    flush("category")
+    flush("post")
+    return categories, post_ids
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AnalyticsWatermark, PostAnalytics
+
+TRENDING_EPOCH = "trending_epoch"
+
+# Peso de cada tipo de evento en la puntuación de tendencia.
+EVENT_WEIGHTS = {
+    "impressions": 0.1,
+    "clicks": 1.0,
+    "views": 1.0,
+}
+
+# Cada cuántas vidas medias se reescala la época para que los valores no desborden.
+REBASE_AFTER = 64
+
+
+def half_life_seconds():
+    return getattr(settings, "ANALYTICS_TRENDING_HALF_LIFE", 24) * 3600
+
+
+def locked_growth(now=None):
+    """
+    Factor por el que multiplicar los eventos que llegan en `now`.
+
+    La puntuación usa *forward decay*: en vez de envejecer todas las filas, cada
+    evento se guarda multiplicado por `2 ** (edad de la época / vida media)`. El
+    orden entre posts es el mismo que con el decaimiento exponencial clásico y
+    cada evento cuesta un único incremento. Cuando el factor crece demasiado se
+    reescalan todas las puntuaciones y se mueve la época.
+
+    Debe llamarse dentro de una transacción: bloquea la fila de la época para que
+    ningún volcado sume con una época desactualizada.
+    """
+    now = now or timezone.now()
+    epoch, _ = AnalyticsWatermark.objects.select_for_update().get_or_create(name=TRENDING_EPOCH, defaults={"value": now})
+    half_lives = (now - epoch.value).total_seconds() / half_life_seconds()
+    if half_lives > REBASE_AFTER:
+        PostAnalytics.objects.update(trending_score=F("trending_score") * 2 ** -half_lives)
+        epoch.value = now
+        epoch.save(update_fields=["value"])
+        half_lives = 0
+    return 2 ** half_lives
+
+
+def decay_factor(now=None):
+    """Factor que convierte las puntuaciones guardadas en su valor decaído a fecha `now`."""
+    now = now or timezone.now()
+    epoch = AnalyticsWatermark.objects.filter(name=TRENDING_EPOCH).values_list("value", flat=True).first()
+    if epoch is None:
+        return 1.0
+    return 2 ** -((now - epoch).total_seconds() / half_life_seconds())
+
+
+def event_score(impressions=0, clicks=0, views=0):
+    """Puntuación (sin decaer) que aporta un conjunto de eventos."""
+    return (
+        impressions * EVENT_WEIGHTS["impressions"]
+        + clicks * EVENT_WEIGHTS["clicks"]
+        + views * EVENT_WEIGHTS["views"]
+    )
@@ -1,9 +1,22 @@
 from django.urls import path
 
-from .views import PostListView, PostDetailView, PostHeadingView
+from .views import PostListView, PostDetailView, PostHeadingView, PostEventsView, PostUniqueVisitorsView, PostStatsView, TrendingPostListView, PostAnalyticsView, PostSearchView, CategoryTreeView, CategoryPostListView, PostSummaryListView, RssFeedView, AtomFeedView, PostExportView, PostViewExportView
 
 urlpatterns = [
+    path('analytics/', PostAnalyticsView.as_view(), name='post-analytics'),
+    path('categories/', CategoryTreeView.as_view(), name='category-tree'),
+    path('categories/<slug>/posts/', CategoryPostListView.as_view(), name='category-posts'),
+    path('events/', PostEventsView.as_view(), name='post-events'),
+    path('export/posts/', PostExportView.as_view(), name='post-export'),
+    path('export/views/', PostViewExportView.as_view(), name='post-view-export'),
+    path('feed/rss/', RssFeedView.as_view(), name='post-feed-rss'),
+    path('feed/atom/', AtomFeedView.as_view(), name='post-feed-atom'),
+    path('search/', PostSearchView.as_view(), name='post-search'),
     path('posts/', PostListView.as_view(), name='post-list'),
+    path('posts/summary/', PostSummaryListView.as_view(), name='post-summary'),
+    path('posts/trending/', TrendingPostListView.as_view(), name='post-trending'),
     path('posts/<slug>/', PostDetailView.as_view(), name='post-detail'),
+    path('posts/<slug>/stats/', PostStatsView.as_view(), name='post-stats'),
+    path('posts/<slug>/uniques/', PostUniqueVisitorsView.as_view(), name='post-uniques'),
     path('post/<slug>/headings/', PostHeadingView.as_view(), name = 'post-headings')
 ]
\ No newline at end of file
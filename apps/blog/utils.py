@@ -1,8 +1,126 @@
+import datetime
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.db import connections, router
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+
 def get_client_ip(request):
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
+        ip = x_forwarded_for.split(',')[0].strip()
     else:
         ip = request.META.get('REMOTE_ADDR')
     
-    return ip
\ No newline at end of file
+    return ip
+
+
+# Fragmentos de user-agent de crawlers, herramientas y clientes HTTP automáticos.
+BOT_PATTERNS = (
+    r"bot", r"crawl", r"spider", r"slurp", r"scrap", r"fetch", r"preview",
+    r"archiver", r"facebookexternalhit", r"embedly", r"whatsapp", r"telegram",
+    r"headless", r"phantomjs", r"puppeteer", r"playwright", r"selenium", r"lighthouse",
+    r"pingdom", r"uptime", r"monitor", r"python-requests", r"python-urllib", r"aiohttp",
+    r"httpx", r"curl", r"wget", r"okhttp", r"go-http-client", r"java/", r"libwww",
+    r"axios", r"node-fetch", r"postman",
+)
+BOT_REGEX = re.compile("|".join(BOT_PATTERNS), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def is_bot_user_agent(user_agent):
+    """
+    Indica si un user-agent pertenece a un bot o crawler (un user-agent vacío también cuenta).
+
+    Los patrones van en una única expresión compilada y el resultado se cachea
+    por cadena, porque en la práctica se repiten unos pocos user-agents.
+    """
+    return not user_agent or BOT_REGEX.search(user_agent) is not None
+
+
+def is_bot(request):
+    """Indica si la petición la hace un bot, según su cabecera `User-Agent`."""
+    # Se recorta para que un user-agent enorme no ocupe la caché.
+    return is_bot_user_agent(request.META.get("HTTP_USER_AGENT", "")[:512])
+
+
+def get_date_range(request, default_days=30):
+    """
+    Lee el rango `?from=AAAA-MM-DD&to=AAAA-MM-DD` de la petición (ambos incluidos).
+
+    Por defecto devuelve los últimos `default_days` días. Lanza `ValueError` si
+    alguna fecha no es válida o el rango está invertido.
+    """
+    today = timezone.localdate()
+    raw_from, raw_to = request.query_params.get("from"), request.query_params.get("to")
+    date_from = parse_date(raw_from) if raw_from else today - datetime.timedelta(days=default_days - 1)
+    date_to = parse_date(raw_to) if raw_to else today
+    if date_from is None or date_to is None:
+        raise ValueError("Las fechas deben tener el formato AAAA-MM-DD.")
+    if date_from > date_to:
+        raise ValueError("`from` no puede ser posterior a `to`.")
+    return date_from, date_to
+
+
+class TTLSet:
+    """
+    Conjunto en memoria cuyos elementos caducan `ttl` segundos después de añadirse.
+
+    Como todos los elementos viven lo mismo, el orden de inserción coincide con el
+    de caducidad y basta con purgar por el principio. `max_size` limita la memoria
+    descartando los elementos más antiguos.
+    """
+    def __init__(self, ttl, max_size=100_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        """Añade `key` y devuelve `True` si no estaba ya (o había caducado)."""
+        now = time.monotonic()
+        with self._lock:
+            while self._items:
+                oldest, expires = next(iter(self._items.items()))
+                if expires > now and len(self._items) < self.max_size:
+                    break
+                del self._items[oldest]
+            if key in self._items:
+                return False
+            self._items[key] = now + self.ttl
+            return True
+
+    def __len__(self):
+        return len(self._items)
+
+
+def bulk_increment(model, key_fields, count_fields, rows):
+    """
+    Suma contadores a `model` con un único `INSERT ... ON CONFLICT DO UPDATE`.
+
+    Cada fila de `rows` contiene los valores de `key_fields` seguidos de los
+    incrementos de `count_fields`. `key_fields` debe corresponder a una
+    restricción única del modelo. Funciona en PostgreSQL y SQLite.
+    """
+    if not rows:
+        return
+    connection = connections[router.db_for_write(model)]
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    fields = [model._meta.get_field(name) for name in (*key_fields, *count_fields)]
+    columns = [qn(field.column) for field in fields]
+    keys = ", ".join(columns[:len(key_fields)])
+    updates = ", ".join(f"{column} = {table}.{column} + EXCLUDED.{column}" for column in columns[len(key_fields):])
+    placeholders = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([placeholders] * len(rows))} "
+        f"ON CONFLICT ({keys}) DO UPDATE SET {updates}"
+    )
+    params = [field.get_db_prep_value(value, connection) for row in rows for field, value in zip(fields, row)]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
@@ -1,39 +1,188 @@
-from django.shortcuts import render #Se usa en Django para renderizar plantillas HTML (no se usa en este código, pero se podría emplear en otras views si se quisiera devolver HTML).
+import datetime
+
+from django.shortcuts import get_object_or_404, render #Se usa en Django para renderizar plantillas HTML (no se usa en este código, pero se podría emplear en otras views si se quisiera devolver HTML).
 from rest_framework import status #Contiene códigos de estado HTTP (como 200 OK, 404 Not Found), aunque no se está usando en este código.
 from rest_framework.generics import ListAPIView, RetrieveAPIView # Proporciona clases genéricas para crear vistas sin tener que escribir código repetitivo.
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from .models import Post, Category, Heading, PostView, PostAnalytics #Importamos los modelos que representan las tablas de la base de datos (Post, Category, Heading).
-from .serializers import PostSerializer, CategorySerializer, PostListSerializer, HeadingSerializer, PostView , PostAnalyticsSerializer#Importamos los serializadores, que transforman los datos de los modelos a JSON para la API.
-from .utils import get_client_ip
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.parsers import JSONParser
+from django.conf import settings
+from django.db import router
+from django.http import HttpResponse, StreamingHttpResponse
+from django.db.models import Case, Count, ExpressionWrapper, F, FloatField, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.cache import cache_control
+from .models import Post, Category, Heading, PostView, PostAnalytics, PostUniqueVisitors, PostDailyStats #Importamos los modelos que representan las tablas de la base de datos (Post, Category, Heading).
+from .serializers import PostSerializer, CategorySerializer, PostListSerializer, HeadingSerializer, PostView , PostAnalyticsSerializer, TrendingPostSerializer, PostSearchSerializer, CategoryTreeSerializer, PostListEntrySerializer#Importamos los serializadores, que transforman los datos de los modelos a JSON para la API.
+from .utils import get_client_ip, get_date_range, is_bot
+from .hll import HyperLogLog
+from .rollups import BUCKET_MODELS, attach_view_counts, views_watermark
+from .trending import decay_factor
+from .search import search_posts
+from .snapshots import render_post_detail, stored_snapshot
+from .post_list import attach_entry_view_counts, is_materialized, post_list_entries, post_list_refreshed
+from .keywords import TAG_MATCH_MODES, filter_by_tags, parse_tags, tag_counts
+from .pagination import AnalyticsPagination, KeysetPagination
+from .analytics import counter_buffer, view_buffer
+from .feeds import atom_chunks, rss_chunks
+from core.conditional import cached_stream, conditional_get, model_state, state_digest
+from core.exports import NdjsonExportView
+from core.sparse_fields import SparseFieldsViewMixin
 #ListAPIView -> Es una vista genérica de Django REST Framework que permite obtener una lista de objetos en formato JSON (equivalente a GET /api/posts/).
 #RetrieveAPIView -> Es una vista genérica para obtener un solo objeto de la base de datos.
-class PostListView(APIView):
+# Las vistas de lectura no escriben nada (las métricas llegan por `PostEventsView`),
+# así que sus respuestas se pueden cachear en el navegador y en el CDN.
+cache_public = method_decorator(cache_control(public=True, max_age=settings.BLOG_CACHE_MAX_AGE))
+
+
+def post_list_state(request, *args, **kwargs):
+    """
+    Estado de los listados para `conditional_get`: posts (también los despublicados,
+    que dejan de salir), categorías y la marca de agregación de visitas.
+    """
+    return model_state(Post, Post.objects.all()), model_state(Category), views_watermark()
+
+class PostListView(SparseFieldsViewMixin, APIView):
+    """
+    Lista paginada de los posts publicados, del más reciente al más antiguo.
+
+    Uso:
+        - GET `/api/blog/posts/?page_size=10` devuelve `{"next": url, "results": [...]}`.
+        - Para la siguiente página se sigue la URL de `next` (lleva un `?cursor=` opaco).
+        - `?fields=title,slug,category` devuelve solo esos campos y `?expand=headings`
+          añade los encabezados (ver `core/sparse_fields.py`). El contenido completo
+          no se incluye salvo con `?fields=...,content`.
+        - `?tag=django&tag=orm` filtra por palabras clave: por defecto los posts con
+          todas (`&match=all`) o con alguna (`&match=any`). La respuesta añade `tags`
+          con el número de posts publicados de cada etiqueta (ver `keywords.py`).
+        - Con `If-None-Match`/`If-Modified-Since` responde `304` sin paginar ni
+          serializar si no ha cambiado nada (ver `core/conditional.py`).
+    """
     permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
+    sparse_required_fields = ("created_at",)  # Lo usa el cursor de `KeysetPagination`.
+
+    def get_posts(self, request, **kwargs):
+        """Posts a paginar; las subclases lo redefinen para filtrar."""
+        return Post.postobjects.all()
 
+    def get_conditional_state(self, request, *args, **kwargs):
+        return post_list_state(request, *args, **kwargs)
+
+    @cache_public
+    @conditional_get
     def get(self, request, *args, **kwargs):
-        posts = Post.postobjects.all()
-        for post in posts:
-            analytics, created = PostAnalytics.objects.get_or_create(post=post)
-            analytics.impressions += 1
-            analytics.save()
-        
-        serialized_posts = PostListSerializer(posts, many=True).data
-        return Response(serialized_posts)
+        tags = parse_tags(request.query_params.getlist("tag"))
+        match = request.query_params.get("match", "all")
+        if match not in TAG_MATCH_MODES:
+            return Response({"error": "`match` debe ser `all` o `any`."}, status=status.HTTP_400_BAD_REQUEST)
+        paginator = self.pagination_class()
+        queryset = self.get_posts(request, **kwargs)
+        if tags:
+            queryset = filter_by_tags(queryset, tags, match)
+        queryset = self.sparse_queryset(queryset, PostListSerializer)
+        posts = attach_view_counts(paginator.paginate_queryset(queryset, request, view=self))
+        serialized_posts = PostListSerializer(posts, many=True, context={"request": request}).data
+        response = paginator.get_paginated_response(serialized_posts)
+        if tags:
+            response.data["tags"] = tag_counts(tags)
+        return response
+
+class PostSummaryListView(APIView):
+    """
+    Listado ligero de los posts publicados, sin contenido.
+
+    Uso:
+        - GET `/api/blog/posts/summary/?page_size=20`, con la misma paginación por
+          cursor que `/api/blog/posts/` y `?fields=` para recortar la respuesta.
+
+    En PostgreSQL lee la vista materializada `blog_postlistentry` (posts,
+    categoría y visitas ya unidos), así que cada página es un único recorrido
+    del índice `(created_at, id)` de esa tabla (ver `post_list.py`). La vista
+    solo cambia al refrescarse (unos segundos después de guardar posts o
+    categorías, o desde el cron `refresh_post_list`), así que su validador es la
+    hora del último refresco y no el estado de los posts.
+    """
+    permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
+
+    def get_conditional_state(self, request, *args, **kwargs):
+        if is_materialized():
+            return (post_list_refreshed(),)
+        return post_list_state(request, *args, **kwargs)
+
+    @cache_public
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        paginator = self.pagination_class()
+        entries = attach_entry_view_counts(paginator.paginate_queryset(post_list_entries(), request, view=self))
+        serialized_entries = PostListEntrySerializer(entries, many=True, context={"request": request}).data
+        return paginator.get_paginated_response(serialized_entries)
+
+class CategoryPostListView(PostListView):
+    """
+    Posts publicados de una categoría y de todas sus subcategorías.
+
+    Uso:
+        - GET `/api/blog/categories/<slug>/posts/`, con la misma paginación y los
+          mismos `?fields=`/`?expand=` que `/api/blog/posts/`.
+
+    El subárbol se filtra con el prefijo de `Category.path`, así que es una sola
+    consulta sin importar la profundidad.
+    """
+    def get_posts(self, request, slug=None, **kwargs):
+        category = get_object_or_404(Category, slug=slug)
+        return Post.postobjects.filter(category__path__startswith=category.path)
+
+class PostDetailView(SparseFieldsViewMixin, APIView):
+    """
+    Detalle de un post publicado.
+
+    Uso:
+        - GET `/api/blog/posts/<slug>/` incluye `headings`, la tabla de contenidos
+          extraída del HTML al guardar, así que la página no necesita pedir
+          `/api/blog/post/<slug>/headings/` aparte.
+
+    Si hay un snapshot guardado (ver `snapshots.py`) y no se piden `?fields=` ni
+    `?expand=`, devuelve sus bytes directamente (ya comprimidos en gzip si el
+    cliente lo acepta) sin consultar el post ni pasar por el serializador.
 
-class PostDetailView(APIView):
+    Responde `304` si el post, su categoría, su snapshot y las visitas agregadas
+    no han cambiado desde el `ETag`/`Last-Modified` que envía el cliente.
+    """
     permission_classes = [AllowAny]
 
+    def get_conditional_state(self, request, slug):
+        state = (
+            Post.postobjects.filter(slug=slug)
+            .values_list("update_at", "category__update_at", "snapshot__updated_at")
+            .first()
+        )
+        if state is None:
+            return None  # El 404 lo resuelve la vista.
+        return state, views_watermark()
+
+    @cache_public
+    @conditional_get
     def get(self, request, slug):
+        sparse = "fields" in request.query_params or "expand" in request.query_params
+        if not sparse and request.accepted_renderer.format == "json":
+            snapshot = stored_snapshot(request, slug)
+            if snapshot is not None:
+                body, gzipped = snapshot
+                response = HttpResponse(body, content_type="application/json")
+                if gzipped:
+                    response["Content-Encoding"] = "gzip"
+                patch_vary_headers(response, ["Accept-Encoding"])
+                return response
         try:
-            post = Post.postobjects.get(slug=slug)
-            analytics, created = PostAnalytics.objects.get_or_create(post=post)
-            analytics.clicks += 1
-            analytics.save()
-
-            serialized_post = PostSerializer(post).data
-            return Response(serialized_post, status=200)
+            post = self.sparse_queryset(Post.postobjects.all(), PostSerializer).get(slug=slug)
+            return Response(render_post_detail(post, request), status=200)
         except Post.DoesNotExist:
             return Response({"error": "Post no encontrado"}, status=404)
 
@@ -69,10 +218,366 @@ class PostHeadingView(ListAPIView): #Si hacemos una petición GET a /api/blog/po
         """
         post_slug = self.kwargs.get("slug") #Obtiene el slug desde la URL.
         return Heading.objects.filter(post__slug = post_slug) #Busca en la base de datos los encabezados que pertenecen a un Post con ese slug.
-class PostAnalyticsView(RetrieveAPIView):
+class PostAnalyticsView(ListAPIView):
     """
-    API para obtener las métricas de un post.
+    API de métricas de varios posts a la vez para el panel de administración.
+
+    Uso:
+        - GET `/api/blog/analytics/?slug=a&slug=b` (o `?slug=a,b`) para unos posts concretos.
+        - GET `/api/blog/analytics/?category=<slug>` para los posts de una categoría.
+        - `?ordering=-ctr` ordena por `impressions`, `clicks`, `ctr` o `views`
+          (con `-` para descendente).
+        - `?page=` y `?page_size=` paginan el resultado.
+
+    Impresiones, clics, CTR y visitas se calculan, ordenan y paginan en una única
+    consulta sobre la base de analítica (con el filtro de posts como subconsulta si
+    comparten base); los títulos de la página se leen después.
     """
-    queryset = PostAnalytics.objects.all()
     serializer_class = PostAnalyticsSerializer
-    lookup_field = "post_slug"
\ No newline at end of file
+    permission_classes = [IsAdminUser]
+    pagination_class = AnalyticsPagination
+    ordering_fields = ("impressions", "clicks", "ctr", "views")
+
+    def get_queryset(self):
+        posts = Post.objects.exclude(status="deleted")
+        slugs = [slug for value in self.request.query_params.getlist("slug") for slug in value.split(",") if slug]
+        if slugs:
+            posts = posts.filter(slug__in=slugs)
+        category = self.request.query_params.get("category")
+        if category:
+            posts = posts.filter(category__slug=category)
+        analytics = PostAnalytics.objects.all()
+        if router.db_for_read(Post) == router.db_for_read(PostAnalytics):
+            # Misma base: el filtro de posts va como subconsulta, sin traer los ids.
+            analytics = analytics.filter(post_id__in=posts.values("id"))
+        elif slugs or category:
+            # Las métricas están en otra base: los ids se traen, acotados por el filtro.
+            analytics = analytics.filter(post_id__in=list(posts.values_list("id", flat=True)))
+        else:
+            # Sin filtro basta con descartar los posts borrados, que son pocos.
+            analytics = analytics.exclude(post_id__in=list(Post.objects.filter(status="deleted").values_list("id", flat=True)))
+
+        views = (
+            PostDailyStats.objects.filter(post_id=OuterRef("post_id"))
+            .values("post_id")
+            .annotate(total=Sum("views"))
+            .values("total")
+        )
+        ordering = self.request.query_params.get("ordering", "-impressions")
+        if ordering.lstrip("-") not in self.ordering_fields:
+            ordering = "-impressions"
+        return analytics.annotate(
+            ctr=Case(
+                When(impressions=0, then=Value(0.0)),
+                default=ExpressionWrapper(F("clicks") * Value(100.0) / F("impressions"), output_field=FloatField()),
+                output_field=FloatField(),
+            ),
+            views=Coalesce(Subquery(views, output_field=IntegerField()), 0),
+        ).order_by(ordering, "post_id")
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        posts = Post.objects.only("slug", "title", "status").in_bulk([row.post_id for row in page])
+        # Sin filtro y con bases separadas la página puede traer métricas huérfanas.
+        page = [row for row in page if row.post_id in posts]
+        for row in page:
+            row.post_info = posts[row.post_id]
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+class BeaconParser(JSONParser):
+    """`navigator.sendBeacon` envía los textos como `text/plain`; el cuerpo sigue siendo JSON."""
+    media_type = "text/plain"
+
+class PostEventsView(APIView):
+    """
+    Endpoint *beacon* para registrar métricas del blog en lote.
+
+    El cliente envía en una sola petición los posts que se han mostrado, pulsado o leído:
+
+        {"impressions": ["slug-a", "slug-b"], "clicks": ["slug-a"], "views": ["slug-a"]}
+
+    La validación es mínima (estructura y tamaño); los eventos se encolan en los
+    buffers de `analytics.py` y se responde 204. Las `views` las envía la página
+    de detalle del post (`pages/blog/[slug].astro`); sus slugs se comprueban con
+    una consulta antes de deduplicarlas por IP. Las peticiones de bots y crawlers
+    se ignoran sin hacer ningún trabajo.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    parser_classes = [JSONParser, BeaconParser]
+    event_types = ("impressions", "clicks", "views")
+
+    def post(self, request, *args, **kwargs):
+        if is_bot(request):
+            # El tráfico de bots no cuenta: se descarta antes de leer el cuerpo.
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        events = request.data
+        if not isinstance(events, dict) or not set(events) <= set(self.event_types):
+            return Response({"error": f"Se esperaba un objeto con las claves {', '.join(self.event_types)}."}, status=status.HTTP_400_BAD_REQUEST)
+        total = 0
+        for event_type in self.event_types:
+            slugs = events.get(event_type, [])
+            if not isinstance(slugs, list) or not all(isinstance(slug, str) and 0 < len(slug) <= 128 for slug in slugs):
+                return Response({"error": f"`{event_type}` debe ser una lista de slugs."}, status=status.HTTP_400_BAD_REQUEST)
+            total += len(slugs)
+        if total > settings.ANALYTICS_BEACON_MAX_EVENTS:
+            return Response({"error": "Demasiados eventos en una sola petición."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if events.get("impressions"):
+            counter_buffer.add(events["impressions"], impressions=1)
+        if events.get("clicks"):
+            counter_buffer.add(events["clicks"], clicks=1)
+        if events.get("views"):
+            # Solo los slugs de posts publicados entran en la ventana de deduplicación:
+            # con slugs inventados se podrían expulsar las claves de visitas reales.
+            views = list(Post.postobjects.filter(slug__in=set(events["views"])).values_list("slug", flat=True))
+            view_buffer.add(views, get_client_ip(request))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+class PostUniqueVisitorsView(APIView):
+    """
+    Devuelve los visitantes únicos (aproximados) de un post en un rango de fechas.
+
+    Uso:
+        - GET `/api/blog/posts/<slug>/uniques/?from=AAAA-MM-DD&to=AAAA-MM-DD`
+          (por defecto, los últimos 30 días).
+
+    Combina los sketches HyperLogLog diarios de `PostUniqueVisitors`, así que el
+    coste depende del número de días y no del número de visitas registradas.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        try:
+            date_from, date_to = get_date_range(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        post_id = Post.postobjects.filter(slug=slug).values_list("id", flat=True).first()
+        if post_id is None:
+            return Response({"error": "Post no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+
+        hll = HyperLogLog()
+        sketches = PostUniqueVisitors.objects.filter(post_id=post_id, day__range=(date_from, date_to)).values_list("sketch", flat=True)
+        for sketch in sketches:
+            hll.merge(HyperLogLog.from_bytes(sketch))
+        return Response({
+            "slug": slug,
+            "from": date_from,
+            "to": date_to,
+            "unique_visitors": hll.count(),
+        })
+
+class PostStatsView(APIView):
+    """
+    Serie temporal de visitas, impresiones y clics de un post.
+
+    Uso:
+        - GET `/api/blog/posts/<slug>/stats/?from=AAAA-MM-DD&to=AAAA-MM-DD&bucket=day|hour`
+          (por defecto, los últimos 30 días agrupados por día).
+
+    Lee únicamente de las tablas de agregados (`PostHourlyStats`/`PostDailyStats`).
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        bucket = request.query_params.get("bucket", "day")
+        if bucket not in BUCKET_MODELS:
+            return Response({"error": f"`bucket` debe ser uno de: {', '.join(BUCKET_MODELS)}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            date_from, date_to = get_date_range(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        post_id = Post.postobjects.filter(slug=slug).values_list("id", flat=True).first()
+        if post_id is None:
+            return Response({"error": "Post no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+
+        start = timezone.make_aware(datetime.datetime.combine(date_from, datetime.time.min))
+        end = timezone.make_aware(datetime.datetime.combine(date_to + datetime.timedelta(days=1), datetime.time.min))
+        series = BUCKET_MODELS[bucket].objects.filter(post_id=post_id, start__gte=start, start__lt=end).values("start", "views", "impressions", "clicks")
+        return Response({
+            "slug": slug,
+            "bucket": bucket,
+            "from": date_from,
+            "to": date_to,
+            "series": list(series),
+        })
+
+class TrendingPostListView(SparseFieldsViewMixin, APIView):
+    """
+    Devuelve los posts en tendencia, ordenados por su puntuación con decaimiento.
+
+    Uso:
+        - GET `/api/blog/posts/trending/?limit=10` (máximo `TRENDING_MAX_LIMIT`).
+
+    El orden sale directamente del índice de `PostAnalytics.trending_score`, sin
+    calcular nada por post en Python, y los posts publicados se cargan con una
+    segunda consulta por clave primaria (una más por cada tanda que haga falta).
+    """
+    permission_classes = [AllowAny]
+
+    @cache_public
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 10)), settings.TRENDING_MAX_LIMIT))
+        except ValueError:
+            return Response({"error": "`limit` debe ser un número."}, status=status.HTTP_400_BAD_REQUEST)
+        # El ranking sale del índice de `trending_score` sin JOIN con `Post` (las métricas
+        # pueden estar en otra base de datos), así que se lee por tandas hasta reunir
+        # `limit` posts publicados: los borradores y archivados no ocupan hueco.
+        ranking = (
+            PostAnalytics.objects.filter(trending_score__gt=0)
+            .order_by("-trending_score", "post_id")
+            .values_list("post_id", "trending_score")
+        )
+        queryset = self.sparse_queryset(Post.postobjects.all(), TrendingPostSerializer)
+        posts = []
+        batch_size, offset = limit * 2, 0
+        while len(posts) < limit:
+            scores = list(ranking[offset:offset + batch_size])
+            published = queryset.in_bulk([post_id for post_id, _ in scores])
+            for post_id, score in scores:
+                if post_id in published and len(posts) < limit:
+                    published[post_id].trending_score = score
+                    posts.append(published[post_id])
+            if len(scores) < batch_size:
+                break
+            offset += batch_size
+        attach_view_counts(posts)
+        serialized_posts = TrendingPostSerializer(posts, many=True, context={"request": request, "decay": decay_factor()}).data
+        return Response(serialized_posts)
+
+
+class PostSearchView(APIView):
+    """
+    Búsqueda a texto completo entre los posts publicados.
+
+    Uso:
+        - GET `/api/blog/search/?q=django orm&limit=20` (máximo `BLOG_SEARCH_MAX_LIMIT`).
+        - `q` admite la sintaxis de un buscador web: `"frase exacta"`, `or` y `-excluir`.
+
+    Los resultados vienen ordenados por relevancia e incluyen `headline`, un
+    fragmento del contenido con las coincidencias entre `<mark>` (ver `search.py`).
+    """
+    permission_classes = [AllowAny]
+
+    @cache_public
+    def get(self, request, *args, **kwargs):
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response({"error": "Falta el parámetro `q`."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), settings.BLOG_SEARCH_MAX_LIMIT))
+        except ValueError:
+            return Response({"error": "`limit` debe ser un número."}, status=status.HTTP_400_BAD_REQUEST)
+        posts = search_posts(text)[:limit]
+        return Response(PostSearchSerializer(posts, many=True, context={"request": request}).data)
+
+
+class CategoryTreeView(APIView):
+    """
+    Árbol completo de categorías con el número de posts publicados de cada una.
+
+    Uso:
+        - GET `/api/blog/categories/` devuelve las categorías raíz con sus `children`.
+        - `post_count` cuenta los posts de la propia categoría y `total_post_count`
+          los de todo su subárbol.
+
+    Las categorías y sus recuentos salen de una sola consulta ordenada por `path`;
+    el árbol y los totales se montan en memoria.
+    """
+    permission_classes = [AllowAny]
+
+    @cache_public
+    def get(self, request, *args, **kwargs):
+        categories = list(
+            Category.objects.annotate(post_count=Count("post", filter=Q(post__status="published")))
+            .order_by("path")
+        )
+        nodes = {}
+        roots = []
+        for category in categories:
+            category.tree_children = []
+            category.total_post_count = category.post_count
+            nodes[category.pk] = category
+            parent = nodes.get(category.parent_id)
+            (parent.tree_children if parent else roots).append(category)
+        # Al recorrer de más profundo a menos, cada hija suma a su padre un total ya completo.
+        for category in sorted(categories, key=lambda category: category.depth, reverse=True):
+            if category.parent_id in nodes:
+                nodes[category.parent_id].total_post_count += category.total_post_count
+        return Response(CategoryTreeSerializer(roots, many=True, context={"request": request}).data)
+
+
+class PostFeedView(View):
+    """
+    Feed de los últimos posts publicados (`BLOG_FEED_LIMIT`).
+
+    Uso:
+        - GET `/api/blog/feed/rss/` (RSS 2.0) o `/api/blog/feed/atom/` (Atom 1.0).
+
+    Es una vista de Django y no de DRF para no pasar por la negociación de
+    contenido (los lectores piden `application/rss+xml`). El XML se genera
+    recorriendo los posts con `.iterator()` y se envía por trozos; el resultado
+    se guarda en caché con el estado de posts y categorías como clave, así que
+    solo se regenera cuando cambia algo (ver `core/conditional.py`).
+    """
+    chunks = None
+    content_type = None
+
+    def get_conditional_state(self, request, *args, **kwargs):
+        return model_state(Post, Post.objects.all()), model_state(Category)
+
+    @cache_public
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        feed_url = request.build_absolute_uri(request.path)
+        key = f"blog-feed:{state_digest(self.conditional_state, feed_url)}"  # El feed enlaza a sí mismo.
+        # El cuerpo se genera al enviarlo, cuando `ReplicaReadsMiddleware` ya ha
+        # terminado: la base de datos se elige ahora.
+        chunks = self.chunks(feed_url, using=router.db_for_read(Post))
+        return StreamingHttpResponse(
+            cached_stream(key, chunks, settings.FEED_CACHE_TIMEOUT), content_type=self.content_type,
+        )
+
+
+class RssFeedView(PostFeedView):
+    chunks = staticmethod(rss_chunks)
+    content_type = "application/rss+xml; charset=utf-8"
+
+
+class AtomFeedView(PostFeedView):
+    chunks = staticmethod(atom_chunks)
+    content_type = "application/atom+xml; charset=utf-8"
+
+
+class PostExportView(NdjsonExportView):
+    """
+    Exporta todos los posts (publicados o no) en NDJSON.
+
+    Uso:
+        - GET `/api/blog/export/posts/` (solo administradores); `?since=` filtra por `update_at`.
+    """
+    export_fields = (
+        "id", "title", "slug", "description", "content", "keywords", "thumbnail",
+        "category__slug", "status", "created_at", "update_at",
+    )
+    export_filename = "posts"
+    export_since_field = "update_at"
+
+    def get_export_queryset(self, request):
+        return Post.objects.order_by("created_at", "id")
+
+
+class PostViewExportView(NdjsonExportView):
+    """
+    Exporta las visitas en bruto (`PostView`) en NDJSON, en orden cronológico.
+
+    Uso:
+        - GET `/api/blog/export/views/?since=2025-01-01T00:00:00Z` (solo administradores).
+    """
+    export_fields = ("id", "post_id", "ip_address", "timestamp")
+    export_filename = "post_views"
+    export_since_field = "timestamp"
+
+    def get_export_queryset(self, request):
+        return PostView.objects.order_by("timestamp")
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('curriculum', '0006_proyecto_empresas_proyecto_introduccion_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='empresa',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Modificado en'),
+            preserve_default=False,
+        ),
+    ]
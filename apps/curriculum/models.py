@@ -262,11 +262,13 @@ class Empresa(models.Model):
         logo (ImageField): Logo de la empresa.
         descripcion (TextField): Descripción de la empresa.
         website (URLField): Enlace al sitio web de la empresa.
+        modified_at (DateTimeField): Fecha de la última modificación.
     """
     nombre = models.CharField(max_length=255, unique=True)
     logo = models.ImageField(upload_to=upload_to_empresa, blank=True, null=True)
     descripcion = models.TextField()
     website = models.URLField(blank=True)
+    modified_at = models.DateTimeField(_("Modificado en"), auto_now=True)
 
     def __str__(self):
         return self.nombre
@@ -1,29 +1,30 @@
 from rest_framework import serializers
+from core.sparse_fields import SparseFieldsSerializerMixin
 from .models import Perfil, Habilidad, Empresa, Educacion, Experiencia, Proyecto
 
-class HabilidadSerializer(serializers.ModelSerializer):
+class HabilidadSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Habilidad
         fields = "__all__"
 
-class EmpresaSerializer(serializers.ModelSerializer):
+class EmpresaSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Empresa
         fields = "__all__"
 
-class EducacionSerializer(serializers.ModelSerializer):
+class EducacionSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Educacion
         fields = "__all__"
 
-class ExperienciaSerializer(serializers.ModelSerializer):
+class ExperienciaSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     empresa = EmpresaSerializer()  # Una experiencia está relacionada con una única empresa
     habilidades = HabilidadSerializer(many=True)
     class Meta:
         model = Experiencia
         fields = "__all__"
 
-class ProyectoSerializer(serializers.ModelSerializer):
+class ProyectoSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     habilidades = HabilidadSerializer(many=True)  # Un proyecto puede tener muchas habilidades
     empresas = EmpresaSerializer(many=True, read_only=True)
 
@@ -31,13 +32,15 @@ class ProyectoSerializer(serializers.ModelSerializer):
         model = Proyecto
         fields = "__all__"
 
-class PerfilSerializer(serializers.ModelSerializer):
-    # habilidades = HabilidadSerializer(many=True)  # Un perfil puede tener muchas habilidades
-    # proyectos = ProyectoSerializer(many=True)  # Un perfil puede tener muchos proyectos
-    # titulos = EducacionSerializer(many=True)  # Un perfil puede tener muchos títulos (educaciones)
-    # experiencias = ExperienciaSerializer(many=True)  # Un perfil puede tener muchas experiencias
-
+class PerfilSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Perfil
         fields = "__all__"
-        depth = 1
\ No newline at end of file
+        depth = 1
+        # Las relaciones a muchos solo se incluyen si se piden, p. ej. `?expand=proyectos,experiencias`.
+        expandable_fields = {
+            "habilidades": lambda: HabilidadSerializer(many=True),  # Un perfil puede tener muchas habilidades
+            "proyectos": lambda: ProyectoSerializer(many=True),  # Un perfil puede tener muchos proyectos
+            "titulaciones": lambda: EducacionSerializer(many=True),  # Un perfil puede tener muchos títulos (educaciones)
+            "experiencias": lambda: ExperienciaSerializer(many=True),  # Un perfil puede tener muchas experiencias
+        }
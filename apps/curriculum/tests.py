@@ -1,3 +1,45 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Empresa, Habilidad, Perfil, Proyecto
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        perfil = Perfil.objects.create(dni="00000000T", nombre="Ana", apellido_1="Pérez", email="ana@example.com")
+        self.habilidad = Habilidad.objects.create(nombre="Django", perfil=perfil)
+        self.empresa = Empresa.objects.create(nombre="Acme", descripcion="Consultora")
+        self.proyecto = Proyecto.objects.create(nombre="Portfolio", descripcion="Web personal", perfil=perfil)
+        self.proyecto.habilidades.add(self.habilidad)
+        self.proyecto.empresas.add(self.empresa)
+
+    def assertNotModified(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+        return response
+
+    def test_listado_sin_last_modified(self):
+        response = self.assertNotModified("/api/curriculum/habilidades/")
+        self.assertNotIn("Last-Modified", response)  # El estado incluye un COUNT.
+
+    def test_cambiar_una_empresa_invalida_los_proyectos(self):
+        url = "/api/curriculum/proyectos/"
+        etag = self.assertNotModified(url)["ETag"]
+        self.empresa.nombre = "Acme S.L."
+        self.empresa.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_cambiar_las_habilidades_de_un_proyecto_invalida_el_detalle(self):
+        url = f"/api/curriculum/proyecto/{self.proyecto.slug}/"
+        etag = self.assertNotModified(url)["ETag"]
+        self.proyecto.habilidades.clear()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_borrar_invalida_el_listado_aunque_no_cambie_ninguna_fecha(self):
+        url = "/api/curriculum/habilidades/"
+        etag = self.assertNotModified(url)["ETag"]
+        Habilidad.objects.create(nombre="Flask", perfil=self.habilidad.perfil).delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.proyecto.habilidades.clear()
+        self.habilidad.delete()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
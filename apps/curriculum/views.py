@@ -3,6 +3,8 @@ from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.utils.translation import gettext as _
+from core.conditional import ConditionalGetMixin
+from core.sparse_fields import SparseFieldsViewMixin
 
 from .models import Perfil, Habilidad, Proyecto, Empresa, Experiencia, Educacion
 from .serializers import (
@@ -10,7 +12,7 @@ from .serializers import (
     ExperienciaSerializer, ProyectoSerializer, PerfilSerializer
 )
 
-class ProyectoListView(ListAPIView):
+class ProyectoListView(ConditionalGetMixin, SparseFieldsViewMixin, ListAPIView):
     """
     Vista para listar todos los proyectos disponibles en la base de datos.
 
@@ -20,10 +22,11 @@ class ProyectoListView(ListAPIView):
     """
     queryset = Proyecto.objects.all().order_by('-title')
     serializer_class = ProyectoSerializer
+    conditional_models = (Proyecto, Proyecto.habilidades.through, Proyecto.empresas.through, Habilidad, Empresa)  # Responde 304 si nada de esto ha cambiado
     permission_classes = [AllowAny]
 
 
-class ProyectoDetailView(RetrieveAPIView):
+class ProyectoDetailView(ConditionalGetMixin, SparseFieldsViewMixin, RetrieveAPIView):
     """
     Vista para obtener un proyecto específico mediante su slug.
 
@@ -33,10 +36,11 @@ class ProyectoDetailView(RetrieveAPIView):
     """
     queryset = Proyecto.objects.all()
     serializer_class = ProyectoSerializer
+    conditional_models = (Proyecto, Proyecto.habilidades.through, Proyecto.empresas.through, Habilidad, Empresa)  # Responde 304 si nada de esto ha cambiado
     lookup_field = "slug"
 
 
-class PerfilDetailView(RetrieveAPIView):
+class PerfilDetailView(ConditionalGetMixin, SparseFieldsViewMixin, RetrieveAPIView):
     """
     Vista para obtener los detalles de un perfil mediante su slug.
 
@@ -46,10 +50,11 @@ class PerfilDetailView(RetrieveAPIView):
     """
     queryset = Perfil.objects.all()
     serializer_class = PerfilSerializer
+    conditional_models = (Perfil, Habilidad, Proyecto, Proyecto.habilidades.through, Proyecto.empresas.through, Empresa, Experiencia, Experiencia.habilidades.through, Educacion)  # Responde 304 si nada de esto ha cambiado
     lookup_field = "slug"
 
 
-class ExperienciaListView(ListAPIView):
+class ExperienciaListView(ConditionalGetMixin, SparseFieldsViewMixin, ListAPIView):
     """
     Vista para listar todas las experiencias registradas en la base de datos.
 
@@ -58,9 +63,10 @@ class ExperienciaListView(ListAPIView):
     """
     queryset = Experiencia.objects.all()
     serializer_class = ExperienciaSerializer
+    conditional_models = (Experiencia, Experiencia.habilidades.through, Empresa, Habilidad)  # Responde 304 si nada de esto ha cambiado
 
 
-class HabilidadListView(ListAPIView):
+class HabilidadListView(ConditionalGetMixin, SparseFieldsViewMixin, ListAPIView):
     """
     Vista para listar todas las habilidades registradas en la base de datos.
 
@@ -69,9 +75,10 @@ class HabilidadListView(ListAPIView):
     """
     queryset = Habilidad.objects.all()
     serializer_class = HabilidadSerializer
+    conditional_models = (Habilidad,)  # Responde 304 si nada de esto ha cambiado
 
 
-class EducacionListView(ListAPIView):
+class EducacionListView(ConditionalGetMixin, SparseFieldsViewMixin, ListAPIView):
     """
     Vista para listar todas las titulaciones registradas en la base de datos.
 
@@ -80,3 +87,4 @@ class EducacionListView(ListAPIView):
     """
     queryset = Educacion.objects.all()
     serializer_class = EducacionSerializer
+    conditional_models = (Educacion,)  # Responde 304 si nada de esto ha cambiado
@@ -0,0 +1,127 @@
+import hashlib
+from collections import namedtuple
+from functools import wraps
+
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+# Campos de "última modificación" que usan los modelos del proyecto.
+TIMESTAMP_FIELDS = ("update_at", "modified_at")
+
+# Resultado de `model_state`. Al llevar un recuento, `conditional_get` sabe que ese
+# estado no se puede reducir a una fecha (ver más abajo).
+TableState = namedtuple("TableState", ["total", "last"])
+
+
+def model_state(model, queryset=None):
+    """
+    Sondeo barato del estado de una tabla: `COUNT(*)` y `MAX()` de su fecha de modificación.
+
+    Si el modelo no tiene fecha (p. ej. las tablas intermedias de los M2M) y su
+    clave es un entero, se usa `MAX(id)`: cualquier alta la incrementa y cualquier
+    baja cambia el recuento. Eso solo vale para tablas cuyas filas no se editan;
+    un modelo con columnas editables necesita `update_at` o `modified_at`.
+
+    Retorna:
+        TableState: `(total, última modificación o id máximo)`.
+    """
+    queryset = model._default_manager.all() if queryset is None else queryset
+    aggregates = {"total": Count("pk")}
+    names = {field.name for field in model._meta.concrete_fields}
+    timestamp = next((name for name in TIMESTAMP_FIELDS if name in names), None)
+    if timestamp:
+        aggregates["last"] = Max(timestamp)
+    elif isinstance(model._meta.pk, IntegerField):
+        aggregates["last"] = Max("pk")
+    state = queryset.order_by().aggregate(**aggregates)
+    return TableState(state["total"], state.get("last"))
+
+
+def flatten(value):
+    """Recorre un estado anidado: cada tupla o lista y después sus elementos."""
+    yield value
+    if isinstance(value, (tuple, list)):
+        for item in value:
+            yield from flatten(item)
+
+
+def state_digest(state, path):
+    """Hash de un estado de `get_conditional_state` y de la URL que lo sirve."""
+    return hashlib.md5(repr((state, path)).encode("utf-8")).hexdigest()
+
+
+def cached_stream(key, chunks, timeout=None):
+    """
+    Sirve `chunks` (un generador de `str`) desde la caché si ya se generó con esta `key`.
+
+    Si no está en caché, devuelve los trozos según se generan y, al terminar,
+    guarda el cuerpo completo. Con una `key` que incluya `state_digest` la
+    entrada deja de usarse en cuanto cambia el contenido, sin invalidar nada.
+    """
+    body = cache.get(key)
+    if body is not None:
+        yield body
+        return
+    parts = []
+    for chunk in chunks:
+        chunk = chunk.encode("utf-8")
+        parts.append(chunk)
+        yield chunk
+    cache.set(key, b"".join(parts), timeout)
+
+
+def conditional_get(get):
+    """
+    Decorador del `get` de una vista con peticiones condicionales (ETag / Last-Modified).
+
+    Antes de ejecutar la vista llama a `view.get_conditional_state(request, ...)`,
+    que debe devolver una tupla barata de calcular que cambie siempre que cambie
+    la respuesta (o `None` para no usar validadores). El ETag es un hash de ese
+    estado y de la URL completa; `Last-Modified` es la fecha más reciente que
+    aparezca en él, salvo si incluye algún `TableState` (un borrado puede no
+    cambiar ninguna fecha). Si la copia del cliente sigue valiendo se responde
+    `304` sin consultar ni serializar nada más.
+
+    El estado queda en `view.conditional_state` por si la vista lo necesita (p. ej.
+    como clave de `cached_stream`).
+    """
+    @wraps(get)
+    def wrapper(self, request, *args, **kwargs):
+        state = self.conditional_state = self.get_conditional_state(request, *args, **kwargs)
+        if state is None:
+            return get(self, request, *args, **kwargs)
+        etag = f'W/"{state_digest(state, request.get_full_path())}"'  # Débil: el cuerpo puede ir comprimido o no.
+        values = list(flatten(state))
+        dates = [value for value in values if hasattr(value, "timestamp")]
+        # Borrar una fila que no es la más reciente no mueve ningún `MAX()`: si el
+        # estado lleva recuentos, solo el ETag detecta el cambio.
+        counted = any(isinstance(value, TableState) for value in values)
+        last_modified = int(max(dates).timestamp()) if dates and not counted else None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = get(self, request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+    return wrapper
+
+
+class ConditionalGetMixin:
+    """
+    Peticiones condicionales para las vistas genéricas de solo lectura.
+
+    El estado es `model_state` de cada modelo de `conditional_models`: el de la
+    vista y los que aparecen anidados en su respuesta.
+    """
+    conditional_models = ()
+
+    def get_conditional_state(self, request, *args, **kwargs):
+        return tuple(model_state(model) for model in self.conditional_models)
+
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
@@ -0,0 +1,65 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import router
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# Filas que se piden a la base de datos en cada viaje del cursor de servidor.
+CHUNK_SIZE = 2000
+
+
+def ndjson_lines(queryset, fields, chunk_size=CHUNK_SIZE):
+    """
+    Recorre `queryset` con un cursor de servidor y genera una línea JSON por fila.
+
+    Solo se leen las columnas de `fields` (con `values_list`, sin instanciar
+    modelos), así que la memoria no depende del número de filas.
+
+    Retorna:
+        generator: Líneas NDJSON (`str`) con las claves de `fields`.
+    """
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+
+class NdjsonExportView(APIView):
+    """
+    Base de las exportaciones masivas en NDJSON (una fila JSON por línea).
+
+    Las subclases definen `export_fields`, `export_filename`, `get_export_queryset()`
+    y, si quieren admitir `?since=<fecha ISO>`, `export_since_field`.
+
+    La respuesta es un `StreamingHttpResponse` que va escribiendo las filas según
+    llegan del cursor. La base de datos se fija al crear la respuesta: el
+    generador se consume después de salir de `ReplicaReadsMiddleware`, y así sigue
+    leyendo de la réplica si la hay.
+    """
+    permission_classes = [IsAdminUser]
+    export_fields = ()
+    export_filename = "export"
+    export_since_field = None
+
+    def get_export_queryset(self, request):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.get_export_queryset(request)
+        raw_since = request.query_params.get("since")
+        if raw_since and self.export_since_field:
+            since = parse_datetime(raw_since)
+            if since is None:
+                return Response({"error": "`since` debe ser una fecha ISO 8601."}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            queryset = queryset.filter(**{f"{self.export_since_field}__gte": since})
+        queryset = queryset.using(router.db_for_read(queryset.model))
+        response = StreamingHttpResponse(
+            ndjson_lines(queryset, list(self.export_fields)), content_type="application/x-ndjson; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{self.export_filename}.ndjson"'
+        return response
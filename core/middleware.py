@@ -0,0 +1,23 @@
+from .routers import use_replica
+
+
+class ReplicaReadsMiddleware:
+    """
+    Marca las peticiones GET/HEAD/OPTIONS a `/api/` para que lean de la réplica.
+
+    El admin y cualquier petición que escriba siguen leyendo de `default`, así
+    que nadie ve datos desfasados justo después de guardarlos. La marca se quita
+    al devolver la respuesta: las respuestas por trozos (`StreamingHttpResponse`)
+    deben fijar la base con `.using(router.db_for_read(...))` antes de devolverse.
+    """
+    safe_methods = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = use_replica.set(request.method in self.safe_methods and request.path.startswith("/api/"))
+        try:
+            return self.get_response(request)
+        finally:
+            use_replica.reset(token)
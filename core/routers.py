@@ -0,0 +1,55 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+
+# Modelos de analítica: escrituras intensivas que van a su propia base de datos.
+ANALYTICS_MODELS = {
+    "blog.postanalytics",
+    "blog.postview",
+    "blog.postuniquevisitors",
+    "blog.posthourlystats",
+    "blog.postdailystats",
+    "blog.analyticswatermark",
+}
+
+# Lo activa `ReplicaReadsMiddleware` durante las peticiones de solo lectura a la API.
+use_replica = ContextVar("use_replica", default=False)
+
+
+def analytics_db():
+    """Alias de la base de datos de analítica (`default` si no hay una configurada)."""
+    return "analytics" if "analytics" in settings.DATABASES else "default"
+
+
+class DatabaseRouter:
+    """
+    Reparte las consultas entre las bases de datos configuradas en `DATABASES`.
+
+    - Los modelos de `ANALYTICS_MODELS` leen y escriben en `analytics`.
+    - Las lecturas del resto de modelos van a `replica` si existe y la petición
+      en curso es de solo lectura a la API (ver `ReplicaReadsMiddleware`).
+    - Todo lo demás usa `default`.
+
+    Los alias `analytics` y `replica` son opcionales: sin ellos todo va a `default`.
+    Con `analytics` hay que migrar ambas bases (`migrate --database=analytics`).
+    """
+    def db_for_read(self, model, **hints):
+        if model._meta.label_lower in ANALYTICS_MODELS:
+            return analytics_db()
+        if use_replica.get() and "replica" in settings.DATABASES:
+            return "replica"
+        return "default"
+
+    def db_for_write(self, model, **hints):
+        if model._meta.label_lower in ANALYTICS_MODELS:
+            return analytics_db()
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Las tablas de analítica guardan el id del post aunque vivan en otra base.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # `default` y `analytics` tienen el mismo esquema (las migraciones antiguas
+        # crean FKs entre tablas de ambos grupos), pero cada tabla solo se usa en una.
+        return db != "replica"
@@ -177,6 +177,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaReadsMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -270,6 +271,30 @@ EMAIL_PORT = env.int('EMAIL_PORT', default=587)
 EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=True)
 EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
+
+# Analíticas del blog: los contadores se acumulan en memoria y se vuelcan en lote.
+ANALYTICS_FLUSH_INTERVAL = env.int('ANALYTICS_FLUSH_INTERVAL', default=10)  # Segundos entre volcados (0 = síncrono)
+ANALYTICS_FLUSH_SIZE = env.int('ANALYTICS_FLUSH_SIZE', default=500)  # Fuerza el volcado al llegar a N entradas
+ANALYTICS_BEACON_MAX_EVENTS = env.int('ANALYTICS_BEACON_MAX_EVENTS', default=200)  # Eventos máximos por petición a /api/blog/events/
+ANALYTICS_VIEW_DEDUPE_WINDOW = env.int('ANALYTICS_VIEW_DEDUPE_WINDOW', default=1800)  # Segundos en los que se ignora la misma IP en el mismo post
+ANALYTICS_VIEW_DEDUPE_MAX_KEYS = env.int('ANALYTICS_VIEW_DEDUPE_MAX_KEYS', default=100000)  # Tope de pares (post, IP) recordados
+ANALYTICS_ROLLUP_LAG = env.int('ANALYTICS_ROLLUP_LAG', default=60)  # Segundos de margen antes de agregar visitas recién guardadas
+ANALYTICS_TRENDING_HALF_LIFE = env.int('ANALYTICS_TRENDING_HALF_LIFE', default=24)  # Horas en las que la puntuación de tendencia se reduce a la mitad
+TRENDING_MAX_LIMIT = env.int('TRENDING_MAX_LIMIT', default=50)  # Máximo de posts en /api/blog/posts/trending/
+ANALYTICS_PARTITION_MONTHS_AHEAD = env.int('ANALYTICS_PARTITION_MONTHS_AHEAD', default=3)  # Particiones futuras de PostView (PostgreSQL)
+ANALYTICS_RETENTION_MONTHS = env.int('ANALYTICS_RETENTION_MONTHS', default=12)  # Meses de PostView que se conservan antes de archivar
+ANALYTICS_ARCHIVE_DIR = env('ANALYTICS_ARCHIVE_DIR', default=os.path.join(BASE_DIR, 'archive'))  # Destino de los NDJSON archivados
+BLOG_CACHE_MAX_AGE = env.int('BLOG_CACHE_MAX_AGE', default=60)  # Cache-Control de las vistas de lectura del blog
+BLOG_SEARCH_MAX_LIMIT = env.int('BLOG_SEARCH_MAX_LIMIT', default=50)  # Máximo de resultados en /api/blog/search/
+POST_LIST_REFRESH_DELAY = env.int('POST_LIST_REFRESH_DELAY', default=10)  # Segundos que se agrupan los guardados antes de refrescar la vista del listado (0 = al confirmar)
+RELATED_POSTS_COUNT = env.int('RELATED_POSTS_COUNT', default=5)  # Posts relacionados precalculados por post
+RELATED_INDEX_TTL = env.int('RELATED_INDEX_TTL', default=3600)  # Segundos antes de reconstruir el índice TF-IDF de posts relacionados en cada proceso
+BLOG_SNAPSHOT_BASE_URL = env('BLOG_SNAPSHOT_BASE_URL', default='http://localhost:8000')  # Origen de la API con el que se pre-renderiza el detalle de los posts
+BLOG_FEED_LIMIT = env.int('BLOG_FEED_LIMIT', default=50)  # Posts en los feeds RSS/Atom
+SITE_URL = env('SITE_URL', default='http://localhost:4321')  # Origen del frontend para los enlaces de sitemap.xml y los feeds
+SUGGEST_MAX_LIMIT = env.int('SUGGEST_MAX_LIMIT', default=10)  # Máximo de sugerencias en /api/search/suggest/
+SUGGEST_INDEX_TTL = env.int('SUGGEST_INDEX_TTL', default=300)  # Segundos antes de reconstruir el índice de autocompletado en cada proceso
+FEED_CACHE_TIMEOUT = env.int('FEED_CACHE_TIMEOUT', default=86400)  # Segundos en caché de sitemap.xml y los feeds (se regeneran antes si cambia el contenido)
 print("DEBUG:  ->", DEBUG)
 if not DEBUG:
     ALLOWED_HOSTS = env.list('ALLOWED_HOSTS_DEPLOY')
@@ -284,4 +309,14 @@ if not DEBUG:
     'default': env.db("DATABASE_URL"),
     }
     print("DATABASES:", DATABASES)
-    DATABASES["default"]["ATOMIC_REQUEST"] = True
\ No newline at end of file
+    DATABASES["default"]["ATOMIC_REQUEST"] = True
+
+# Bases de datos opcionales (ver core/routers.py):
+# - analytics: tablas de métricas del blog, con su propio pool de conexiones.
+# - replica: réplica de solo lectura para las peticiones GET a la API.
+if env('ANALYTICS_DATABASE_URL', default=''):
+    DATABASES['analytics'] = env.db('ANALYTICS_DATABASE_URL')
+if env('REPLICA_DATABASE_URL', default=''):
+    DATABASES['replica'] = env.db('REPLICA_DATABASE_URL')
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+DATABASE_ROUTERS = ['core.routers.DatabaseRouter']
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.blog.models import Post
+from apps.curriculum.models import Habilidad, Proyecto
+from .suggest import suggest_index
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Proyecto)
+@receiver(post_delete, sender=Proyecto)
+@receiver(post_save, sender=Habilidad)
+@receiver(post_delete, sender=Habilidad)
+def invalidate_suggest_index(sender, **kwargs):
+    """El índice de autocompletado se reconstruye entero en la siguiente búsqueda (ver `suggest.py`)."""
+    suggest_index.invalidate()
@@ -0,0 +1,55 @@
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+
+from apps.blog.models import Post
+from apps.curriculum.models import Proyecto
+
+# Tamaño de los lotes al recorrer cada tabla con `.iterator()`.
+CHUNK_SIZE = 500
+
+# `(modelo, queryset, ruta en el frontend, campo de última modificación)` de cada sección.
+# Solo entran los modelos con página propia en el frontend (`frontend/src/pages/`).
+SECTIONS = (
+    (Post, lambda: Post.postobjects.order_by("-created_at"), "/blog/{slug}/", "update_at"),
+    (Proyecto, lambda: Proyecto.objects.order_by("-created_at"), "/proyectos/{slug}/", "modified_at"),
+)
+
+
+def sitemap_models():
+    """Modelos cuyo estado (ver `core/conditional.py`) invalida el sitemap."""
+    return [model for model, *_ in SECTIONS]
+
+
+def section_urls(queryset, path, lastmod):
+    """
+    Recorre una sección leyendo solo las columnas que aparecen en el sitemap.
+
+    Los modelos con SEO (`Proyecto`) usan su `url_canonical` si la tienen.
+
+    Retorna:
+        generator: Tuplas `(loc, lastmod)`.
+    """
+    has_canonical = any(field.name == "url_canonical" for field in queryset.model._meta.fields)
+    fields = ["slug", lastmod] + (["url_canonical"] if has_canonical else [])
+    for obj in queryset.only(*fields).iterator(chunk_size=CHUNK_SIZE):
+        loc = (has_canonical and obj.url_canonical) or settings.SITE_URL.rstrip("/") + path.format(slug=obj.slug)
+        yield loc, getattr(obj, lastmod)
+
+
+def sitemap_chunks(using=None):
+    """
+    `sitemap.xml` de posts publicados y proyectos, trozo a trozo, leído de la base `using`.
+
+    Retorna:
+        generator: Fragmentos de XML (`str`), uno por URL.
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for _, queryset, path, lastmod in SECTIONS:
+        for loc, modified in section_urls(queryset().using(using), path, lastmod):
+            entry = f"<url><loc>{escape(loc)}</loc>"
+            if modified:
+                entry += f"<lastmod>{modified.date().isoformat()}</lastmod>"
+            yield entry + "</url>\n"
+    yield "</urlset>\n"
@@ -0,0 +1,127 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def parse_sparse_params(request):
+    """
+    Lee `?fields=a,b` y `?expand=x,y` de la petición.
+
+    Retorna:
+        tuple: `(fields, expand)`; `fields` es `None` si no se ha pedido ninguno.
+    """
+    if request is None:
+        return None, set()
+    fields = request.query_params.get("fields")
+    expand = request.query_params.get("expand")
+    fields = {name.strip() for name in fields.split(",") if name.strip()} if fields else None
+    expand = {name.strip() for name in expand.split(",") if name.strip()} if expand else set()
+    return fields, expand
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Permite al cliente elegir los campos de la respuesta.
+
+    - `?fields=a,b` devuelve solo esos campos.
+    - `?expand=x` añade relaciones que por defecto no se incluyen, declaradas en
+      `Meta.expandable_fields` como `{"x": lambda: OtroSerializer(many=True)}`
+      (la `lambda` permite referirse a serializadores definidos más abajo).
+    - Los campos de `Meta.optional_fields` (p. ej. columnas de texto largas) no
+      salen por defecto: solo cuando se nombran en `?fields=`.
+
+    Solo afecta al serializador raíz; los anidados se muestran completos.
+    """
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_sparse_root():
+            return fields
+        requested, expand = parse_sparse_params(self.context.get("request"))
+        for name, build in getattr(self.Meta, "expandable_fields", {}).items():
+            if name in expand:
+                fields[name] = build()
+        if requested is not None:
+            for name in list(fields):
+                if name not in requested and name not in expand:
+                    fields.pop(name)
+        else:
+            for name in getattr(self.Meta, "optional_fields", ()):
+                fields.pop(name, None)
+        return fields
+
+    def _is_sparse_root(self):
+        parent = getattr(self, "parent", None)
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+
+class SparseFieldsViewMixin:
+    """
+    Ajusta la consulta a los campos que va a devolver el serializador.
+
+    - Con `?fields=` carga solo las columnas necesarias (`.only()`); sin él, no
+      carga las columnas de `Meta.optional_fields` que no se devuelven (`.defer()`).
+    - Aplica `select_related`/`prefetch_related` solo a las relaciones anidadas
+      que aparecen en la respuesta (las de siempre y las pedidas con `?expand=`).
+
+    En las vistas genéricas basta con heredar de este mixin; en las `APIView`
+    se llama a `sparse_queryset` a mano. `sparse_required_fields` lista columnas
+    que la vista necesita aunque no se devuelvan (p. ej. las del cursor de paginación).
+    """
+    sparse_required_fields = ()
+
+    def get_queryset(self):
+        return self.sparse_queryset(super().get_queryset(), self.get_serializer_class())
+
+    def sparse_queryset(self, queryset, serializer_class):
+        fields = serializer_class(context={"request": self.request}).fields
+        model = queryset.model
+        requested, _ = parse_sparse_params(self.request)
+        only = {model._meta.pk.name, *self.sparse_required_fields}
+        restrict = requested is not None
+        for field in fields.values():
+            if isinstance(field, serializers.SerializerMethodField):
+                continue  # Los campos calculados deben usar solo la pk o atributos ya anotados.
+            try:
+                model_field = model._meta.get_field(field.source.split(".")[0])
+            except FieldDoesNotExist:
+                restrict = False  # Anotaciones o propiedades: no sabemos qué columnas necesitan.
+                continue
+            if model_field.concrete:
+                only.add(model_field.name)
+        select, prefetch = related_paths(fields, model)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if restrict:
+            queryset = queryset.only(*only)
+        else:
+            hidden = [name for name in getattr(serializer_class.Meta, "optional_fields", ()) if name not in fields]
+            if hidden:
+                queryset = queryset.defer(*hidden)
+        return queryset
+
+
+def related_paths(fields, model, prefix="", prefetching=False):
+    """
+    Recorre los serializadores anidados y devuelve las rutas `(select_related, prefetch_related)`.
+
+    Las relaciones a muchos, y todo lo que cuelga de ellas, van en `prefetch_related`.
+    """
+    select, prefetch = [], []
+    for field in fields.values():
+        if not isinstance(field, serializers.BaseSerializer):
+            continue
+        try:
+            model_field = model._meta.get_field(field.source.split(".")[0])
+        except FieldDoesNotExist:
+            continue
+        if not model_field.is_relation:
+            continue
+        path = prefix + model_field.name
+        many = model_field.many_to_many or model_field.one_to_many
+        (prefetch if many or prefetching else select).append(path)
+        child = field.child if isinstance(field, serializers.ListSerializer) else field
+        nested_select, nested_prefetch = related_paths(child.fields, model_field.related_model, path + "__", prefetching or many)
+        select += nested_select
+        prefetch += nested_prefetch
+    return select, prefetch
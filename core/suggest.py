@@ -0,0 +1,123 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from unidecode import unidecode
+
+from apps.blog.models import Post
+from apps.curriculum.models import Habilidad, Proyecto
+
+NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text):
+    """Minúsculas, sin acentos (con `unidecode`, como `generate_slug`) y solo letras, números y espacios."""
+    return " ".join(NON_ALNUM.sub(" ", unidecode(text or "").lower()).split())
+
+
+def suggestion_sources():
+    """
+    Lo que se puede autocompletar.
+
+    Retorna:
+        generator: Tuplas `(tipo, texto, slug)`.
+    """
+    for title, slug in Post.postobjects.order_by().values_list("title", "slug").iterator():
+        yield "post", title, slug
+    for nombre, title, slug in Proyecto.objects.order_by().values_list("nombre", "title", "slug").iterator():
+        yield "proyecto", title or nombre, slug
+    for nombre, slug in Habilidad.objects.order_by().values_list("nombre", "slug").iterator():
+        yield "habilidad", nombre, slug
+
+
+class PrefixIndex:
+    """
+    Índice de prefijos sobre arrays ordenados.
+
+    Guarda dos listas ordenadas de claves normalizadas: los textos completos y
+    sus sufijos a partir de cada palabra (para que «rest» encuentre «Django REST
+    Framework»). Buscar un prefijo es un `bisect` y recorrer las claves contiguas
+    que empiezan por él; primero los textos que empiezan por el prefijo y luego
+    los que lo tienen en otra palabra, cada grupo en orden alfabético.
+    """
+    def __init__(self, sources):
+        self.entries = []
+        names, words = [], []
+        for kind, text, slug in sources:
+            key = normalize(text)
+            if not key:
+                continue
+            ref = len(self.entries)
+            self.entries.append({"type": kind, "title": text, "slug": slug})
+            names.append((key, ref))
+            words.extend((key[match.end():], ref) for match in re.finditer(" ", key))
+        names.sort()
+        words.sort()
+        self.name_keys, self.name_refs = [key for key, _ in names], [ref for _, ref in names]
+        self.word_keys, self.word_refs = [key for key, _ in words], [ref for _, ref in words]
+
+    def search(self, text, limit):
+        """
+        Entradas cuyo texto (o alguna de sus palabras) empieza por `text`.
+
+        Retorna:
+            list: Diccionarios `{"type", "title", "slug"}`, como mucho `limit`.
+        """
+        prefix = normalize(text)
+        if not prefix:
+            return []
+        seen, results = set(), []
+        for keys, refs in ((self.name_keys, self.name_refs), (self.word_keys, self.word_refs)):
+            position = bisect_left(keys, prefix)
+            while position < len(keys) and keys[position].startswith(prefix) and len(results) < limit:
+                ref = refs[position]
+                if ref not in seen:
+                    seen.add(ref)
+                    results.append(self.entries[ref])
+                position += 1
+        return results
+
+
+class SuggestIndex:
+    """
+    Índice de autocompletado del proceso.
+
+    Se construye de una vez en la primera búsqueda y se reconstruye entero en la
+    siguiente tras `invalidate()` (lo llaman las señales al guardar o borrar
+    posts, proyectos y habilidades) o al pasar `SUGGEST_INDEX_TTL` segundos, que
+    es lo que tarda en enterarse el resto de procesos. Las búsquedas no tocan la
+    base de datos.
+    """
+    def __init__(self):
+        self._index = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._built_generation = -1
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        self._generation += 1
+
+    def _fresh(self):
+        return (
+            self._index is not None and self._built_generation == self._generation
+            and time.monotonic() - self._built_at < settings.SUGGEST_INDEX_TTL
+        )
+
+    def get(self):
+        if self._fresh():
+            return self._index
+        with self._lock:
+            if not self._fresh():  # Puede que otro hilo lo haya reconstruido mientras esperábamos.
+                generation = self._generation  # Si cambia durante la reconstrucción, se repite en la siguiente.
+                self._index = PrefixIndex(suggestion_sources())
+                self._built_generation, self._built_at = generation, time.monotonic()
+            return self._index
+
+    def search(self, text, limit):
+        return self.get().search(text, limit)
+
+
+suggest_index = SuggestIndex()
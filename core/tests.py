@@ -0,0 +1,67 @@
+from django.test import SimpleTestCase, TestCase
+
+from apps.blog.models import Category, Post
+from apps.curriculum.models import Habilidad, Perfil, Proyecto
+
+from .suggest import PrefixIndex, normalize
+
+
+class PrefixIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = PrefixIndex([
+            ("habilidad", "Django REST Framework", "drf"),
+            ("post", "Django en producción", "django-produccion"),
+            ("proyecto", "Educación online", "educacion"),
+            ("habilidad", "", "vacia"),
+        ])
+
+    def slugs(self, text, limit=10):
+        return [entry["slug"] for entry in self.index.search(text, limit)]
+
+    def test_normaliza_mayusculas_y_acentos(self):
+        self.assertEqual(normalize("  Educación   ONLINE! "), "educacion online")
+        self.assertEqual(self.slugs("EDUCACIÓN"), ["educacion"])
+
+    def test_primero_el_principio_y_luego_otras_palabras(self):
+        self.assertEqual(self.slugs("django"), ["django-produccion", "drf"])
+        self.assertEqual(self.slugs("rest"), ["drf"])
+        self.assertEqual(self.slugs("pro"), ["django-produccion"])
+
+    def test_limite_y_texto_vacio(self):
+        self.assertEqual(self.slugs("d", limit=1), ["django-produccion"])
+        self.assertEqual(self.slugs("  "), [])
+
+
+class SuggestViewTests(TestCase):
+    url = "/api/search/suggest/"
+
+    def setUp(self):
+        category = Category.objects.create(name="Python")
+        perfil = Perfil.objects.create(dni="00000000T", nombre="Ana", apellido_1="Pérez", email="ana@example.com")
+        Habilidad.objects.create(nombre="Django", perfil=perfil)
+        Proyecto.objects.create(nombre="Portfolio Django", descripcion="Web personal", perfil=perfil)
+        for title, status in (("Django en producción", "published"), ("Django en borrador", "draft")):
+            Post.objects.create(
+                title=title, description=title, content="<p>texto</p>", thumbnail="blog/thumbnail.png",
+                keywords="django", category=category, status=status,
+            )
+
+    def results(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [(entry["type"], entry["title"]) for entry in response.json()["results"]]
+
+    def test_sugiere_posts_proyectos_y_habilidades(self):
+        self.assertEqual(self.results(q="dja"), [
+            ("habilidad", "Django"), ("post", "Django en producción"), ("proyecto", "Portfolio Django"),
+        ])
+        self.assertEqual(self.results(q="portf"), [("proyecto", "Portfolio Django")])
+
+    def test_se_actualiza_al_guardar(self):
+        self.assertEqual(self.results(q="flask"), [])
+        Habilidad.objects.create(nombre="Flask", perfil=Perfil.objects.get())
+        self.assertEqual(self.results(q="flask"), [("habilidad", "Flask")])
+
+    def test_limit(self):
+        self.assertEqual(len(self.results(q="django", limit=1)), 1)
+        self.assertEqual(self.client.get(self.url, {"q": "django", "limit": "uno"}).status_code, 400)
@@ -3,7 +3,7 @@ from django.urls import path, re_path, include
 from django.views.generic import TemplateView
 from django.conf.urls.static import static
 from django.conf import settings
-from .views import ContactoAPIView 
+from .views import ContactoAPIView, MensajeContactoExportView, SitemapView, SuggestView
 
 
 urlpatterns = [
@@ -11,6 +11,9 @@ urlpatterns = [
     path("api/curriculum/", include('apps.curriculum.urls')),
     path('admin/', admin.site.urls),
     path('api/contacto/', ContactoAPIView.as_view(), name='api-contacto'),
+    path('api/contacto/export/', MensajeContactoExportView.as_view(), name='api-contacto-export'),
+    path('api/search/suggest/', SuggestView.as_view(), name='search-suggest'),
+    path('sitemap.xml', SitemapView.as_view(), name='sitemap'),
     path("ckeditor5/", include('django_ckeditor_5.urls')),
 ]+static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 urlpatterns = urlpatterns + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
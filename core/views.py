@@ -3,11 +3,22 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 from .serializers import MensajeContactoSerializer
+from .models import MensajeContacto
+from .exports import NdjsonExportView
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.exceptions import ValidationError
 from django.core.mail import send_mail, BadHeaderError
 from django.conf import settings
 from django.core.mail import EmailMessage
+from django.db import router
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.cache import cache_control
+from .conditional import cached_stream, conditional_get, model_state, state_digest
+from .sitemap import sitemap_chunks, sitemap_models
+from .suggest import suggest_index
+from apps.blog.models import Post
 
 class ContactoAPIView(APIView):
     permission_classes = [AllowAny]
@@ -56,3 +67,66 @@ class ContactoAPIView(APIView):
             print("ERROR ENVIANDO CORREO:", str(e))
             return Response({"error": f"Error al enviar el correo: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         return Response({"success": "Mensaje enviado correctamente."}, status=status.HTTP_200_OK)
+
+
+class SitemapView(View):
+    """
+    `sitemap.xml` con los posts publicados y los proyectos.
+
+    Se genera por trozos recorriendo cada tabla con `.only()` e `.iterator()`
+    (ver `core/sitemap.py`), así que la memoria no crece con el número de URLs, y
+    se guarda en caché hasta que cambia alguno de esos modelos.
+    """
+    def get_conditional_state(self, request, *args, **kwargs):
+        return tuple(model_state(model) for model in sitemap_models())
+
+    @method_decorator(cache_control(public=True, max_age=settings.BLOG_CACHE_MAX_AGE))
+    @conditional_get
+    def get(self, request, *args, **kwargs):
+        key = f"sitemap:{state_digest(self.conditional_state, request.path)}"
+        # El cuerpo se genera al enviarlo, cuando `ReplicaReadsMiddleware` ya ha
+        # terminado: la base de datos se elige ahora.
+        chunks = sitemap_chunks(using=router.db_for_read(Post))
+        return StreamingHttpResponse(
+            cached_stream(key, chunks, settings.FEED_CACHE_TIMEOUT), content_type="application/xml; charset=utf-8",
+        )
+
+
+class SuggestView(APIView):
+    """
+    Autocompletado de posts, proyectos y habilidades.
+
+    Uso:
+        - GET `/api/search/suggest/?q=dja&limit=8` devuelve
+          `{"results": [{"type": "post", "title": "...", "slug": "..."}, ...]}`.
+
+    Responde desde el índice en memoria de `core/suggest.py`, sin consultar la
+    base de datos; las mayúsculas y los acentos no importan.
+    """
+    permission_classes = [AllowAny]
+
+    @method_decorator(cache_control(public=True, max_age=settings.BLOG_CACHE_MAX_AGE))
+    def get(self, request, format=None):
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", settings.SUGGEST_MAX_LIMIT)), settings.SUGGEST_MAX_LIMIT))
+        except ValueError:
+            return Response({"error": "`limit` debe ser un número."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"results": suggest_index.search(request.query_params.get("q", ""), limit)})
+
+
+class MensajeContactoExportView(NdjsonExportView):
+    """
+    Exporta los mensajes de contacto en NDJSON.
+
+    Uso:
+        - GET `/api/contacto/export/` (solo administradores); `?since=` filtra por `creado_en`.
+    """
+    export_fields = (
+        "id", "nombre", "email", "asunto", "mensaje", "telefono",
+        "ip_remitente", "user_agent", "leido", "creado_en",
+    )
+    export_filename = "mensajes_contacto"
+    export_since_field = "creado_en"
+
+    def get_export_queryset(self, request):
+        return MensajeContacto.objects.order_by("creado_en")
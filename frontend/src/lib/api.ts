@@ -50,8 +50,16 @@ export async function getEducation() {
 }
 
 // Blog API endpoints
+// The post list is cursor-paginated: follow `next` until every page is loaded.
 export async function getBlogPosts() {
-  return fetchAPI<BlogPostResponse[]>("/api/blog/posts/")
+  const posts: BlogPostResponse[] = []
+  let endpoint: string | null = "/api/blog/posts/?page_size=100"
+  while (endpoint) {
+    const page: PaginatedResponse<BlogPostResponse> = await fetchAPI(endpoint)
+    posts.push(...page.results)
+    endpoint = page.next ? page.next.replace(/^https?:\/\/[^/]+/, "") : null
+  }
+  return posts
 }
 
 export async function getBlogPostBySlug(slug: string) {
@@ -62,7 +70,23 @@ export async function getBlogPostHeadings(slug: string) {
   return fetchAPI<HeadingResponse[]>(`/api/blog/post/${slug}/headings/`)
 }
 
+// Blog analytics beacon: sends impressions, clicks and views in a single request.
+// Strings are sent as text/plain, so the browser skips the CORS preflight.
+export function sendBlogEvents(events: { impressions?: string[]; clicks?: string[]; views?: string[] }) {
+  const url = `${API_BASE_URL}/api/blog/events/`
+  const body = JSON.stringify(events)
+  if (typeof navigator !== "undefined" && navigator.sendBeacon?.(url, body)) {
+    return
+  }
+  fetch(url, { method: "POST", body, keepalive: true, headers: { "Content-Type": "text/plain" } }).catch(() => {})
+}
+
 // API Response Types
+export interface PaginatedResponse<T> {
+  next: string | null
+  results: T[]
+}
+
 export interface ProjectResponse {
   id: number
   title: string
@@ -130,6 +154,7 @@ export interface BlogPostResponse {
   published_date: string
   reading_time: number
   tags: string[]
+  headings?: HeadingResponse[]
   author: {
     name: string
     title: string
@@ -137,10 +162,13 @@ export interface BlogPostResponse {
   }
 }
 
+// Table of contents entry: `slug` is the heading's `id` attribute in the post HTML.
 export interface HeadingResponse {
   id: string
-  text: string
+  title: string
+  slug: string
   level: number
+  order: number
 }
 
 // App Types